@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+"""
+Start-up benchmark for zcli.py.
+
+Every top-level group is invoked against a local stub server (see
+stub_server.py) with a private HOME holding a benchmark zcli.json:
+
+    - cold: bytecode cache empty (fresh PYTHONPYCACHEPREFIX)
+    - warm: bytecode cache populated, median and minimum of --runs calls
+    - imports: -X importtime of a warm call, cumulative time per module
+
+The results are compared with budget.json, the exit code is 1 if any budget
+is exceeded.
+"""
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import click
+from click_help_colors import HelpColorsCommand
+
+import stub_server
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ZCLI = os.path.join(os.path.dirname(BENCH_DIR), "zcli.py")
+
+# One representative command per top-level group
+COMMANDS: dict = {
+    "help": ["--help"],
+    "info": ["info"],
+    "jobs": ["jobs", "list"],
+    "datasets": ["datasets", "list", "-dl", "IBMUSER"],
+    "files": ["files", "list", "-pn", "/u/ibmuser"],
+    "software": ["software", "instances", "list"],
+    "console": ["console", "command", "-c", "D T"],
+    "topology": ["topology", "groups"],
+    "sysvar": ["sysvar", "get"],
+}
+
+# Modules whose cumulative import time is reported for every command
+TRACKED_MODULES: tuple = (
+    "commands.cmd_config",
+    "click",
+    "click_help_colors",
+    "requests",
+    "zosapi.client",
+    "textual",
+    "rich",
+    "aiohttp",
+)
+
+
+def write_config(home: str, port: int) -> None:
+    """
+    Write a zcli.json with a single profile pointing at the stub server.
+
+    Args:
+        home (str): The HOME directory used by the benchmark runs.
+        port (int): The port of the stub server.
+    """
+    config_dir = os.path.join(home, ".config", "zcli")
+    os.makedirs(config_dir, exist_ok=True)
+    config = {
+        "profiles": {
+            "bench": {
+                "type": "zosmf",
+                "properties": {
+                    "protocol": "http",
+                    "host": "127.0.0.1",
+                    "port": port,
+                    "user": "IBMUSER",
+                    "password": "SYS1",
+                },
+            }
+        },
+        "defaults": [
+            {
+                "profiles": [{"zosmf": "bench"}],
+                "zcli": {"properties": {"cert_path": ""}},
+            }
+        ],
+    }
+    with open(os.path.join(config_dir, "zcli.json"), "w") as f:
+        json.dump(config, f, indent=2)
+
+
+def run(argv: list, env: dict, importtime: bool = False) -> tuple:
+    """
+    Run zcli.py once.
+
+    Args:
+        argv (list).......: The zcli arguments.
+        env (dict)........: The environment of the run.
+        importtime (bool).: Run with -X importtime (default False).
+
+    Returns:
+        float: Wall time in milliseconds.
+        str: stderr of the run.
+    """
+    command = [sys.executable]
+    if importtime:
+        command = command + ["-X", "importtime"]
+    command = command + [ZCLI] + argv
+
+    start = time.perf_counter()
+    result = subprocess.run(command, env=env, capture_output=True, text=True)
+    wall = (time.perf_counter() - start) * 1000
+
+    if result.returncode != 0:
+        raise click.ClickException(
+            f"BENCH-001E zcli {' '.join(argv)} ended with rc {result.returncode}: {result.stderr.strip()}"
+        )
+    return wall, result.stderr
+
+
+def parse_importtime(stderr: str) -> dict:
+    """
+    Sum up -X importtime output.
+
+    Args:
+        stderr (str): stderr of a run with -X importtime.
+
+    Returns:
+        dict: Cumulative milliseconds per tracked module and "total" for all
+              top-level imports. Modules that were not imported are missing.
+    """
+    imports: dict = {"total": 0.0}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            cumulative_ms = int(cumulative) / 1000
+        except ValueError:
+            continue
+        module = name.strip()
+        if not name[1:].startswith(" "):
+            imports["total"] = imports["total"] + cumulative_ms
+        if module in TRACKED_MODULES and module not in imports:
+            imports[module] = cumulative_ms
+    return imports
+
+
+def check_budget(results: dict, budget: dict) -> list:
+    """
+    Args:
+        results (dict): Results per command.
+        budget (dict).: The content of budget.json.
+
+    Returns:
+        list: One message per exceeded budget.
+    """
+    violations: list = []
+    for name, result in results.items():
+        for key in ("cold_ms", "warm_median_ms"):
+            limit = budget[key].get(name, budget[key]["default"])
+            if result[key] > limit:
+                violations.append(f"{name}: {key} {result[key]:.0f} > {limit}")
+        for module, limit in budget["import_ms"].items():
+            if module in result["imports"] and result["imports"][module] > limit:
+                violations.append(
+                    f"{name}: import {module} {result['imports'][module]:.1f} ms > {limit}"
+                )
+    return violations
+
+
+def report(results: dict, runs: int) -> str:
+    """
+    Args:
+        results (dict): Results per command.
+        runs (int)....: Number of warm runs per command.
+
+    Returns:
+        str: The results as markdown.
+    """
+    lines: list = [
+        "# zcli start-up benchmark",
+        "",
+        f"Python {platform.python_version()} on {platform.system()} {platform.machine()}, "
+        f"{runs} warm runs per command, times in ms.",
+        "",
+        "| command | cold | warm median | warm min | imports total | "
+        + " | ".join(TRACKED_MODULES)
+        + " |",
+        "| --- " * (5 + len(TRACKED_MODULES)) + "|",
+    ]
+    for name, result in results.items():
+        imports = result["imports"]
+        cells = [f"{imports[m]:.1f}" if m in imports else "-" for m in TRACKED_MODULES]
+        lines.append(
+            f"| {name} | {result['cold_ms']:.0f} | {result['warm_median_ms']:.0f} | "
+            f"{result['warm_min_ms']:.0f} | {imports['total']:.1f} | "
+            + " | ".join(cells)
+            + " |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+@click.command(cls=HelpColorsCommand, help_options_color="blue")
+@click.option("--runs", "-r", default=10, show_default=True, help="Warm runs per command.")
+@click.option(
+    "--budget",
+    "-b",
+    type=click.Path(exists=True, dir_okay=False),
+    default=os.path.join(BENCH_DIR, "budget.json"),
+    show_default=True,
+    help="Budget file.",
+)
+@click.option(
+    "--report-file",
+    "-o",
+    type=click.Path(dir_okay=False),
+    default="",
+    help="Write the markdown report to this file instead of stdout.",
+)
+@click.option("--json-file", "-j", type=click.Path(dir_okay=False), default="", help="Write the raw results as JSON.")
+@click.argument("groups", nargs=-1)
+def main(runs: int, budget: str, report_file: str, json_file: str, groups: tuple):
+    """
+    Measure cold and warm start-up of zcli.py per command group.
+
+    \b
+    GROUPS limits the run to some of: help info jobs datasets files software
+    console topology sysvar (default all).
+    """
+    with open(budget) as f:
+        budget_data = json.load(f)
+
+    selected = {name: COMMANDS[name] for name in (groups or COMMANDS)}
+    server = stub_server.start()
+
+    results: dict = {}
+    with tempfile.TemporaryDirectory() as home, tempfile.TemporaryDirectory() as pycache:
+        write_config(home, server.server_address[1])
+        env = dict(os.environ, HOME=home, PYTHONPYCACHEPREFIX=pycache)
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+        for name, argv in selected.items():
+            with tempfile.TemporaryDirectory() as cold_cache:
+                cold_ms, _ = run(argv, dict(env, PYTHONPYCACHEPREFIX=cold_cache))
+
+            run(argv, env)
+            warm = [run(argv, env)[0] for _ in range(runs)]
+            _, stderr = run(argv, env, importtime=True)
+
+            results[name] = {
+                "argv": argv,
+                "cold_ms": cold_ms,
+                "warm_median_ms": statistics.median(warm),
+                "warm_min_ms": min(warm),
+                "imports": parse_importtime(stderr),
+            }
+            click.echo(f"BENCH-000I {name:<10} cold {cold_ms:6.0f} ms  warm {statistics.median(warm):6.0f} ms", err=True)
+
+    server.shutdown()
+
+    text = report(results, runs)
+    if report_file != "":
+        with open(report_file, "w") as f:
+            f.write(text)
+    else:
+        click.echo(text)
+
+    if json_file != "":
+        with open(json_file, "w") as f:
+            json.dump(results, f, indent=2)
+
+    violations = check_budget(results, budget_data)
+    for violation in violations:
+        click.echo(f"BENCH-002E Budget exceeded, {violation}", err=True)
+    sys.exit(1 if violations else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""
+A minimal local stand-in for z/OSMF, used by the start-up benchmarks.
+
+It answers the REST calls of the benchmarked commands with small canned
+responses, so the measured time is zcli's own start-up and not the host.
+"""
+import json
+import sys
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+JOB = {
+    "jobname": "BENCH",
+    "jobid": "JOB00001",
+    "owner": "IBMUSER",
+    "status": "OUTPUT",
+    "retcode": "CC 0000",
+}
+
+ROUTES: list = [
+    ("POST", "/zosmf/services/authenticate", 200, b""),
+    ("GET", "/zosmf/info", 200, {"zosmf_version": "29", "zos_version": "04.29.00"}),
+    ("GET", "/zosmf/restjobs/jobs", 200, [JOB]),
+    ("GET", "/zosmf/restfiles/ds", 200, {"items": [], "returnedRows": 0}),
+    ("GET", "/zosmf/restfiles/fs", 200, {"items": [], "returnedRows": 0}),
+    ("GET", "/zosmf/swmgmt/swi", 200, {"swilist": []}),
+    ("PUT", "/zosmf/restconsoles/consoles", 200, {"cmd-response": "IEE136I"}),
+    ("GET", "/zosmf/resttopology", 200, {"groups": []}),
+    ("GET", "/zosmf/variables", 200, {"system-variable-list": []}),
+]
+
+
+class HANDLER(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def answer(self, method: str):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
+        status, body = 404, {"message": f"{method} {self.path} not stubbed"}
+        for route_method, prefix, route_status, route_body in ROUTES:
+            if method == route_method and self.path.startswith(prefix):
+                status, body = route_status, route_body
+                break
+
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.path.startswith("/zosmf/services/authenticate"):
+            self.send_header("Set-Cookie", "LtpaToken2=bench; Path=/; HttpOnly")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.answer("GET")
+
+    def do_PUT(self):
+        self.answer("PUT")
+
+    def do_POST(self):
+        self.answer("POST")
+
+    def do_DELETE(self):
+        self.answer("DELETE")
+
+
+def start(port: int = 0) -> ThreadingHTTPServer:
+    """
+    Start the stub server in a daemon thread.
+
+    Args:
+        port (int): Port to listen on, 0 picks a free one (default 0).
+
+    Returns:
+        ThreadingHTTPServer: The running server, server_address holds the port.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), HANDLER)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    ThreadingHTTPServer(
+        ("127.0.0.1", int(sys.argv[1]) if len(sys.argv) > 1 else 18443), HANDLER
+    ).serve_forever()
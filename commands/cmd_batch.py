@@ -0,0 +1,137 @@
+import json
+import shlex
+import sys
+import click
+from click_help_colors import HelpColorsCommand
+
+from commands.cmd_socket import matches
+from commands.cmd_utils import invoke_commands
+
+# Command lines that cannot run as a line of a batch file, see cmd_socket.matches()
+NOT_IN_BATCH: tuple = ((("batch",), ()), (("daemon",), ()), ((), ("--tui",)))
+
+
+def read_batch_file(batch_file) -> list:
+    """
+    Split a batch file into command lines. Empty lines and lines starting with
+    # are skipped, a leading "zcli" is dropped.
+
+    Args:
+        batch_file (file): The opened batch file.
+
+    Returns:
+        list: (line number, line, argument list or None) per command line, the
+              argument list is None if the line could not be parsed.
+    """
+    lines: list = []
+    for number, line in enumerate(batch_file, start=1):
+        line = line.strip()
+        if line == "" or line.startswith("#"):
+            continue
+        try:
+            argv = shlex.split(line)
+        except ValueError:
+            argv = None
+        if argv and argv[0] in ("zcli", "zcli.py"):
+            argv = argv[1:]
+        lines.append((number, line, argv))
+    return lines
+
+
+def write_result(line: tuple, result: tuple) -> None:
+    """
+    Write the result of a batch line as one line of JSON to stdout.
+
+    Args:
+        line (tuple)..: Line number, line and argument list (see read_batch_file).
+        result (tuple): Return code, stdout and stderr of the line.
+    """
+    rc, stdout, stderr = result
+    record = {"line": line[0], "command": line[1], "rc": rc, "stdout": stdout, "stderr": stderr}
+    sys.stdout.write(f"{json.dumps(record)}\n")
+    sys.stdout.flush()
+
+
+# ------------------------------------------------------------------------------#
+# Define the batch command                                                     #
+# ------------------------------------------------------------------------------#
+@click.command(name="batch", cls=HelpColorsCommand, help_options_color="blue")
+@click.argument("batch_file", type=click.File("r"))
+@click.option(
+    "--parallel",
+    "-p",
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help="Number of lines run at the same time, keep it at or below pool_maxsize of the profile.",
+)
+@click.option(
+    "--ordered / --unordered",
+    default=True,
+    show_default=True,
+    help="Write results in the order of the batch file (--ordered) or as they end (--unordered).",
+)
+@click.pass_context
+def batch(ctx: click.Context, batch_file, parallel: int, ordered: bool):
+    """
+    Use this command to run a file of zcli command lines.
+
+    \b
+    Every line holds one zcli command, for example
+        jobs list --owner IBMUSER
+        console command -c "D IPLINFO"
+    Lines run concurrently in this process and share the connection pool and
+    session token of each profile. The profile, --verify and --debug of this
+    call apply to every line unless the line sets its own.
+
+    \b
+    The result of each line is written as one line of JSON:
+        {"line": 1, "command": "...", "rc": 0, "stdout": "...", "stderr": "..."}
+    The return code is the highest return code of all lines.
+    """
+    logging = ctx.obj["LOGGING"]
+
+    lines = read_batch_file(batch_file)
+    logging.debug(f"CMD-BATCH-000D batch() read {len(lines)} lines from {batch_file.name}")
+
+    options = [
+        "--profile-name",
+        ctx.obj["PROFILE_NAME"],
+        "--verify" if ctx.obj["VERIFY"] else "--no-verify",
+        "--debug" if ctx.obj["DEBUG"] else "--no-debug",
+    ]
+
+    results: dict = {}
+    argvs: list = []
+    for index, (number, line, argv) in enumerate(lines):
+        if argv is None:
+            results[index] = (8, "", f"CMD-BATCH-001E Unable to parse line {number}\n")
+        elif argv == [] or matches(argv, NOT_IN_BATCH):
+            results[index] = (8, "", f"CMD-BATCH-002E Line {number} can not run in a batch\n")
+        else:
+            argvs.append((index, options + argv))
+
+    rc = max([result[0] for result in results.values()], default=0)
+    written = 0
+    if not ordered:
+        for index in sorted(results):
+            write_result(lines[index], results.pop(index))
+
+    for position, result in invoke_commands(
+        ctx.find_root().command, [argv for _, argv in argvs], parallel, ordered=ordered
+    ):
+        index = argvs[position][0]
+        rc = max(rc, result[0])
+        if not ordered:
+            write_result(lines[index], result)
+            continue
+        # A line is written once all lines before it are written
+        results[index] = result
+        while written in results:
+            write_result(lines[written], results.pop(written))
+            written = written + 1
+
+    for index in sorted(results):
+        write_result(lines[index], results.pop(index))
+
+    ctx.exit(rc)
@@ -31,6 +31,29 @@ if CONFIG:
     if JOBS_CACHE_DIR == "":
         JOBS_CACHE_DIR = ".local/zcli/.cache/jobs"
 
+    JOBS_CACHE_SIZE: str = str(get_zcli_property(config=CONFIG, prop_name="jobs_cache_size"))
+    if JOBS_CACHE_SIZE == "":
+        JOBS_CACHE_SIZE = "200"
+
+    NOTIFICATION_LISTEN: str = get_zcli_property(config=CONFIG, prop_name="notification_listen")
+    if NOTIFICATION_LISTEN == "":
+        NOTIFICATION_LISTEN = "0.0.0.0:4443"
+
+    NOTIFICATION_URL: str = get_zcli_property(config=CONFIG, prop_name="notification_url")
+    NOTIFICATION_CERT: str = get_zcli_property(config=CONFIG, prop_name="notification_cert")
+
+    CSI_CACHE_DIR: str = get_zcli_property(config=CONFIG, prop_name="csi_cache")
+    if CSI_CACHE_DIR == "":
+        CSI_CACHE_DIR = ".local/zcli/.cache/csi"
+
+    CSI_CACHE_TTL: str = str(get_zcli_property(config=CONFIG, prop_name="csi_cache_ttl"))
+    if CSI_CACHE_TTL == "":
+        CSI_CACHE_TTL = "3600"
+
+    CSI_CACHE_SIZE: str = str(get_zcli_property(config=CONFIG, prop_name="csi_cache_size"))
+    if CSI_CACHE_SIZE == "":
+        CSI_CACHE_SIZE = "100"
+
     CERT_PATH: str = get_zcli_property(config=CONFIG, prop_name="cert_path")
 
 else:
@@ -55,10 +55,13 @@ def command(ctx: click.Context, command: str):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.issue_zos_command(command, verify=ctx.obj["VERIFY"])
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
-        sys.stderr.write(f"{response.text}\n")
+        if response is not None:
+            sys.stderr.write(f"{response.text}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
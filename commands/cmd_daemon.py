@@ -0,0 +1,211 @@
+import json
+import os
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+import click
+from click_help_colors import HelpColorsGroup, HelpColorsCommand
+
+from commands.cmd_config import CONFIG_CACHE_DIR
+from commands.cmd_globals import SESSIONS
+from commands.cmd_socket import SOCKET_PATH, send
+from commands.cmd_utils import CURRENT_WORKDIR, create_directory, invoke_command
+
+
+def control(name: str) -> dict | None:
+    """
+    Args:
+        name (str): The control request, "status" or "stop".
+
+    Returns:
+        dict | None: The answer of the daemon, None if none is listening.
+    """
+    try:
+        return send({"control": name}, timeout=5)
+    except (OSError, ValueError):
+        return None
+
+
+class HANDLER(socketserver.StreamRequestHandler):
+    """
+    One connection carries one request, a line of JSON, and its answer:
+
+        {"argv": [...], "cwd": "...", "color": bool} -> {"rc": n, "stdout": "...", "stderr": "..."}
+        {"control": "status"}                      -> {"pid": n, "started": t, ...}
+        {"control": "stop"}                        -> {"stopping": true}
+    """
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError as e:
+            self.answer({"rc": 16, "stderr": f"ZCLI-DAEMON-002E Invalid request: {e}\n"})
+            return
+
+        server = self.server
+        action = request.get("control", "")
+        if action == "status":
+            self.answer(
+                {
+                    "pid": os.getpid(),
+                    "started": server.started,
+                    "cwd": CURRENT_WORKDIR.path,
+                    "requests": server.requests,
+                    "profiles": sorted(SESSIONS),
+                }
+            )
+        elif action == "stop":
+            self.answer({"stopping": True})
+            threading.Thread(target=server.shutdown).start()
+        else:
+            server.requests = server.requests + 1
+            rc, stdout, stderr = invoke_command(
+                server.command,
+                request.get("argv", []),
+                color=request.get("color"),
+                cwd=request.get("cwd", CURRENT_WORKDIR.path),
+            )
+            self.answer({"rc": rc, "stdout": stdout, "stderr": stderr})
+
+    def answer(self, answer: dict) -> None:
+        try:
+            self.wfile.write(json.dumps(answer).encode())
+        except OSError:
+            pass
+
+
+class SERVER(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, command: click.Command):
+        """
+        Args:
+            path (str)...............: The Unix socket to listen on.
+            command (click.Command)..: The zcli root command requests are run with.
+        """
+        self.command = command
+        self.started = time.time()
+        self.requests = 0
+
+        if os.path.exists(path):
+            os.remove(path)
+        # The socket is created readable and writable by the owner only
+        umask = os.umask(0o177)
+        try:
+            super(SERVER, self).__init__(path, HANDLER)
+        finally:
+            os.umask(umask)
+
+
+# ------------------------------------------------------------------------------#
+# Define the daemon group                                                      #
+# ------------------------------------------------------------------------------#
+@click.group(
+    name="daemon",
+    cls=HelpColorsGroup,
+    help_headers_color="yellow",
+    help_options_color="green",
+)
+def daemon_cli() -> None:
+    """
+    Run zcli as a daemon that keeps profiles warm.
+
+    \b
+    While the daemon runs, zcli hands every command to it over a Unix socket.
+    The daemon keeps zcli.json parsed and the connections and session
+    tokens of every profile used so far open, so a command costs a single
+    request round trip. Restart the daemon after changing zcli.json.
+
+    Environment: *ix Terminal CLI / Batch Job
+    """
+    pass
+
+
+# ------------------------------------------------------------------------------#
+# Define the daemon start subcommand                                           #
+# ------------------------------------------------------------------------------#
+@daemon_cli.command(name="start", cls=HelpColorsCommand, help_options_color="blue")
+@click.option(
+    "--foreground / --background",
+    default=False,
+    show_default=True,
+    help="Run in this process (--foreground) or detach (--background).",
+)
+@click.pass_context
+def start(ctx: click.Context, foreground: bool):
+    """
+    Use this command to start the zcli daemon.
+
+    \b
+    In the background the daemon writes its log to ~/.config/zcli/zcli-daemon.log.
+    """
+    logging = ctx.obj["LOGGING"]
+
+    if control("status") is not None:
+        sys.stderr.write(f"ZCLI-DAEMON-003E A zcli daemon is already listening on {SOCKET_PATH}\n")
+        ctx.exit(8)
+
+    if not foreground:
+        log_path = os.path.join(create_directory(CONFIG_CACHE_DIR), "zcli-daemon.log")
+        with open(log_path, "a") as log_file:
+            subprocess.Popen(
+                [sys.executable, os.path.abspath(sys.argv[0])]
+                + sys.argv[1:]
+                + ["--foreground"],
+                stdin=subprocess.DEVNULL,
+                stdout=log_file,
+                stderr=log_file,
+                start_new_session=True,
+            )
+        for _ in range(50):
+            if control("status") is not None:
+                sys.stdout.write(f"ZCLI-DAEMON-000I zcli daemon listening on {SOCKET_PATH}\n")
+                return
+            time.sleep(0.1)
+        sys.stderr.write(f"ZCLI-DAEMON-004E The zcli daemon did not start, see {log_path}\n")
+        ctx.exit(8)
+
+    server = SERVER(SOCKET_PATH, ctx.find_root().command)
+    logging.info(f"ZCLI-DAEMON-000I zcli daemon {os.getpid()} listening on {SOCKET_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(SOCKET_PATH):
+            os.remove(SOCKET_PATH)
+        logging.info(f"ZCLI-DAEMON-000I zcli daemon {os.getpid()} ended after {server.requests} requests")
+
+
+# ------------------------------------------------------------------------------#
+# Define the daemon stop subcommand                                            #
+# ------------------------------------------------------------------------------#
+@daemon_cli.command(name="stop", cls=HelpColorsCommand, help_options_color="blue")
+@click.pass_context
+def stop(ctx: click.Context):
+    """
+    Use this command to stop the zcli daemon.
+    """
+    if control("stop") is None:
+        sys.stderr.write(f"ZCLI-DAEMON-005W No zcli daemon is listening on {SOCKET_PATH}\n")
+        ctx.exit(4)
+    sys.stdout.write("ZCLI-DAEMON-000I zcli daemon stopped\n")
+
+
+# ------------------------------------------------------------------------------#
+# Define the daemon status subcommand                                          #
+# ------------------------------------------------------------------------------#
+@daemon_cli.command(name="status", cls=HelpColorsCommand, help_options_color="blue")
+@click.pass_context
+def status(ctx: click.Context):
+    """
+    Use this command to show whether the zcli daemon runs and what it keeps warm.
+    """
+    answer = control("status")
+    if answer is None:
+        sys.stderr.write(f"ZCLI-DAEMON-005W No zcli daemon is listening on {SOCKET_PATH}\n")
+        ctx.exit(4)
+    sys.stdout.write(f"{json.dumps(answer)}\n")
@@ -73,6 +73,7 @@ def list(ctx: click.Context, dsn_level: str, volser: str, start: str):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_datasets_list(
         dsn_level=dsn_level, volser=volser, start=start, verify=verify
@@ -84,6 +85,7 @@ def list(ctx: click.Context, dsn_level: str, volser: str, start: str):
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -129,6 +131,7 @@ def members(ctx: click.Context, ds_name: str, pattern: str):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_datasets_members_list(
         dataset_name=ds_name, pattern=pattern, verify=verify
@@ -140,6 +143,7 @@ def members(ctx: click.Context, ds_name: str, pattern: str):
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -215,6 +219,7 @@ def read(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_datasets_read(
         dataset_name=ds_name,
@@ -230,6 +235,7 @@ def read(
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
         sys.stdout.write(f"{response.headers}\n")
@@ -421,6 +427,7 @@ def create(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_datasets_create(
         ds_name=ds_name,
@@ -448,6 +455,7 @@ def create(
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -511,6 +519,7 @@ def delete(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_datasets_delete(
         ds_name=ds_name,
@@ -525,6 +534,7 @@ def delete(
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -597,6 +607,7 @@ def hrecall(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_datasets_utils(
         ds_name=ds_name,
@@ -617,6 +628,7 @@ def hrecall(
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -669,6 +681,7 @@ def hmigrate(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_datasets_utils(
         ds_name=ds_name,
@@ -689,6 +702,7 @@ def hmigrate(
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -751,6 +765,7 @@ def hdelete(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_datasets_utils(
         ds_name=ds_name,
@@ -771,6 +786,7 @@ def hdelete(
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -849,6 +865,7 @@ def rename(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_datasets_utils(
         ds_name=ds_name,
@@ -868,6 +885,7 @@ def rename(
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
         sys.stdout.write(f"{response.headers}\n")
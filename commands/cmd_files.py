@@ -59,6 +59,7 @@ def list(ctx: click.Context, path_name: str):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_files_list(file_path=path_name, verify=verify)
 
@@ -66,7 +67,7 @@ def list(ctx: click.Context, path_name: str):
     logging.debug(f"                errors: {errors}")
     logging.debug(f"              response: {response}")
 
-    process_response(errors, response, False)
+    ctx.exit(process_response(errors, response, False))
 
 
 # ------------------------------------------------------------------------------#
@@ -142,6 +143,7 @@ def retrieve_file(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_files_retrieve(
         zunix_file_name=zunix_file_name,
@@ -157,6 +159,7 @@ def retrieve_file(
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         if local_file_name == "":
             sys.stdout.write(f"{response.text}\n")
@@ -260,6 +263,7 @@ def write_file(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
 
     try:
@@ -285,7 +289,7 @@ def write_file(
     logging.debug(f"                errors: {errors}")
     logging.debug(f"              response: {response}")
 
-    process_response(errors, response, False)
+    ctx.exit(process_response(errors, response, False))
 
 # ------------------------------------------------------------------------------#
 # Define the files create subcommand                                            #
@@ -344,6 +348,7 @@ def create_file(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_files_create(
         zunix_file_path=zunix_file_path,
@@ -356,7 +361,7 @@ def create_file(
     logging.debug(f"                errors: {errors}")
     logging.debug(f"              response: {response}")
 
-    process_response(errors, response, False)
+    ctx.exit(process_response(errors, response, False))
 
 # ------------------------------------------------------------------------------#
 # Define the files delete subcommand                                            #
@@ -405,6 +410,7 @@ def delete_file(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_files_delete(
         zunix_file_path=zunix_file_path,
@@ -416,7 +422,7 @@ def delete_file(
     logging.debug(f"                errors: {errors}")
     logging.debug(f"              response: {response}")
 
-    process_response(errors, response, False)
+    ctx.exit(process_response(errors, response, False))
 
 # ------------------------------------------------------------------------------#
 # Define the util subgroup of the files group                                   #
@@ -505,6 +511,7 @@ def chmod_file(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_files_util_chmod(
         zunix_file_path=zunix_file_path,
@@ -518,7 +525,7 @@ def chmod_file(
     logging.debug(f"                errors: {errors}")
     logging.debug(f"              response: {response}")
 
-    process_response(errors, response, True)
+    ctx.exit(process_response(errors, response, True))
 
 # ------------------------------------------------------------------------------#
 # Define the files util chown subcommand                                        #
@@ -596,6 +603,7 @@ def chown_file(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_files_util_chown(
         zunix_file_path=zunix_file_path,
@@ -610,7 +618,7 @@ def chown_file(
     logging.debug(f"                errors: {errors}")
     logging.debug(f"              response: {response}")
 
-    process_response(errors, response, True)
+    ctx.exit(process_response(errors, response, True))
 
 # ------------------------------------------------------------------------------#
 # Define the files util chtag subcommand                                        #
@@ -694,6 +702,7 @@ def chtag_file(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_files_util_chtag(
         zunix_file_path=zunix_file_path,
@@ -709,7 +718,7 @@ def chtag_file(
     logging.debug(f"                errors: {errors}")
     logging.debug(f"              response: {response}")
 
-    process_response(errors, response, False)
+    ctx.exit(process_response(errors, response, False))
 
 # ------------------------------------------------------------------------------#
 # Define the files util extattr subcommand                                      #
@@ -774,6 +783,7 @@ def extattr_file(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_files_util_extattr(
         zunix_file_path=zunix_file_path,
@@ -786,5 +796,5 @@ def extattr_file(
     logging.debug(f"                errors: {errors}")
     logging.debug(f"              response: {response}")
 
-    process_response(errors, response, False)
+    ctx.exit(process_response(errors, response, False))
 
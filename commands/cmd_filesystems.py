@@ -131,6 +131,7 @@ def create_filesystem(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_filessystems_create(
         zfs_dataset_name=zfs_dataset_name,
@@ -152,6 +153,7 @@ def create_filesystem(
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -190,6 +192,7 @@ def delete_filesystem(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_filessystems_delete(
         zfs_dataset_name=zfs_dataset_name,
@@ -200,13 +203,17 @@ def delete_filesystem(
     logging.debug(f"                errors: {errors}")
     logging.debug(f"              response: {response}")
 
-    if errors:
+    if errors and response is None:
+        sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
+    elif errors:
         response_dict = json.loads(response.text)
         sys.stderr.write(f"{response_dict["message"]}\n")
         for utility_details in response_dict["details"]:
             details = utility_details.split("\n")
             for detail in details:
                 sys.stderr.write(f"{detail}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -282,6 +289,7 @@ def file_system_mount(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_filessystems_mount_unmount(
         file_system_name=fs_dataset_name,
@@ -299,7 +307,9 @@ def file_system_mount(
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
-        sys.stdout.write(f"{response.text}\n")
+        if response is not None:
+            sys.stdout.write(f"{response.text}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -338,6 +348,7 @@ def file_system_unmount(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_filessystems_mount_unmount(
         fs_dataset_name=fs_dataset_name,
@@ -351,13 +362,17 @@ def file_system_unmount(
     logging.debug(f"                errors: {errors}")
     logging.debug(f"              response: {response}")
 
-    if errors:
+    if errors and response is None:
+        sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
+    elif errors:
         response_dict = json.loads(response.text)
         sys.stderr.write(f"{response_dict["message"]}\n")
         for utility_details in response_dict["details"]:
             details = utility_details.split("\n")
             for detail in details:
                 sys.stderr.write(f"{detail}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
         
@@ -413,6 +428,7 @@ def file_system_list(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosapi_filessystems_list(
         file_system_name=fs_dataset_name,
@@ -426,6 +442,8 @@ def file_system_list(
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
-        sys.stdout.write(f"{response.text}\n")
+        if response is not None:
+            sys.stdout.write(f"{response.text}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
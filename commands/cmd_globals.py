@@ -23,3 +23,9 @@ if sys.stdout.isatty():
     """
     # print(chr(27) + "[2J")
     # print(chr(27) + "[1;1f")
+
+"""
+    SESSION per profile name, shared by all commands run in this process, so
+    a zcli daemon keeps connections and tokens of a profile warm
+"""
+SESSIONS: dict = {}
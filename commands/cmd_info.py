@@ -2,7 +2,6 @@ import sys
 import click
 from click_help_colors import HelpColorsCommand
 from zosapi import info as i
-from tui.info import tui_info_list
 
 
 # ------------------------------------------------------------------------------#
@@ -35,13 +34,17 @@ def info(ctx: click.Context, tui: bool):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.zosmf_info(verify=verify)
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         if not tui:
             sys.stdout.write(f"{response.text}\n")
         else:
+            from tui.info import tui_info_list
+
             tui_info_list.show_tui(response.text)
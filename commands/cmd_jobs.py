@@ -1,10 +1,112 @@
+import json
 import sys
+import time
 import click
 from click_help_colors import HelpColorsGroup, HelpColorsCommand
 
-from tui.jobs import tui_jobs_list
+from zosapi import cache as K
 from zosapi import jobs as j
-from commands.cmd_utils import MutuallyExclusiveOption
+from commands.cmd_config import (
+    JOBS_CACHE_DIR,
+    JOBS_CACHE_SIZE,
+    NOTIFICATION_CERT,
+    NOTIFICATION_LISTEN,
+    NOTIFICATION_URL,
+)
+from commands.cmd_utils import MutuallyExclusiveOption, create_directory
+
+
+def spool_cache() -> K.CACHE:
+    """
+    Returns:
+        CACHE: The cache for spool files of completed jobs, <jobs_cache>/.spool.
+    """
+    try:
+        max_bytes = int(float(JOBS_CACHE_SIZE) * 1024 * 1024)
+    except ValueError:
+        raise click.BadParameter(
+            'CMD-JOBS-002S Property "jobs_cache_size" in zcli.json must be numeric, unable to continue.',
+            param_hint=["zcli.json"],
+        )
+    return K.CACHE(directory=create_directory(f"{JOBS_CACHE_DIR}/.spool"), ttl=0, max_bytes=max_bytes)
+
+
+def start_listener(listen: str, url: str, cert: str, logging):
+    """
+    Start the notification listener for submit --wait.
+
+    Args:
+        listen (str)...: host:port to listen on.
+        url (str)......: The URL z/OSMF sends notifications to, "" for https://<host name>:<port>.
+        cert (str).....: PEM file with certificate and key, "" for no listener.
+        logging........: The logger.
+
+    Returns:
+        LISTENER | None: The started listener, None if it could not be started;
+                         the job status is then polled only.
+    """
+    if cert == "":
+        logging.debug("CMD-JOBS-000D No notification_cert in zcli.json, polling the job status only")
+        return None
+
+    # The listener needs aiohttp, which is only installed with the async extra
+    try:
+        from zosapi import notify as N
+    except ImportError as e:
+        sys.stderr.write(f"CMD-JOBS-004W The notification listener needs aiohttp ({e}), polling the job status only\n")
+        return None
+
+    host, _, port = listen.rpartition(":")
+    try:
+        listener = N.LISTENER(host=host or "0.0.0.0", port=int(port), certfile=cert, url=url)
+        listener.start()
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"CMD-JOBS-004W {e}, polling the job status only\n")
+        return None
+    return listener
+
+
+def write_timeline(runs: list, start: float, width: int = 40) -> None:
+    """
+    Write one line per job of submit-many with its times to stdout.
+
+    The times are seconds since start. The bar shows the time a job waited for
+    a free slot after it became ready (.) and the time it ran (=), scaled to
+    the time all jobs took.
+
+    Args:
+        runs (list)....: The runs returned by JOBS.submit_many().
+        start (float)..: time.time() before the first job was submitted.
+        width (int)....: Width of the bar (default 40).
+    """
+    ends = [run.get("ended") or run.get("submitted") or start for run in runs]
+    scale = width / max(max(ends, default=start) - start, 0.001)
+
+    def offset(value: float | None) -> str:
+        return "" if value is None else f"{value - start:.1f}"
+
+    def column(value: float) -> int:
+        return min(width, int((value - start) * scale))
+
+    name_width = max([len("NAME")] + [len(run["name"]) for run in runs])
+    sys.stdout.write(
+        f"{'NAME':<{name_width}}  {'JOBNAME':<8}  {'JOBID':<8}  {'STATUS':<7}  {'RC':>3}  "
+        f"{'READY':>6}  {'SUBMIT':>6}  {'END':>6}  {'TIMELINE':<{width}}  MESSAGE\n"
+    )
+    for run in runs:
+        bar = ""
+        if run["ready"] is not None:
+            submitted = column(run.get("submitted") or run["ready"])
+            ended = max(column(run.get("ended") or run.get("submitted") or run["ready"]), submitted + 1)
+            bar = " " * column(run["ready"]) + "." * (submitted - column(run["ready"])) + "=" * (ended - submitted)
+        rc = "" if run["rc"] is None else str(run["rc"])
+        message = run["errors"].get("status_code", "") if run["status"] != "ended" else ""
+        sys.stdout.write(
+            f"{run['name']:<{name_width}}  {run.get('jobname') or '':<8}  {run.get('jobid') or '':<8}  "
+            f"{run['status']:<7}  {rc:>3}  {offset(run['ready']):>6}  {offset(run.get('submitted')):>6}  "
+            f"{offset(run.get('ended')):>6}  {bar:<{width + 1}} {message}".rstrip()
+            + "\n"
+        )
 
 
 # ------------------------------------------------------------------------------#
@@ -126,6 +228,7 @@ def list(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.get_job_list(
         owner=owner,
@@ -138,14 +241,18 @@ def list(
     logging.debug("CMD-JOBS-000D list() returned with:")
     logging.debug(f"                errors: {errors}")
     logging.debug(f"              response: {response}")
-    logging.debug(f"                header: {response.headers}")
+    if response is not None:
+        logging.debug(f"                header: {response.headers}")
 
     if errors:
         sys.stderr.write(str(errors))
+        ctx.exit(errors["rc"])
     else:
         if not tui:
             sys.stdout.write(f"{response.text}\n")
         else:
+            from tui.jobs import tui_jobs_list
+
             tui_jobs_list.show_tui(response.text)
 
 
@@ -229,6 +336,7 @@ def ddnames(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     if job_correlator == "":
         errors, response = client.get_files_by_jobname_jobid(
@@ -244,6 +352,7 @@ def ddnames(
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -289,9 +398,36 @@ def ddnames(
     help="The id of the spool file to retrieveq.",
     type=click.STRING,
 )
+@click.option(
+    "--tail",
+    "-t",
+    required=False,
+    default=None,
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["record_range"],
+    help="Retrieve only the last N records.",
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--range",
+    "-r",
+    "record_range",
+    required=False,
+    default="",
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["tail"],
+    help="Retrieve only records a to b (a-b), the first record is 1.",
+    type=click.STRING,
+)
 @click.pass_context
 def files(
-    ctx: click.Context, job_id: str, job_name: str, job_correlator: str, file_id: str
+    ctx: click.Context,
+    job_id: str,
+    job_name: str,
+    job_correlator: str,
+    file_id: str,
+    tail: int,
+    record_range: str,
 ):
     """
     Use this command to retrieve a spool file.
@@ -310,6 +446,14 @@ def files(
     <job_correlator> identifies the job.
     <id> is the file id of the spool file to be retrieved.
     \b
+    --tail N retrieves only the last N records, --range a-b only records a to b.
+    Only these records are sent by z/OSMF and they are written as they arrive.
+    \b
+    ./zcli.py jobs files --job-name <job_name> --job-id <job_id> --file-id <id> --tail 60
+    ./zcli.py jobs files --job-name <job_name> --job-id <job_id> --file-id <id> --range 1000-2000
+    \b
+    Spool files of ended jobs are cached locally, see jobs_cache_size in zcli.json.
+    \b
     NOTE:
     Specify the full job correlator for the job: The 31-byte system portion, a semicolon,
     and the user portion (up to 32 bytes).
@@ -323,6 +467,17 @@ def files(
     logging.debug(f"                      Job ID: {job_id}")
     logging.debug(f"              Job Correlator: {job_correlator}")
     logging.debug(f"                     File ID: {file_id}")
+    logging.debug(f"                        Tail: {tail}")
+    logging.debug(f"                Record Range: {record_range}")
+
+    if record_range != "":
+        first, _, last = record_range.partition("-")
+        if not (first.strip().isdigit() and last.strip().isdigit()) or not 0 < int(first) <= int(last):
+            raise click.BadParameter(
+                f"CMD-JOBS-003E {record_range} is not a range of records a-b, 0 < a <= b.",
+                param_hint=["--range"],
+            )
+        record_range = f"{int(first) - 1}-{int(last) - 1}"
 
     client = j.JOBS(
         hostname=ctx.obj["HOST_NAME"],
@@ -331,13 +486,32 @@ def files(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
+    if tail is not None:
+        result, count = client.get_record_count(
+            fileid=file_id,
+            jobname=job_name.upper(),
+            jobid=job_id.upper(),
+            correlator=job_correlator,
+            verify=verify,
+        )
+        if result.rc != 0:
+            sys.stderr.write(f"{str(result.errors)}\n")
+            ctx.exit(result.rc)
+        if not count:
+            return
+        record_range = f"{max(0, count - tail)}-{count - 1}"
+
     errors, response = client.get_job_file_by_id(
         fileid=file_id,
         jobname=job_name.upper(),
         jobid=job_id.upper(),
         correlator=job_correlator,
         verify=verify,
+        stream=record_range != "",
+        cache=spool_cache(),
+        record_range=record_range,
     )
     logging.debug("CMD-JOBS-000D files() returned with:")
     logging.debug(f"                errors: {errors}")
@@ -345,8 +519,257 @@ def files(
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
-        sys.stdout.write(f"{response.text}\n")
+        client.write_records(response)
+        sys.stdout.write("\n")
+
+
+# ------------------------------------------------------------------------------#
+# Define the jobs output subcommand                                            #
+# ------------------------------------------------------------------------------#
+@jobs_cli.command(name="output", cls=HelpColorsCommand, help_options_color="blue")
+@click.option(
+    "--job-id",
+    "-ji",
+    required=False,
+    help="A Job ID.",
+    default="",
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["job_correlator"],
+    type=click.STRING,
+)
+@click.option(
+    "--job-name",
+    "-jn",
+    required=False,
+    help="The job name.",
+    default="",
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["job_correlator"],
+    type=click.STRING,
+)
+@click.option(
+    "--job-correlator",
+    "-jc",
+    required=False,
+    help="The user portion of the job correlator.",
+    default="",
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["jobid", "name"],
+    type=click.STRING,
+)
+@click.option(
+    "--all",
+    "-a",
+    "all_files",
+    is_flag=True,
+    default=False,
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["ddnames"],
+    help="Download all spool files of the job.",
+)
+@click.option(
+    "--ddname",
+    "-dd",
+    "ddnames",
+    multiple=True,
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["all_files"],
+    help="Download the spool files of this DD name, may be repeated.",
+    type=click.STRING,
+)
+@click.option(
+    "--parallel",
+    "-p",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Spool files downloaded at the same time  [default: pool_maxsize of the profile]",
+)
+@click.pass_context
+def output(
+    ctx: click.Context,
+    job_id: str,
+    job_name: str,
+    job_correlator: str,
+    all_files: bool,
+    ddnames: tuple,
+    parallel: int,
+):
+    """
+    Use this command to download the spool files of a job.
+
+    \b
+    The spool files are listed once and downloaded at the same time, each one
+    streamed to
+    \b
+        <jobs_cache>/<job_name>/<job_id>/<step>.<ddname>
+    \b
+    A manifest.json with the record and byte counts of every file is written
+    to the same directory and to stdout.
+    \b
+    ./zcli.py jobs output --job-name <job_name> --job-id <job_id> --all
+    ./zcli.py jobs output --job-correlator <job_correlator> -dd SYSPRINT -dd SYSOUT
+    \b
+    NOTE:
+    Specify the full job correlator for the job: The 31-byte system portion, a semicolon,
+    and the user portion (up to 32 bytes).
+    \b
+    """
+    verify = ctx.obj["VERIFY"]
+    logging = ctx.obj["LOGGING"]
+
+    logging.debug("CMD-JOBS-000D output() entered with:")
+    logging.debug(f"                    Job Name: {job_name}")
+    logging.debug(f"                      Job ID: {job_id}")
+    logging.debug(f"              Job Correlator: {job_correlator}")
+    logging.debug(f"                         All: {all_files}")
+    logging.debug(f"                    DD Names: {ddnames}")
+    logging.debug(f"                    Parallel: {parallel}")
+
+    if not all_files and ddnames == ():
+        sys.stderr.write("CMD-JOBS-001E Specify --all or at least one --ddname\n")
+        ctx.exit(8)
+
+    client = j.JOBS(
+        hostname=ctx.obj["HOST_NAME"],
+        protocol=ctx.obj["PROTOCOL"],
+        port=ctx.obj["PORT"],
+        username=ctx.obj["USER"],
+        password=ctx.obj["PASSWORD"],
+        cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
+    )
+    if job_correlator == "":
+        result = client.get_files_by_jobname_jobid(
+            jobname=job_name.upper(), jobid=job_id.upper(), verify=verify
+        )
+    else:
+        result = client.get_files_by_job_correlator(correlator=job_correlator, verify=verify)
+
+    if result.rc != 0:
+        sys.stderr.write(f"{str(result.errors)}\n")
+        ctx.exit(result.rc)
+
+    spool_files = [
+        ddname
+        for ddname in result.body
+        if all_files or ddname["ddname"] in [name.upper() for name in ddnames]
+    ]
+    if spool_files != []:
+        job_name = spool_files[0].get("jobname") or job_name
+        job_id = spool_files[0].get("jobid") or job_id
+
+    manifest = client.save_job_files(
+        spool_files,
+        create_directory(f"{JOBS_CACHE_DIR}/{job_name.upper()}/{job_id.upper()}"),
+        jobname=job_name.upper(),
+        jobid=job_id.upper(),
+        correlator=job_correlator,
+        parallel=parallel,
+        verify=verify,
+    )
+    sys.stdout.write(f"{json.dumps(manifest)}\n")
+    ctx.exit(max([file["rc"] for file in manifest["files"]], default=0))
+
+
+# ------------------------------------------------------------------------------#
+# Define the jobs follow subcommand                                            #
+# ------------------------------------------------------------------------------#
+@jobs_cli.command(name="follow", cls=HelpColorsCommand, help_options_color="blue")
+@click.option(
+    "--job-id",
+    "-ji",
+    required=False,
+    help="A Job ID.",
+    default="",
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["job_correlator"],
+    type=click.STRING,
+)
+@click.option(
+    "--job-name",
+    "-jn",
+    required=False,
+    help="The job name.",
+    default="",
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["job_correlator"],
+    type=click.STRING,
+)
+@click.option(
+    "--job-correlator",
+    "-jc",
+    required=False,
+    help="The user portion of the job correlator.",
+    default="",
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["jobid", "name"],
+    type=click.STRING,
+)
+@click.option(
+    "--ddname",
+    "-dd",
+    "ddnames",
+    multiple=True,
+    help="Follow only the spool files of this DD name, may be repeated.",
+    type=click.STRING,
+)
+@click.pass_context
+def follow(
+    ctx: click.Context, job_id: str, job_name: str, job_correlator: str, ddnames: tuple
+):
+    """
+    Use this command to follow the spool files of a running job.
+
+    \b
+    The spool files of the job are polled and only the records written since
+    the last poll are retrieved and written, with a header whenever the spool
+    file changes. Polls follow each other quickly while the job writes and
+    slow down, up to poll_interval_max of the profile, while it is idle.
+    \b
+    Following ends once the job is complete; its return code is written to
+    stderr and becomes the return code of zcli (the condition code, or 16
+    for abends and JCL errors).
+    \b
+    ./zcli.py jobs follow --job-name <job_name> --job-id <job_id>
+    ./zcli.py jobs follow --job-correlator <job_correlator> -dd SYSPRINT
+    \b
+    """
+    verify = ctx.obj["VERIFY"]
+    logging = ctx.obj["LOGGING"]
+
+    logging.debug("CMD-JOBS-000D follow() entered with:")
+    logging.debug(f"                    Job Name: {job_name}")
+    logging.debug(f"                      Job ID: {job_id}")
+    logging.debug(f"              Job Correlator: {job_correlator}")
+    logging.debug(f"                    DD Names: {ddnames}")
+
+    client = j.JOBS(
+        hostname=ctx.obj["HOST_NAME"],
+        protocol=ctx.obj["PROTOCOL"],
+        port=ctx.obj["PORT"],
+        username=ctx.obj["USER"],
+        password=ctx.obj["PASSWORD"],
+        cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
+    )
+    errors, response = client.follow_job(
+        jobname=job_name.upper(),
+        jobid=job_id.upper(),
+        correlator=job_correlator,
+        ddnames=tuple(ddname.upper() for ddname in ddnames),
+        verify=verify,
+    )
+    if errors:
+        sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
+
+    job = response.json()
+    sys.stderr.write(
+        f"CMD-JOBS-000I {job['jobname']}({job['jobid']}) ended with {job.get('retcode')}\n"
+    )
+    ctx.exit(j.return_code(job.get("retcode")))
 
 
 # ------------------------------------------------------------------------------#
@@ -400,6 +823,8 @@ def jcl(ctx: click.Context, job_id: str, job_name: str, job_correlator: str):
     ./zcli.py jobs jcl --job-correlator <job_correlator>
     <job_correlator> identifies the job.
     \b
+    The JCL of ended jobs is cached locally, see jobs_cache_size in zcli.json.
+    \b
     NOTE:
     Specify the full job correlator for the job: The 31-byte system portion, a semicolon,
     and the user portion (up to 32 bytes).
@@ -420,12 +845,14 @@ def jcl(ctx: click.Context, job_id: str, job_name: str, job_correlator: str):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.get_job_jcl(
         jobname=job_name.upper(),
         jobid=job_id.upper(),
         correlator=job_correlator,
         verify=verify,
+        cache=spool_cache(),
     )
     logging.debug("CMD-JOBS-000D jcl() returned with:")
     logging.debug(f"                errors: {errors}")
@@ -433,6 +860,7 @@ def jcl(ctx: click.Context, job_id: str, job_name: str, job_correlator: str):
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -463,13 +891,37 @@ def jcl(ctx: click.Context, job_id: str, job_name: str, job_correlator: str):
     help="Submit JCL inline.",
     type=click.BOOL,
 )
-
+@click.option(
+    "--wait/--no-wait",
+    required=False,
+    default=False,
+    help="Wait until the job is complete and return its return code.",
+    type=click.BOOL,
+)
+@click.option(
+    "--listen",
+    required=False,
+    default=NOTIFICATION_LISTEN,
+    show_default=True,
+    help="host:port the notification listener of --wait listens on.",
+    type=click.STRING,
+)
+@click.option(
+    "--notification-url",
+    required=False,
+    default=NOTIFICATION_URL,
+    help="URL z/OSMF sends the notification to  [default: https://<host name>:<port>]",
+    type=click.STRING,
+)
 @click.pass_context
 def submit(
     ctx: click.Context,
     file_name: str,
     secondary_jes: str,
     inline: bool,
+    wait: bool,
+    listen: str,
+    notification_url: str,
 ):
     """
     Use this command to submit a job to run on z/OS.
@@ -486,6 +938,15 @@ def submit(
     --secondary-jes <jes_name>
     to the request.
     \b
+    With --wait zcli waits until the job is complete, writes its job document
+    and returns its return code (the condition code, or 16 for abends and JCL
+    errors). zcli listens on --listen for the notification z/OSMF sends once
+    the job is complete; the listener needs the certificate and key in the
+    PEM file named by notification_cert in zcli.json, and z/OSMF must be able
+    to reach --notification-url. Without a notification the job status is
+    polled every poll_interval_max seconds, without a listener with the
+    growing poll interval of the profile.
+    \b
     """
     verify = ctx.obj["VERIFY"]
     logging = ctx.obj["LOGGING"]
@@ -494,6 +955,9 @@ def submit(
     logging.debug(f"                   file_name: {file_name}")
     logging.debug(f"                       inline: {inline}")
     logging.debug(f"               secondary_jes: {secondary_jes}")
+    logging.debug(f"                        wait: {wait}")
+    logging.debug(f"                      listen: {listen}")
+    logging.debug(f"            notification_url: {notification_url}")
 
     client = j.JOBS(
         hostname=ctx.obj["HOST_NAME"],
@@ -502,20 +966,324 @@ def submit(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
 
-    errors, response = client.submit_job(
-        file_name=file_name, jes_name=secondary_jes, verify=verify
-    )
+    listener = start_listener(listen, notification_url, NOTIFICATION_CERT, logging) if wait else None
+    try:
+        errors, response = client.submit_job(
+            file_name=file_name,
+            jes_name=secondary_jes,
+            inline=inline,
+            verify=verify,
+            notification_url=listener.url if listener is not None else "",
+        )
 
-    logging.debug("CMD-JOBS-000D Job submit returned with:")
-    logging.debug(f"                errors: {errors}")
-    logging.debug(f"              response: {response}")
+        logging.debug("CMD-JOBS-000D Job submit returned with:")
+        logging.debug(f"                errors: {errors}")
+        logging.debug(f"              response: {response}")
+
+        if errors:
+            sys.stderr.write(f"{str(errors)}\n")
+            ctx.exit(errors["rc"])
+        if not wait:
+            sys.stdout.write(f"{response.text}\n")
+            return
+
+        errors, response = client.wait_for_job(response.json(), listener=listener, verify=verify)
+    finally:
+        if listener is not None:
+            listener.stop()
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
+    sys.stdout.write(f"{response.text}\n")
+    ctx.exit(j.return_code(response.json().get("retcode")))
+
+
+# ------------------------------------------------------------------------------#
+# Define the jobs run subcommand                                               #
+# ------------------------------------------------------------------------------#
+@jobs_cli.command(name="run", cls=HelpColorsCommand, help_options_color="blue")
+@click.option(
+    "--file-name",
+    "-fn",
+    required=True,
+    help="Full file name containing z/OS Job JCL.",
+    type=click.STRING,
+)
+@click.option(
+    "--secondary-jes",
+    "-sn",
+    required=False,
+    default="",
+    help="Secondary JES subsystem name.",
+    type=click.STRING,
+)
+@click.option(
+    "--inline/--no-inline",
+    required=False,
+    default=True,
+    help="Submit JCL inline.",
+    type=click.BOOL,
+)
+@click.option(
+    "--ddname",
+    "-dd",
+    "ddnames",
+    multiple=True,
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["no_output"],
+    help="Download only the spool files of this DD name, may be repeated  [default: all]",
+    type=click.STRING,
+)
+@click.option(
+    "--no-output",
+    "no_output",
+    is_flag=True,
+    default=False,
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["ddnames"],
+    help="Download no spool files.",
+)
+@click.option(
+    "--parallel",
+    "-p",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Spool files downloaded at the same time  [default: pool_maxsize of the profile]",
+)
+@click.option(
+    "--listen",
+    required=False,
+    default=NOTIFICATION_LISTEN,
+    show_default=True,
+    help="host:port the notification listener listens on.",
+    type=click.STRING,
+)
+@click.option(
+    "--notification-url",
+    required=False,
+    default=NOTIFICATION_URL,
+    help="URL z/OSMF sends the notification to  [default: https://<host name>:<port>]",
+    type=click.STRING,
+)
+@click.pass_context
+def run(
+    ctx: click.Context,
+    file_name: str,
+    secondary_jes: str,
+    inline: bool,
+    ddnames: tuple,
+    no_output: bool,
+    parallel: int,
+    listen: str,
+    notification_url: str,
+):
+    """
+    Use this command to submit a job, wait until it is complete and download
+    its spool files.
+
+    \b
+    This is jobs submit --wait followed by jobs output --all in one zcli call,
+    all requests share one session. The spool files are written to
+    \b
+        <jobs_cache>/<job_name>/<job_id>/<step>.<ddname>
+    \b
+    together with a manifest.json. The job, its steps and the manifest are
+    written to stdout; the return code is the highest return code of the job
+    steps (16 for abends and JCL errors), or the one of a failed request.
+    \b
+    ./zcli.py jobs run --file-name <file_name>
+    ./zcli.py jobs run --file-name <file_name> -dd SYSPRINT -dd SYSOUT
+    \b
+    See jobs submit for --inline, --secondary-jes, --listen and --notification-url.
+    \b
+    """
+    verify = ctx.obj["VERIFY"]
+    logging = ctx.obj["LOGGING"]
+
+    logging.debug("CMD-JOBS-000D job run entered with:")
+    logging.debug(f"                   file_name: {file_name}")
+    logging.debug(f"                       inline: {inline}")
+    logging.debug(f"               secondary_jes: {secondary_jes}")
+    logging.debug(f"                    DD Names: {ddnames}")
+    logging.debug(f"                   No Output: {no_output}")
+    logging.debug(f"                    Parallel: {parallel}")
+    logging.debug(f"                      listen: {listen}")
+    logging.debug(f"            notification_url: {notification_url}")
+
+    client = j.JOBS(
+        hostname=ctx.obj["HOST_NAME"],
+        protocol=ctx.obj["PROTOCOL"],
+        port=ctx.obj["PORT"],
+        username=ctx.obj["USER"],
+        password=ctx.obj["PASSWORD"],
+        cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
+    )
+
+    listener = start_listener(listen, notification_url, NOTIFICATION_CERT, logging)
+    try:
+        job_run = client.run_job(
+            file_name=file_name,
+            directory=create_directory(JOBS_CACHE_DIR),
+            ddnames=[] if no_output else ([*ddnames] or None),
+            jes_name=secondary_jes,
+            inline=inline,
+            listener=listener,
+            parallel=parallel,
+            verify=verify,
+        )
+    finally:
+        if listener is not None:
+            listener.stop()
+
+    logging.debug("CMD-JOBS-000D Job run returned with:")
+    logging.debug(f"                    run: {job_run}")
+
+    if job_run["errors"]:
+        sys.stderr.write(f"{str(job_run['errors'])}\n")
+    sys.stdout.write(f"{json.dumps(job_run)}\n")
+    ctx.exit(job_run["rc"])
+
+
+# ------------------------------------------------------------------------------#
+# Define the jobs submit-many subcommand                                       #
+# ------------------------------------------------------------------------------#
+@jobs_cli.command(name="submit-many", cls=HelpColorsCommand, help_options_color="blue")
+@click.argument("manifest", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--secondary-jes",
+    "-sn",
+    required=False,
+    default="",
+    help="Secondary JES subsystem name.",
+    type=click.STRING,
+)
+@click.option(
+    "--inline/--no-inline",
+    required=False,
+    default=True,
+    help="Submit JCL inline.",
+    type=click.BOOL,
+)
+@click.option(
+    "--parallel",
+    "-p",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Requests sent to z/OSMF at the same time  [default: pool_maxsize of the profile]",
+)
+@click.option(
+    "--listen",
+    required=False,
+    default=NOTIFICATION_LISTEN,
+    show_default=True,
+    help="host:port the notification listener listens on.",
+    type=click.STRING,
+)
+@click.option(
+    "--notification-url",
+    required=False,
+    default=NOTIFICATION_URL,
+    help="URL z/OSMF sends the notification to  [default: https://<host name>:<port>]",
+    type=click.STRING,
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["fixed", "jsonl"]),
+    default="fixed",
+    show_default=True,
+    help="Write the timeline as a table (fixed) or one line of JSON per job (jsonl).",
+)
+@click.pass_context
+def submit_many(
+    ctx: click.Context,
+    manifest: str,
+    secondary_jes: str,
+    inline: bool,
+    parallel: int,
+    listen: str,
+    notification_url: str,
+    output_format: str,
+):
+    """
+    Use this command to submit many jobs, each one as soon as the jobs it
+    depends on have ended.
+
+    \b
+    MANIFEST is a JSON file listing the JCL files and their dependencies:
+    \b
+        {"jobs": [{"name": "A", "file": "a.jcl"},
+                  {"name": "B", "file": "b.jcl", "after": {"A": 4}},
+                  {"name": "C", "file": "c.jcl", "after": ["A", "B"]}]}
+    \b
+    B runs once A has ended with a return code up to 4, C once A and B have
+    ended with 0. A job is skipped if a job it depends on ended with a higher
+    return code, failed or was skipped. All ready jobs are submitted at once
+    and their end is detected like with jobs submit --wait; --parallel only
+    limits the requests sent to z/OSMF at the same time. Relative file names are relative to
+    the manifest.
+    \b
+    At the end the timeline of all jobs is written: when each one became ready,
+    was submitted and ended, in seconds since the start. The return code is
+    the highest return code of all jobs.
+    \b
+    ./zcli.py jobs submit-many regression.json
+    \b
+    """
+    verify = ctx.obj["VERIFY"]
+    logging = ctx.obj["LOGGING"]
+
+    logging.debug("CMD-JOBS-000D job submit-many entered with:")
+    logging.debug(f"                    manifest: {manifest}")
+    logging.debug(f"                       inline: {inline}")
+    logging.debug(f"               secondary_jes: {secondary_jes}")
+    logging.debug(f"                    Parallel: {parallel}")
+    logging.debug(f"                      listen: {listen}")
+    logging.debug(f"            notification_url: {notification_url}")
+
+    try:
+        jobs = j.read_job_manifest(manifest)
+    except ValueError as e:
+        sys.stderr.write(f"{e}\n")
+        ctx.exit(8)
+
+    client = j.JOBS(
+        hostname=ctx.obj["HOST_NAME"],
+        protocol=ctx.obj["PROTOCOL"],
+        port=ctx.obj["PORT"],
+        username=ctx.obj["USER"],
+        password=ctx.obj["PASSWORD"],
+        cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
+    )
+
+    start = time.time()
+    listener = start_listener(listen, notification_url, NOTIFICATION_CERT, logging)
+    try:
+        runs = client.submit_many(
+            jobs,
+            jes_name=secondary_jes,
+            inline=inline,
+            listener=listener,
+            parallel=parallel,
+            verify=verify,
+        )
+    finally:
+        if listener is not None:
+            listener.stop()
+
+    if output_format == "jsonl":
+        for job_run in runs:
+            sys.stdout.write(f"{json.dumps(job_run)}\n")
     else:
-        sys.stdout.write(f"{response.text}\n")
+        write_timeline(runs, start)
+    ctx.exit(max([job_run["rc"] for job_run in runs if job_run["rc"] is not None], default=0))
 
 
 # ------------------------------------------------------------------------------#
@@ -602,6 +1370,7 @@ def hold(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.hold_job(
         jobname=job_name, jobid=job_id, correlator=job_correlator, verify=verify
@@ -613,6 +1382,7 @@ def hold(
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -706,6 +1476,7 @@ def jobclass(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.change_job_class(
         jobname=job_name,
@@ -721,6 +1492,7 @@ def jobclass(
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -805,6 +1577,7 @@ def release(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.release_job(
         jobname=job_name, jobid=job_id, correlator=job_correlator, verify=verify
@@ -816,6 +1589,7 @@ def release(
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -916,6 +1690,7 @@ def cancel(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     if not purge:
         errors, response = client.cancel_job(
@@ -932,5 +1707,6 @@ def cancel(
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
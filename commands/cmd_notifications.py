@@ -60,6 +60,7 @@ def list(ctx: click.Context):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.get_notifications(verify=verify)
 
@@ -69,6 +70,7 @@ def list(ctx: click.Context):
 
     if "rc" in errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -118,6 +120,7 @@ def send(ctx: click.Context, file_name):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.send_notifications(filename=file_name, verify=verify)
 
@@ -127,5 +130,6 @@ def send(ctx: click.Context, file_name):
 
     if "rc" in errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
@@ -0,0 +1,141 @@
+import json
+import os
+import socket
+import sys
+
+# Only the standard library is imported here, this module runs before zcli.py
+# imports click, requests and zcli.json to hand the command to a zcli daemon.
+
+SOCKET_PATH: str = os.path.join(os.path.expanduser("~"), ".config/zcli", "zcli.sock")
+
+# Options of zcli.py main, which come before the command words, and whether
+# they take a value
+GLOBAL_OPTIONS: dict = {
+    "-pn": True,
+    "--profile-name": True,
+    "-ps": True,
+    "--profiles": True,
+    "--verify": False,
+    "--no-verify": False,
+    "--debug": False,
+    "--no-debug": False,
+}
+
+# Command lines that are never handed to the daemon, as (command words,
+# options) rules, see matches(). The daemon only answers once a command has
+# ended, so commands that write their output as it comes run locally.
+LOCAL_ONLY: tuple = (
+    (("daemon",), ()),
+    ((), ("--tui",)),
+    (("jobs", "follow"), ()),
+    (("jobs", "run"), ()),
+    (("jobs", "submit-many"), ()),
+    (("jobs", "submit"), ("--wait",)),
+    (("jobs", "files"), ("-t", "--tail", "-r", "--range")),
+)
+
+
+def split_command(argv: list) -> tuple[list, list]:
+    """_Split a zcli command line into its command words and the rest_
+
+    The global options in front are skipped, the command words are the group
+    and command names up to the first option, e.g. ["jobs", "list"].
+
+    Args:
+        argv (list): _The arguments, without the program name_
+
+    Returns:
+        tuple[list, list]: _The command words and the arguments after them_
+    """
+    position = 0
+    while position < len(argv) and argv[position].startswith("-"):
+        name, _, value = argv[position].partition("=")
+        takes_value = GLOBAL_OPTIONS.get(name, False)
+        position = position + (2 if takes_value and value == "" else 1)
+    start = position
+    while position < len(argv) and not argv[position].startswith("-"):
+        position = position + 1
+    return argv[start:position], argv[position:]
+
+
+def matches(argv: list, rules: tuple) -> bool:
+    """_Whether a command line matches one of rules_
+
+    A rule is a pair of command words and options. The command words match the
+    command and its subcommands, () matches every command; the rule matches if
+    the command line also uses one of the options, or the options are ().
+
+    Args:
+        argv (list): _The arguments, without the program name_
+        rules (tuple): _The rules, e.g. ((("jobs", "submit"), ("--wait",)),)_
+
+    Returns:
+        bool: _True if one of the rules matches_
+    """
+    words, rest = split_command(argv)
+    used = {arg.partition("=")[0] for arg in rest}
+    return any(
+        tuple(words[: len(command)]) == command and (options == () or not used.isdisjoint(options))
+        for command, options in rules
+    )
+
+
+def send(request: dict, timeout: float | None = None) -> dict | None:
+    """_Send one request to the zcli daemon and wait for its answer_
+
+    Args:
+        request (dict): _The request, serialised as one line of JSON_
+        timeout (float | None): _Seconds to wait for the answer (default None, no limit)_
+
+    Returns:
+        dict | None: _The answer, None if no daemon is listening on SOCKET_PATH_
+    """
+    if not os.path.exists(SOCKET_PATH):
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(SOCKET_PATH)
+        except OSError:
+            return None
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile("rb") as f:
+            answer = f.read()
+
+    return json.loads(answer) if answer else None
+
+
+def forward(argv: list) -> int | None:
+    """_Run a command line in the zcli daemon if one is running_
+
+    The command runs locally instead when it is local only (see LOCAL_ONLY) or
+    a ZCLI_* environment variable is set, the daemon runs with its own
+    environment and would not see it.
+
+    Args:
+        argv (list): _The arguments, without the program name_
+
+    Returns:
+        int | None: _The return code of the command, None if it was not forwarded_
+    """
+    if matches(argv, LOCAL_ONLY):
+        return None
+    if any(name.startswith("ZCLI_") for name in os.environ):
+        return None
+
+    # Once connected the command may have run, so it is not retried locally
+    try:
+        answer = send(
+            {"argv": argv, "cwd": os.getcwd(), "color": sys.stdout.isatty()}
+        )
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"ZCLI-DAEMON-001S Lost the connection to the zcli daemon: {e}\n")
+        return 16
+    if answer is None:
+        return None
+
+    sys.stdout.write(answer.get("stdout", ""))
+    sys.stderr.write(answer.get("stderr", ""))
+    return answer.get("rc", 16)
@@ -1,16 +1,129 @@
+import codecs
+import csv
+import fnmatch
+import json
+import os
 import sys
 import click
 from click_help_colors import HelpColorsGroup, HelpColorsCommand
+from concurrent.futures import ThreadPoolExecutor
 
-from tui.software import tui_sms_crit_updates
-from tui.software import tui_sms_fixc_updates
-from tui.software import tui_sms_soft_updates
-from tui.software import tui_sms_list
-
-from commands.cmd_utils import MutuallyExclusiveOption
-from commands.cmd_config import GLOBAL_CSI
+from commands.cmd_utils import MutuallyExclusiveOption, create_directory
+from commands.cmd_config import GLOBAL_CSI, CSI_CACHE_DIR, CSI_CACHE_TTL, CSI_CACHE_SIZE
+from zosapi import cache as K
+from zosapi import snapshot as SNAP
 from zosapi import software as s
 
+# Columns of the CSV report of fleetscan, lists are joined with ";"
+FLEET_SCAN_COLUMNS: tuple = (
+    "updates",
+    "name",
+    "holdclass",
+    "holdsymptom",
+    "heldsysmod",
+    "fmid",
+    "fmiddesc",
+    "fixcats",
+    "resolvers",
+    "instances",
+    "zones",
+)
+
+
+def write_entries(client: s.SMS, entries, output_format: str) -> int:
+    """
+    Write CSI entries to stdout as they are read.
+
+    Args:
+        client (SMS)..........: The client providing the report writers.
+        entries (iterable)....: The CSI entries.
+        output_format (str)...: json, jsonl, csv or fixed.
+
+    Returns:
+        int: Number of entries written.
+    """
+    if output_format != "json":
+        writer = {
+            "jsonl": client.jsonl_report,
+            "csv": client.csv_report,
+            "fixed": client.friendly_report,
+        }[output_format]
+        return writer(entries)
+
+    count = 0
+    sys.stdout.write('{"entries": [')
+    for entry in entries:
+        sys.stdout.write((", " if count > 0 else "") + json.dumps(entry))
+        count = count + 1
+    sys.stdout.write("]}\n")
+    return count
+
+
+def write_status_table(items: list, results: list) -> int:
+    """
+    Write one line per item with the outcome of its request to stdout.
+
+    Args:
+        items (list)....: The names of the items.
+        results (list)..: The RESULT of each item.
+
+    Returns:
+        int: The highest return code of all items.
+    """
+    width = max([len("ITEM")] + [len(item) for item in items])
+    sys.stdout.write(f"{'ITEM':<{width}}  RC  {'STATUS':<10}  MESSAGE\n")
+    for item, result in zip(items, results):
+        if result.rc == 0:
+            status, message = (result.body or {}).get("status", ""), ""
+        else:
+            status, message = "failed", str(result.errors)
+        sys.stdout.write(f"{item:<{width}}  {result.rc:>2}  {status:<10}  {message}\n")
+    return max([result.rc for result in results], default=0)
+
+
+def scan_fleet(ctx: click.Context, client: s.SMS, instances: list, kinds: tuple, parallel: int | None) -> dict:
+    """
+    Run the missing updates queries of fleetscan. With aiohttp installed they
+    wait for their status monitors in one event loop (zosapi.aio), otherwise
+    in a thread each.
+
+    Args:
+        ctx (Context).....: The click context.
+        client (SMS)......: The client of the profile.
+        instances (list)..: (system nick name, software instance name) tuples.
+        kinds (tuple).....: "critical" and/or "fixcat".
+        parallel (int)....: Queries running at the same time, None for pool_maxsize.
+
+    Returns:
+        dict: One list of RESULTs per kind of updates, in the order of instances.
+    """
+    import asyncio
+
+    from zosapi import aio as A
+
+    verify = ctx.obj["VERIFY"]
+    try:
+        asession = A.ASYNC_SESSION(session=ctx.obj["SESSION"], limit_per_host=ctx.obj["SESSION"].pool_maxsize)
+    except ImportError as e:
+        ctx.obj["LOGGING"].debug(f"CMD-SOFTWARE-000D {e}, scanning with threads")
+        return client.scan_missing_updates(instances, updates=kinds, parallel=parallel, verify=verify)
+
+    aclient = A.ASYNC_SMS(
+        hostname=ctx.obj["HOST_NAME"],
+        protocol=ctx.obj["PROTOCOL"],
+        port=ctx.obj["PORT"],
+        username=ctx.obj["USER"],
+        password=ctx.obj["PASSWORD"],
+        cert_path=ctx.obj["CERT_PATH"],
+        session=asession,
+    )
+
+    async def scan() -> dict:
+        async with asession:
+            return await aclient.scan_missing_updates(instances, updates=kinds, parallel=parallel, verify=verify)
+
+    return asyncio.run(scan())
+
 
 # ------------------------------------------------------------------------------#
 # Define the software group                                                    #
@@ -91,6 +204,21 @@ def query_cli() -> None:
 @click.option(
     "--filter", "-fi", type=click.STRING, default="", help="Some filter criteria for the query."
 )
+@click.option(
+    "--refresh / --cached",
+    default=False,
+    show_default=True,
+    help="Query z/OSMF even if the result is cached (--refresh).",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["json", "jsonl", "csv", "fixed"]),
+    default="json",
+    show_default=True,
+    help="Write the z/OSMF response (json) or one line per entry (jsonl, csv delimited by ;, fixed-width).",
+)
 @click.pass_context
 def csids(
     ctx: click.Context,
@@ -99,6 +227,8 @@ def csids(
     entry: str,
     subentries: str,
     filter: str,
+    refresh: bool,
+    output_format: str,
 ):
     """
     Query SMP/E CSI data sets.
@@ -140,6 +270,9 @@ def csids(
     filter:
     \b
     The list of conditions with which to limit the entries to be returned
+    \b
+    Completed query results are cached for csi_cache_ttl seconds (zcli
+    properties in zcli.json), use --refresh to query z/OSMF again.
     """
 
     verify = ctx.obj["VERIFY"]
@@ -151,6 +284,20 @@ def csids(
     logging.debug(f"                               entry: {entry}")
     logging.debug(f"                          subentries: {subentries}")
     logging.debug(f"                              filter: {filter}")
+    logging.debug(f"                             refresh: {refresh}")
+    logging.debug(f"                              format: {output_format}")
+
+    try:
+        cache = K.CACHE(
+            directory=create_directory(CSI_CACHE_DIR),
+            ttl=float(CSI_CACHE_TTL),
+            max_bytes=int(float(CSI_CACHE_SIZE) * 1024 * 1024),
+        )
+    except ValueError:
+        raise click.BadParameter(
+            'CMD-SOFTWARE-001S Properties "csi_cache_ttl" and "csi_cache_size" in zcli.json must be numeric, unable to continue.',
+            param_hint=["zcli.json"],
+        )
 
     client = s.SMS(
         hostname=ctx.obj["HOST_NAME"],
@@ -159,19 +306,28 @@ def csids(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
-    errors, response = client.csiquery(
+    result = client.csiquery(
         global_name=global_csi,
         zones=zones,
         entries=entry,
         subentries=subentries,
         filter=filter,
         verify=verify,
+        cache=cache,
+        refresh=refresh,
     )
-    if errors:
-        sys.stderr.write(f"{str(errors)}\n")
+    if result.errors:
+        sys.stderr.write(f"{str(result.errors)}\n")
+        ctx.exit(result.errors["rc"])
+    elif output_format == "json":
+        for text in codecs.iterdecode(iter(lambda: result.stream.read(1024 * 1024), b""), "utf-8"):
+            sys.stdout.write(text)
+        sys.stdout.write("\n")
     else:
-        sys.stdout.write(f"{response.text}\n")
+        count = write_entries(client, s.iter_entries(result.stream), output_format)
+        logging.debug(f"CMD-SOFTWARE-000D {count} entries written")
 
 
 # ------------------------------------------------------------------------------#
@@ -205,6 +361,19 @@ def csids(
     mutually_exclusive=["swi_name", "nick_name"],
     help="The uuid representing the software instance.",
 )
+@click.option(
+    "--since",
+    "-s",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="A snapshot file, report only the items added or resolved since it was taken.",
+)
+@click.option(
+    "--save/ --no-save",
+    default=True,
+    show_default=True,
+    help="Replace the --since snapshot with this result.",
+)
 @click.option(
     "--tui/ --no-tui",
     required=False,
@@ -214,7 +383,13 @@ def csids(
 )
 @click.pass_context
 def critical_updates(
-    ctx: click.Context, nick_name: str, swi_name: str, uuid: str, tui: bool
+    ctx: click.Context,
+    nick_name: str,
+    swi_name: str,
+    uuid: str,
+    since: str,
+    save: bool,
+    tui: bool,
 ):
     """
     Get information about Missing Critical Updates.
@@ -231,6 +406,17 @@ def critical_updates(
                         OR
         - The software instance uuid
     \b
+    With --since only the changes against a snapshot file are reported, and
+    the snapshot is replaced with this result (unless --no-save). A daily run
+    with the same file reports what changed since the day before:
+    \b
+    ./zcli software query critupdates -nn <nickname> -sn <instance> --since <file>
+    \b
+    The report holds the new items in missingcriticalupdates, so --tui shows
+    only those, and the resolved items in resolved. An item whose target
+    zones changed lists only the changed zones. Snapshots are compressed JSON
+    and a snapshot of another host or instance is refused (rc 8).
+    \b
     NOTE:
     \b
     This command might take a considerable amount of time to complete, so be patient :-)
@@ -238,10 +424,12 @@ def critical_updates(
     verify = ctx.obj["VERIFY"]
     logging = ctx.obj["LOGGING"]
 
-    logging.debug("CMD-SOFTWARE-000D list() entered with:")
+    logging.debug("CMD-SOFTWARE-000D critical_updates() entered with:")
     logging.debug(f"                           nick name: {nick_name}")
     logging.debug(f"              software instance name: {swi_name}")
     logging.debug(f"                                uuid: {uuid}")
+    logging.debug(f"                               since: {since}")
+    logging.debug(f"                                save: {save}")
     logging.debug(f"                                 tui: {tui}")
 
     client = s.SMS(
@@ -251,17 +439,173 @@ def critical_updates(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
+
+    # A snapshot is only compared with the result of the same query
+    query = {
+        "host": ctx.obj["HOST_NAME"],
+        "instance": uuid if uuid != "" else f"{nick_name}/{swi_name}",
+    }
+    if since is not None:
+        try:
+            previous = SNAP.load_updates(since)
+        except ValueError as e:
+            sys.stderr.write(f"{e}\n")
+            ctx.exit(8)
+        different = [
+            f"{key} {previous.get(key)}"
+            for key, value in query.items()
+            if previous is not None and previous.get(key) != value
+        ]
+        if different != []:
+            sys.stderr.write(
+                f"CMD-SOFTWARE-003E {since} holds the missing updates of {', '.join(different)}, not of "
+                f"{', '.join(f'{key} {value}' for key, value in query.items())}, unable to compare\n"
+            )
+            ctx.exit(8)
+
     errors, response = client.missing_critical_updates(
         nickname=nick_name, instance=swi_name, uuid=uuid, verify=verify
     )
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
+
+    text = response.text
+    if since is not None:
+        current = response.json().get("missingcriticalupdates") or []
+        added, resolved, unchanged = client.holddata_delta(
+            [] if previous is None else previous["updates"], current
+        )
+        logging.debug(
+            f"CMD-SOFTWARE-000D {len(added)} added, {len(resolved)} resolved, {unchanged} unchanged"
+        )
+        text = json.dumps(
+            {
+                "since": None if previous is None else previous["created"],
+                "missingcriticalupdates": added,
+                "resolved": resolved,
+                "unchanged": unchanged,
+            }
+        )
+        if save:
+            SNAP.save_updates(since, current, **query)
+
+    if not tui:
+        sys.stdout.write(f"{text}\n")
     else:
-        if not tui:
-            sys.stdout.write(f"{response.text}\n")
-        else:
-            tui_sms_crit_updates.show_tui(response.text)
+        from tui.software import tui_sms_crit_updates
+
+        tui_sms_crit_updates.show_tui(text)
+
+
+# ------------------------------------------------------------------------------#
+# Define fleetscan command of the query subgroup of software group             #
+# ------------------------------------------------------------------------------#
+@query_cli.command(name="fleetscan", cls=HelpColorsCommand, help_options_color="blue")
+@click.option(
+    "--updates",
+    "-up",
+    type=click.Choice(["critical", "fixcat", "all"]),
+    default="all",
+    show_default=True,
+    help="The missing updates to look for.",
+)
+@click.option(
+    "--nick-name",
+    "-nn",
+    type=click.STRING,
+    default="",
+    help="Only scan the software instances of this system nick name.",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["json", "csv"]),
+    default="json",
+    show_default=True,
+    help="The format of the report.",
+)
+@click.option(
+    "--parallel",
+    "-p",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Queries running at the same time  [default: pool_maxsize of the profile]",
+)
+@click.pass_context
+def fleet_scan(
+    ctx: click.Context, updates: str, nick_name: str, output_format: str, parallel: int
+):
+    """
+    Scan all software instances for missing critical and FIXCAT updates.
+
+    \b
+    The missing updates queries of all software instances defined in z/OSMF
+    run at the same time. The results are merged into one report with one
+    entry per HOLDDATA item, listing the software instances and target
+    zones it affects.
+    \b
+    NOTE:
+    \b
+    This command might take a considerable amount of time to complete, so be patient :-)
+    """
+    verify = ctx.obj["VERIFY"]
+    logging = ctx.obj["LOGGING"]
+
+    logging.debug("CMD-SOFTWARE-000D fleet_scan() entered with:")
+    logging.debug(f"                             updates: {updates}")
+    logging.debug(f"                           nick name: {nick_name}")
+    logging.debug(f"                              format: {output_format}")
+    logging.debug(f"                            parallel: {parallel}")
+
+    client = s.SMS(
+        hostname=ctx.obj["HOST_NAME"],
+        protocol=ctx.obj["PROTOCOL"],
+        port=ctx.obj["PORT"],
+        username=ctx.obj["USER"],
+        password=ctx.obj["PASSWORD"],
+        cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
+    )
+    result = client.list_software_instances(verify=verify)
+    if result.rc != 0:
+        sys.stderr.write(f"{str(result.errors)}\n")
+        ctx.exit(result.rc)
+
+    instances = [
+        (instance["system"], instance["name"])
+        for instance in result.body.get("swilist") or []
+        if nick_name == "" or instance["system"] == nick_name
+    ]
+    logging.debug(f"CMD-SOFTWARE-000D Scanning {len(instances)} software instances")
+
+    kinds = ("critical", "fixcat") if updates == "all" else (updates,)
+    scans = scan_fleet(ctx, client, instances, kinds, parallel)
+
+    items: list = []
+    failed: list = []
+    for kind in kinds:
+        kind_items, kind_failed = client.merge_missing_updates(instances, scans[kind], kind)
+        items = items + kind_items
+        failed = failed + [dict(entry, updates=kind) for entry in kind_failed]
+
+    if output_format == "json":
+        report = {"instances": [f"{n}/{i}" for n, i in instances], "items": items, "failed": failed}
+        sys.stdout.write(f"{json.dumps(report)}\n")
+    else:
+        writer = csv.writer(sys.stdout)
+        writer.writerow(FLEET_SCAN_COLUMNS)
+        for item in items:
+            writer.writerow(
+                [item[c] if isinstance(item[c], str) else ";".join(item[c]) for c in FLEET_SCAN_COLUMNS]
+            )
+        for entry in failed:
+            sys.stderr.write(f"{entry['updates']} {entry['instance']}: {entry['errors']}\n")
+
+    ctx.exit(max([result.rc for kind in kinds for result in scans[kind]], default=0))
 
 
 # ------------------------------------------------------------------------------#
@@ -283,7 +627,7 @@ def critical_updates(
     type=click.STRING,
     default="",
     cls=MutuallyExclusiveOption,
-    mutually_exclusive=["uuid"],
+    mutually_exclusive=["uuid", "all_instances"],
     help="The name of the software instance.",
 )
 @click.option(
@@ -292,10 +636,41 @@ def critical_updates(
     type=click.STRING,
     default="",
     cls=MutuallyExclusiveOption,
-    mutually_exclusive=["swi_name", "nick_name"],
+    mutually_exclusive=["swi_name", "nick_name", "all_instances"],
     help="The uuid representing the software instance.",
 )
-@click.argument("sysmods", nargs=-1, required=True)
+@click.option(
+    "--all-instances",
+    "-a",
+    is_flag=True,
+    default=False,
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["swi_name", "uuid"],
+    help="Search all software instances, or all of the system nick name.",
+)
+@click.option(
+    "--sysmod-file",
+    "-sf",
+    type=click.File("r"),
+    default=None,
+    help="A file of SYSMODs separated by blanks, commas or new lines, # starts a comment.",
+)
+@click.option(
+    "--chunk-size",
+    "-cs",
+    type=click.IntRange(min=1),
+    default=s.SEARCH_CHUNK_SIZE,
+    show_default=True,
+    help="SYSMODs sent in one search request.",
+)
+@click.option(
+    "--parallel",
+    "-p",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Search requests running at the same time  [default: pool_maxsize of the profile]",
+)
+@click.argument("sysmods", nargs=-1, required=False)
 @click.option(
     "--tui/ --no-tui",
     required=False,
@@ -309,6 +684,10 @@ def software_updates(
     nick_name: str,
     swi_name: str,
     uuid: str,
+    all_instances: bool,
+    sysmod_file,
+    chunk_size: int,
+    parallel: int,
     sysmods: tuple[str, ...],
     tui: bool,
 ):
@@ -325,10 +704,19 @@ def software_updates(
         - The system nick name AND the software instance name
                         OR
         - The software instance uuid
+                        OR
+        - --all-instances, optionally with the system nick name
     \b
     ./zcli software query softupdates -nn <nickname> -sn <instance> SYSMODS
                         OR
     ./zcli software query softupdates -u <uuid> SYSMODS
+                        OR
+    ./zcli software query softupdates -a -sf <bulletin file>
+    \b
+    Long SYSMOD lists are split into requests of --chunk-size SYSMODs that run
+    at the same time, for all software instances searched. Their results are
+    merged into one report; with --all-instances every update is tagged with
+    the software instance it was found in.
     \b
     NOTE:
     \b
@@ -337,10 +725,18 @@ def software_updates(
     verify = ctx.obj["VERIFY"]
     logging = ctx.obj["LOGGING"]
 
-    logging.debug("CMD-SOFTWARE-000D list() entered with:")
+    if sysmod_file is not None:
+        for line in sysmod_file:
+            sysmods = sysmods + tuple(line.split("#")[0].replace(",", " ").split())
+
+    logging.debug("CMD-SOFTWARE-000D software_updates() entered with:")
     logging.debug(f"                           nick name: {nick_name}")
     logging.debug(f"              software instance name: {swi_name}")
     logging.debug(f"                                uuid: {uuid}")
+    logging.debug(f"                       all instances: {all_instances}")
+    logging.debug(f"                             sysmods: {len(sysmods)}")
+    logging.debug(f"                          chunk size: {chunk_size}")
+    logging.debug(f"                            parallel: {parallel}")
     logging.debug(f"                                 tui: {tui}")
 
     client = s.SMS(
@@ -350,17 +746,56 @@ def software_updates(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
-    errors, response = client.search_software_updates(
-        nickname=nick_name, instance=swi_name, uuid=uuid, sysmods=sysmods, verify=verify
-    )
-    if errors:
-        sys.stderr.write(f"{str(errors)}\n")
+
+    rc = 0
+    if not all_instances:
+        errors, response = client.search_software_updates(
+            nickname=nick_name,
+            instance=swi_name,
+            uuid=uuid,
+            sysmods=sysmods,
+            verify=verify,
+            chunk_size=chunk_size,
+            parallel=parallel,
+        )
+        if errors:
+            sys.stderr.write(f"{str(errors)}\n")
+            ctx.exit(errors["rc"])
+        text = response.text
     else:
-        if not tui:
-            sys.stdout.write(f"{response.text}\n")
-        else:
-            tui_sms_soft_updates.show_tui(response.text)
+        result = client.list_software_instances(verify=verify)
+        if result.rc != 0:
+            sys.stderr.write(f"{str(result.errors)}\n")
+            ctx.exit(result.rc)
+
+        instances = [
+            f"{instance['system']}/{instance['name']}"
+            for instance in result.body.get("swilist") or []
+            if nick_name == "" or instance["system"] == nick_name
+        ]
+        results = client.search_updates(
+            instances, sysmods, chunk_size=chunk_size, parallel=parallel, verify=verify
+        )
+
+        report: dict = {"instances": instances, "updates": [], "failed": []}
+        for instance, result in zip(instances, results):
+            if result.rc != 0:
+                report["failed"].append({"instance": instance, "errors": str(result.errors)})
+                rc = max(rc, result.rc)
+                continue
+            for update in result.body.get("updates") or []:
+                report["updates"].append(dict(update, instance=instance))
+        text = json.dumps(report)
+
+    if not tui:
+        sys.stdout.write(f"{text}\n")
+    else:
+        from tui.software import tui_sms_soft_updates
+
+        tui_sms_soft_updates.show_tui(text)
+    ctx.exit(rc)
 
 
 # ------------------------------------------------------------------------------#
@@ -441,16 +876,20 @@ def fixcat_updates(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.missing_fixcat_updates(
         nickname=nick_name, instance=swi_name, uuid=uuid, verify=verify
     )
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         if not tui:
             sys.stdout.write(f"{response.text}\n")
         else:
+            from tui.software import tui_sms_fixc_updates
+
             tui_sms_fixc_updates.show_tui(response.text)
 
 
@@ -532,11 +971,13 @@ def uuid(ctx: click.Context, nick_name: str):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.get_system_uuid(nickname=nick_name, verify=verify)
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -588,15 +1029,19 @@ def list(ctx: click.Context, pswi: bool = False, tui: bool = False):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.list_software_instances(pswi=pswi, verify=verify)
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         if not tui:
             sys.stdout.write(f"{response.text}\n")
         else:
+            from tui.software import tui_sms_list
+
             tui_sms_list.show_tui(response.text)
 
 
@@ -604,8 +1049,34 @@ def list(ctx: click.Context, pswi: bool = False, tui: bool = False):
 # Define the add instance subcommand of the instances group                    #
 # ------------------------------------------------------------------------------#
 @instances_cli.command(name="add", cls=HelpColorsCommand, help_options_color="blue")
+@click.option(
+    "--file-name",
+    "-fn",
+    type=click.STRING,
+    default="",
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["directory"],
+    help="File Name of the add input file.",
+)
+@click.option(
+    "--dir",
+    "-d",
+    "directory",
+    type=click.Path(exists=True, file_okay=False),
+    default=None,
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["file_name"],
+    help="Add every *.json input file of this directory.",
+)
+@click.option(
+    "--parallel",
+    "-p",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Instances added at the same time  [default: pool_maxsize of the profile]",
+)
 @click.pass_context
-def add(ctx: click.Context, file_name: str):
+def add(ctx: click.Context, file_name: str, directory: str, parallel: int):
     """
     Add a software instance to z/OSMF.
 
@@ -619,6 +1090,12 @@ def add(ctx: click.Context, file_name: str):
     \b
     ./zcli software instances add --file-name <full_path_to_your_file_name>
     \b
+    To add many instances at once, put one input file per instance into a
+    directory. They are added at the same time, --parallel at most, and a
+    status table with one line per file is written:
+    \b
+    ./zcli software instances add --dir <full_path_to_your_directory>
+    \b
     For a detailed description refer to:
     \b
     https://www.ibm.com/docs/en/zos/3.1.0?topic=services-add-new-software-instance
@@ -626,8 +1103,10 @@ def add(ctx: click.Context, file_name: str):
     verify = ctx.obj["VERIFY"]
     logging = ctx.obj["LOGGING"]
 
-    logging.debug("CMD-SOFTWARE-000D list() entered with:")
+    logging.debug("CMD-SOFTWARE-000D add() entered with:")
     logging.debug(f"                           file name: {file_name}")
+    logging.debug(f"                           directory: {directory}")
+    logging.debug(f"                            parallel: {parallel}")
 
     client = s.SMS(
         hostname=ctx.obj["HOST_NAME"],
@@ -636,10 +1115,23 @@ def add(ctx: click.Context, file_name: str):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
+
+    if directory is not None:
+        file_names = sorted(
+            os.path.join(directory, name)
+            for name in os.listdir(directory)
+            if name.endswith(".json")
+        )
+        logging.debug(f"CMD-SOFTWARE-000D Adding {len(file_names)} software instances")
+        results = client.add_software_instances(file_names, parallel=parallel, verify=verify)
+        ctx.exit(write_status_table([os.path.basename(name) for name in file_names], results))
+
     errors, response = client.add_software_instance(filename=file_name, verify=verify)
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -670,7 +1162,7 @@ def add(ctx: click.Context, file_name: str):
     type=click.STRING,
     default="",
     cls=MutuallyExclusiveOption,
-    mutually_exclusive=["uuid"],
+    mutually_exclusive=["uuid", "all_instances"],
     help="The name of the software instance",
 )
 @click.option(
@@ -679,12 +1171,35 @@ def add(ctx: click.Context, file_name: str):
     type=click.STRING,
     default="",
     cls=MutuallyExclusiveOption,
-    mutually_exclusive=["swi_name", "nick_name"],
+    mutually_exclusive=["swi_name", "nick_name", "all_instances"],
     help="The name of the software instance",
 )
+@click.option(
+    "--all",
+    "-a",
+    "all_instances",
+    is_flag=True,
+    default=False,
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["swi_name", "uuid"],
+    help="Export all software instances, or all of the system nick name.",
+)
+@click.option(
+    "--parallel",
+    "-p",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Instances exported at the same time  [default: pool_maxsize of the profile]",
+)
 @click.pass_context
 def export(
-    ctx: click.Context, file_name: str, nick_name: str, swi_name: str, uuid: str
+    ctx: click.Context,
+    file_name: str,
+    nick_name: str,
+    swi_name: str,
+    uuid: str,
+    all_instances: bool,
+    parallel: int,
 ):
     """
     Export a defined software instance.
@@ -713,6 +1228,13 @@ def export(
                         or
     ./zcli software instances export -fn <full_path_to_your_file_name> -u <instance_uuid>
     \b
+    --all exports every software instance, or every instance of the system
+    nick name, at the same time, --parallel at most, and writes a status table
+    with one line per instance. {nickname} and {instance} in the input file
+    are replaced by the nick name and name of each instance:
+    \b
+    ./zcli software instances export -fn <full_path_to_your_file_name> --all
+    \b
     For a detailed description refer to:
     \b
     https://www.ibm.com/docs/en/zos/3.1.0?topic=services-export-defined-software-instance
@@ -725,6 +1247,8 @@ def export(
     logging.debug(f"                           nick name: {nick_name}")
     logging.debug(f"              software instance name: {swi_name}")
     logging.debug(f"                                uuid: {uuid}")
+    logging.debug(f"                       all instances: {all_instances}")
+    logging.debug(f"                            parallel: {parallel}")
 
     client = s.SMS(
         hostname=ctx.obj["HOST_NAME"],
@@ -733,7 +1257,26 @@ def export(
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
+
+    if all_instances:
+        result = client.list_software_instances(verify=verify)
+        if result.rc != 0:
+            sys.stderr.write(f"{str(result.errors)}\n")
+            ctx.exit(result.rc)
+
+        instances = [
+            (instance["system"], instance["name"])
+            for instance in result.body.get("swilist") or []
+            if nick_name == "" or instance["system"] == nick_name
+        ]
+        logging.debug(f"CMD-SOFTWARE-000D Exporting {len(instances)} software instances")
+        results = client.export_software_instances(
+            file_name, instances, parallel=parallel, verify=verify
+        )
+        ctx.exit(write_status_table([f"{n}/{i}" for n, i in instances], results))
+
     errors, response = client.export_software_instance(
         filename=file_name,
         nick_name=nick_name,
@@ -748,6 +1291,7 @@ def export(
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -819,6 +1363,7 @@ def delete(ctx: click.Context, nick_name: str, swi_name: str, uuid: str):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.delete_software_instance(
         nick_name=nick_name, swi_name=swi_name, uuid=uuid, verify=verify
@@ -830,6 +1375,7 @@ def delete(ctx: click.Context, nick_name: str, swi_name: str, uuid: str):
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -894,6 +1440,7 @@ def siprops(ctx: click.Context, nick_name: str, swi_name: str, uuid: str):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.get_software_instance_properties(
         nick_name=nick_name, sw_name=swi_name, uuid=uuid, verify=verify
@@ -905,6 +1452,7 @@ def siprops(ctx: click.Context, nick_name: str, swi_name: str, uuid: str):
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -971,6 +1519,7 @@ def silistds(ctx: click.Context, nick_name: str, swi_name: str, uuid: str):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.get_software_instance_datasets(
         nick_name=nick_name, sw_name=swi_name, uuid=uuid, verify=verify
@@ -982,5 +1531,290 @@ def silistds(ctx: click.Context, nick_name: str, swi_name: str, uuid: str):
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
+
+
+# ------------------------------------------------------------------------------#
+# Define the csi subgroup of the software group                                #
+# ------------------------------------------------------------------------------#
+@software_cli.group(
+    name="csi",
+    cls=HelpColorsGroup,
+    help_headers_color="yellow",
+    help_options_color="green",
+)
+def csi_cli() -> None:
+    """
+    Work with local snapshots of SMP/E CSI data sets.
+
+    \b
+    A snapshot holds the entries of a global CSI in a local SQLite database,
+    so questions about SYSMODs, FMIDs and DDDEFs are answered without an
+    asynchronous CSI query on the host.
+    """
+    pass
+
+
+def snapshot_path(ctx: click.Context, global_csi: str, database: str) -> str:
+    """
+    Args:
+        ctx (click.Context): The context holding the profile name.
+        global_csi (str)...: The global CSI of the snapshot.
+        database (str).....: The database file given, "" for the default.
+
+    Returns:
+        str: The database file, by default <csi_cache>/<profile>.<global csi>.db
+    """
+    if database != "":
+        return database
+    return f"{create_directory(CSI_CACHE_DIR)}/{ctx.obj['PROFILE_NAME']}.{global_csi}.db"
+
+
+# ------------------------------------------------------------------------------#
+# Define the snapshot command of the csi subgroup of software group            #
+# ------------------------------------------------------------------------------#
+@csi_cli.command(name="snapshot", cls=HelpColorsCommand, help_options_color="blue")
+@click.option(
+    "--global-csi",
+    "-gc",
+    type=click.STRING,
+    default=GLOBAL_CSI,
+    show_default=True,
+    help="The name of the SMP/E Global CSI.",
+)
+@click.option(
+    "--zones",
+    "-z",
+    type=click.STRING,
+    default="*",
+    show_default=True,
+    help="One or more SMP/E Zone names, separated by comma.",
+)
+@click.option(
+    "--entries",
+    "-e",
+    type=click.STRING,
+    default="SYSMOD,DDDEF",
+    show_default=True,
+    help="Entry types to store, separated by comma.",
+)
+@click.option(
+    "--subentries",
+    "-se",
+    type=click.STRING,
+    default="*",
+    show_default=True,
+    help="Subentries to store, separated by comma.",
+)
+@click.option(
+    "--database", "-db", type=click.STRING, default="", help="The snapshot database file."
+)
+@click.pass_context
+def snapshot(
+    ctx: click.Context, global_csi: str, zones: str, entries: str, subentries: str, database: str
+):
+    """
+    Take a snapshot of a global CSI.
+
+    \b
+    One CSI query per entry type runs against z/OSMF, all at the same time.
+    The entries are stored in a SQLite database with one table per entry
+    type, replacing the entries of an earlier snapshot. If the query of an
+    entry type fails, its earlier entries are kept, the report lists it under
+    "failed" with "complete": false and the command ends with its rc.
+    """
+    verify = ctx.obj["VERIFY"]
+    logging = ctx.obj["LOGGING"]
+
+    logging.debug("CMD-SOFTWARE-000D snapshot() entered with:")
+    logging.debug(f"                          global csi: {global_csi}")
+    logging.debug(f"                               zones: {zones}")
+    logging.debug(f"                             entries: {entries}")
+    logging.debug(f"                          subentries: {subentries}")
+    logging.debug(f"                            database: {database}")
+
+    client = s.SMS(
+        hostname=ctx.obj["HOST_NAME"],
+        protocol=ctx.obj["PROTOCOL"],
+        port=ctx.obj["PORT"],
+        username=ctx.obj["USER"],
+        password=ctx.obj["PASSWORD"],
+        cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
+    )
+    entry_types = [entry.strip().upper() for entry in entries.split(",") if entry.strip() != ""]
+
+    def query(entrytype: str):
+        return client.csiquery(
+            global_name=global_csi,
+            zones=zones,
+            entries=entrytype,
+            subentries=subentries,
+            verify=verify,
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, len(entry_types))) as executor:
+        results = [*executor.map(query, entry_types)]
+
+    store = SNAP.SNAPSHOT(snapshot_path(ctx, global_csi, database))
+    failed: list = []
+    rc = 0
+    try:
+        for entrytype, result in zip(entry_types, results):
+            errors = result.errors
+            if result.rc == 0:
+                try:
+                    store.store(
+                        entrytype,
+                        s.iter_entries(result.stream),
+                        host=ctx.obj["HOST_NAME"],
+                        global_csi=global_csi,
+                        zones=zones,
+                    )
+                    continue
+                except Exception as e:
+                    # The result broke off while it was read, the earlier entries are kept
+                    errors = {"rc": 16, "request_error": e}
+            sys.stderr.write(f"{entrytype}: {str(errors)}\n")
+            failed.append({"entrytype": entrytype, "errors": {k: str(v) for k, v in errors.items()}})
+            rc = max(rc, errors["rc"])
+
+        report = {"database": store.path, "snapshot": store.info(), "complete": failed == [], "failed": failed}
+        sys.stdout.write(f"{json.dumps(report)}\n")
+    finally:
+        store.close()
+    ctx.exit(rc)
+
+
+# ------------------------------------------------------------------------------#
+# Define the query command of the csi subgroup of software group               #
+# ------------------------------------------------------------------------------#
+@csi_cli.command(name="query", cls=HelpColorsCommand, help_options_color="blue")
+@click.option(
+    "--global-csi",
+    "-gc",
+    type=click.STRING,
+    default=GLOBAL_CSI,
+    show_default=True,
+    help="The name of the SMP/E Global CSI.",
+)
+@click.option(
+    "--entry", "-e", type=click.STRING, default="SYSMOD", show_default=True, help="SMP/E entry type."
+)
+@click.option(
+    "--zones",
+    "-z",
+    type=click.STRING,
+    default="",
+    help="Zone names separated by comma  [default: all zones of the snapshot]",
+)
+@click.option(
+    "--name", "-n", type=click.STRING, default="", help="Entry name, * and ? are wildcards."
+)
+@click.option("--fmid", "-fm", type=click.STRING, default="", help="FMID, * and ? are wildcards.")
+@click.option(
+    "--local / --remote",
+    default=True,
+    show_default=True,
+    help="Query the snapshot (--local) or run a CSI query in z/OSMF (--remote).",
+)
+@click.option(
+    "--database", "-db", type=click.STRING, default="", help="The snapshot database file."
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["json", "jsonl", "csv", "fixed"]),
+    default="json",
+    show_default=True,
+    help="Write the entries as JSON, JSON Lines, csv delimited by ; or fixed-width.",
+)
+@click.pass_context
+def csi_query(
+    ctx: click.Context,
+    global_csi: str,
+    entry: str,
+    zones: str,
+    name: str,
+    fmid: str,
+    local: bool,
+    database: str,
+    output_format: str,
+):
+    """
+    Query the entries of a global CSI, by default from its snapshot.
+
+    \b
+    Examples:
+        zcli software csi query -e SYSMOD -fm HBB77D0 -n 'UA*'
+        zcli software csi query -e DDDEF -z MVST -f csv
+    \b
+    --remote queries z/OSMF with the same entry type and zones; --name and
+    --fmid are then applied to the result.
+    """
+    verify = ctx.obj["VERIFY"]
+    logging = ctx.obj["LOGGING"]
+
+    logging.debug("CMD-SOFTWARE-000D csi_query() entered with:")
+    logging.debug(f"                          global csi: {global_csi}")
+    logging.debug(f"                               entry: {entry}")
+    logging.debug(f"                               zones: {zones}")
+    logging.debug(f"                                name: {name}")
+    logging.debug(f"                                fmid: {fmid}")
+    logging.debug(f"                               local: {local}")
+
+    client = s.SMS(
+        hostname=ctx.obj["HOST_NAME"],
+        protocol=ctx.obj["PROTOCOL"],
+        port=ctx.obj["PORT"],
+        username=ctx.obj["USER"],
+        password=ctx.obj["PASSWORD"],
+        cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
+    )
+
+    if local:
+        path = snapshot_path(ctx, global_csi, database)
+        if not os.path.isfile(path):
+            sys.stderr.write(f"CMD-SOFTWARE-002E No snapshot {path}, run zcli software csi snapshot first\n")
+            ctx.exit(8)
+        store = SNAP.SNAPSHOT(path)
+        try:
+            count = write_entries(client, store.query(entry, zones=zones, name=name, fmid=fmid), output_format)
+        except ValueError as e:
+            sys.stderr.write(f"{str(e)}\n")
+            ctx.exit(8)
+        finally:
+            store.close()
+        logging.debug(f"CMD-SOFTWARE-000D {count} entries written")
+        return
+
+    result = client.csiquery(
+        global_name=global_csi,
+        zones=zones or "*",
+        entries=entry,
+        subentries="*",
+        verify=verify,
+    )
+    if result.errors:
+        sys.stderr.write(f"{str(result.errors)}\n")
+        ctx.exit(result.errors["rc"])
+
+    def matches(csi_entry: dict) -> bool:
+        if name != "" and not fnmatch.fnmatchcase(csi_entry["entryname"], name.upper()):
+            return False
+        if fmid == "":
+            return True
+        fmids = [
+            value if isinstance(value, str) else value[0]
+            for subentry in csi_entry.get("subentries") or []
+            if (value := subentry.get("FMID"))
+        ]
+        return any(fnmatch.fnmatchcase(value, fmid.upper()) for value in fmids)
+
+    entries = (e for e in s.iter_entries(result.stream) if matches(e))
+    count = write_entries(client, entries, output_format)
+    logging.debug(f"CMD-SOFTWARE-000D {count} entries written")
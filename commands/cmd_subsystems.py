@@ -57,6 +57,7 @@ def list(ctx: click.Context, name: str):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.get_subsystems(filter=name, verify=verify)
 
@@ -72,6 +72,7 @@ def get(ctx: click.Context, plex_name: str, system_name: str):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.get_system_variables(
         sysplex_name=plex_name, system_name=system_name, verify=verify
@@ -83,5 +84,6 @@ def get(ctx: click.Context, plex_name: str, system_name: str):
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
@@ -53,6 +53,7 @@ def groups(ctx: click.Context):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
 
     errors, response = client.get_topology_service(service="groups", verify=verify)
@@ -63,6 +64,7 @@ def groups(ctx: click.Context):
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -89,10 +91,12 @@ def sysplex(ctx: click.Context):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.get_topology_service(service="sysplexes", verify=verify)
     if errors:
         sys.stderr.write(str(errors))
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -146,6 +150,7 @@ def list(ctx: click.Context):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.get_topology_service(service="systems", verify=verify)
 
@@ -155,6 +160,7 @@ def list(ctx: click.Context):
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
     pass
@@ -182,10 +188,13 @@ def systems_in_group(ctx: click.Context, name: str, verify: bool = True):
         port=ctx.obj["PORT"],
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
+        cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.get_group_systems(group=name, verify=verify)
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(response.text)
 
@@ -212,10 +221,12 @@ def systems_in_sysplex(ctx: click.Context, name: str, verify: bool = True):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.get_group_systems(group=name, verify=verify)
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -262,12 +273,14 @@ def system(ctx: click.Context, name: str, verify: bool = True):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
 
     errors, response = client.validate_system(system=name, verify=verify)
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
 
@@ -292,11 +305,13 @@ def plex(ctx: click.Context, verify: bool = True):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
 
     errors, response = client.validate_plex(verify=verify)
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         sys.stdout.write(f"{response.text}\n")
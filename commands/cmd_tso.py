@@ -59,10 +59,12 @@ def command(ctx: click.Context, text: bool, command: str):
         username=ctx.obj["USER"],
         password=ctx.obj["PASSWORD"],
         cert_path=ctx.obj["CERT_PATH"],
+        session=ctx.obj["SESSION"],
     )
     errors, response = client.issue_tso_command(command, verify=verify)
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
+        ctx.exit(errors["rc"])
     else:
         if text:
             response_dict = json.loads(response.text)
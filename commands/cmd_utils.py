@@ -1,9 +1,16 @@
 import click
+import importlib
+import io
 import os
 import sys
 import json
+import logging
+import threading
 
 from click import Option, UsageError
+from click_help_colors import HelpColorsGroup
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
@@ -112,7 +119,40 @@ def get_profile_data(
 
     return value
 
-def process_response(errors: dict, response: dict, process_text: bool = False) -> None:
+def expand_profiles(config: dict, profiles: str) -> tuple[list, list]:
+    """_Resolve a comma separated list of profiles and profile groups_
+
+    Profile groups are defined in zcli.json as
+        "profile_groups": {"<group_name>": ["<profile_name>", ...]}
+
+    Args:
+        config (dict): _The configuration object (see command.cmd_utils(read_config)_
+        profiles (str): _Comma separated profile and group names_
+
+    Returns:
+        tuple[list, list]: _The profile names without duplicates, the names that are neither_
+    """
+    groups = config.get("profile_groups", {})
+    known = config.get("profiles", {})
+    names: list = []
+    unknown: list = []
+    for name in [name.strip() for name in profiles.split(",") if name.strip() != ""]:
+        if name in known:
+            members = [name]
+        elif name in groups:
+            members = groups[name]
+        else:
+            unknown.append(name)
+            continue
+        for member in members:
+            if member not in known:
+                unknown.append(member)
+            elif member not in names:
+                names.append(member)
+    return names, unknown
+
+
+def process_response(errors: dict, response: dict, process_text: bool = False) -> int:
     """
     Process the response from the API
 
@@ -122,12 +162,12 @@ def process_response(errors: dict, response: dict, process_text: bool = False) -
         process_text: bool: Process the
 
     Returns: 
-        None
+        int: The return code of the request, for ctx.exit()
     """
 
     if errors:
         sys.stderr.write(f"{str(errors)}\n")
-        if process_text:
+        if process_text and response is not None:
             response_dict = json.loads(response.text)
             sys.stderr.write(f"{response_dict["message"]}\n")
             for utility_details in response_dict["details"]:
@@ -135,9 +175,11 @@ def process_response(errors: dict, response: dict, process_text: bool = False) -
                 for detail in details:
                     sys.stderr.write(f"{detail}\n")
 
-    if response.text != "":
+    if response is not None and response.text != "":
         sys.stdout.write(f"{response.text}\n")
 
+    return errors.get("rc", 8) if errors else 0
+
 
 class MutuallyExclusiveOption(Option):
     """_Implements click mutally exclusive options_
@@ -167,6 +209,288 @@ class MutuallyExclusiveOption(Option):
         return super(MutuallyExclusiveOption, self).handle_parse_result(ctx, opts, args)
 
 
+class LazyGroup(HelpColorsGroup):
+    """_Implements a click group that imports its subcommands on first use_
+
+    Args:
+        HelpColorsGroup (click.Group): Group class from click_help_colors
+    """
+
+    def __init__(self, *args, **kwargs):
+        # Maps the command name to "<module path>.<command object name>"
+        self.lazy_subcommands = kwargs.pop("lazy_subcommands", {})
+        super(LazyGroup, self).__init__(*args, **kwargs)
+
+    def parse_args(self, ctx, args):
+        rest = super(LazyGroup, self).parse_args(ctx, args)
+        # Kept for group callbacks that run the subcommand line themselves
+        ctx.meta["subcommand_args"] = [*ctx.protected_args, *ctx.args]
+        return rest
+
+    def list_commands(self, ctx):
+        base = super(LazyGroup, self).list_commands(ctx)
+        return sorted(base + [name for name in self.lazy_subcommands if name not in base])
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self.load_command(cmd_name), cmd_name)
+        return super(LazyGroup, self).get_command(ctx, cmd_name)
+
+    def load_command(self, cmd_name):
+        module_name, object_name = self.lazy_subcommands[cmd_name].rsplit(".", 1)
+        command = getattr(importlib.import_module(module_name), object_name)
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"ZCLI-UTILS-001S Lazy loading of {self.lazy_subcommands[cmd_name]} returned {type(command)}, expected a click.Command"
+            )
+        return command
+
+
+class ThreadLocalStream:
+    """_Stands in for sys.stdout / sys.stderr while commands run in-process_
+
+    Writes go to the buffer of the current thread while capture_output() is
+    active in it, and to the original stream otherwise, so several commands can
+    run concurrently without mixing their output.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def target(self):
+        return getattr(self.local, "buffer", None) or self.stream
+
+    def write(self, text: str) -> int:
+        return self.target().write(text)
+
+    def flush(self) -> None:
+        self.target().flush()
+
+    def isatty(self) -> bool:
+        return self.target().isatty()
+
+    def __getattr__(self, name: str):
+        return getattr(self.stream, name)
+
+
+class ThreadLogLevel(logging.Filter):
+    """_Log level per thread for commands run in-process_
+
+    The root logger is lowered to DEBUG while any thread wants debug messages,
+    this filter on its handlers drops the records of the other threads that
+    are below the level set for the process.
+    """
+
+    def __init__(self, level: int):
+        super(ThreadLogLevel, self).__init__()
+        self.level = level
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.debugging = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= getattr(self.local, "level", self.level)
+
+    def debug(self) -> None:
+        """_Log the debug messages of the current thread until reset()_"""
+        with self.lock:
+            if getattr(self.local, "level", None) is None:
+                self.debugging = self.debugging + 1
+            self.local.level = logging.DEBUG
+            logging.getLogger().setLevel(logging.DEBUG)
+
+    def reset(self) -> None:
+        """_Back to the level of the process for the current thread_"""
+        with self.lock:
+            if getattr(self.local, "level", None) is None:
+                return
+            del self.local.level
+            self.debugging = self.debugging - 1
+            if self.debugging == 0:
+                logging.getLogger().setLevel(self.level)
+
+
+THREAD_LOG_LEVEL: ThreadLogLevel | None = None
+
+
+def install_thread_local_streams() -> None:
+    """_Replace sys.stdout and sys.stderr by ThreadLocalStream, once per process_
+
+    Logging handlers writing to the original stderr are pointed at the new one,
+    so log records of a captured command end up in its stderr, and get the
+    ThreadLogLevel filter.
+    """
+    global THREAD_LOG_LEVEL
+    if isinstance(sys.stdout, ThreadLocalStream):
+        return
+    stderr = sys.stderr
+    sys.stdout = ThreadLocalStream(sys.stdout)
+    sys.stderr = ThreadLocalStream(stderr)
+    root = logging.getLogger()
+    THREAD_LOG_LEVEL = ThreadLogLevel(root.level)
+    for handler in root.handlers:
+        if isinstance(handler, logging.StreamHandler) and handler.stream is stderr:
+            handler.setStream(sys.stderr)
+        handler.addFilter(THREAD_LOG_LEVEL)
+
+
+def debug_logging() -> None:
+    """_Log debug messages for the running command_
+
+    A command run in-process (see invoke_command()) only lowers the level of
+    its own thread, so the commands running next to it keep theirs.
+    """
+    if THREAD_LOG_LEVEL is not None and getattr(sys.stderr.local, "buffer", None) is not None:
+        THREAD_LOG_LEVEL.debug()
+    else:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+
+@contextmanager
+def capture_output():
+    """_Collect what the current thread writes to sys.stdout and sys.stderr_
+
+    Yields:
+        tuple: _The stdout and stderr io.StringIO buffers_
+    """
+    install_thread_local_streams()
+    stdout, stderr = io.StringIO(), io.StringIO()
+    sys.stdout.local.buffer = stdout
+    sys.stderr.local.buffer = stderr
+    try:
+        yield stdout, stderr
+    finally:
+        sys.stdout.local.buffer = None
+        sys.stderr.local.buffer = None
+
+
+class WORKDIR:
+    """_The current directory shared by the commands run in-process_
+
+    os.chdir() changes the directory of every thread, so a command for another
+    directory waits until no command runs before it switches. While it waits no
+    new command for the current directory starts, so it does not wait forever.
+    """
+
+    def __init__(self):
+        self.path = os.getcwd()
+        self.active = 0
+        self.waiting: dict = {}
+        self.condition = threading.Condition()
+
+    def ready(self, path: str) -> bool:
+        if path != self.path:
+            return self.active == 0
+        return not any(other != self.path for other in self.waiting)
+
+    @contextmanager
+    def use(self, path: str | None = None):
+        """_Run the block in directory path_
+
+        None keeps whatever directory is current without waiting, for commands
+        started by a running one (invoke_commands()), which already holds it.
+        """
+        if path is None:
+            yield
+            return
+        with self.condition:
+            self.waiting[path] = self.waiting.get(path, 0) + 1
+            try:
+                self.condition.wait_for(lambda: self.ready(path))
+            finally:
+                self.waiting[path] = self.waiting[path] - 1
+                if self.waiting[path] == 0:
+                    del self.waiting[path]
+            if path != self.path:
+                try:
+                    os.chdir(path)
+                finally:
+                    self.path = os.getcwd()
+                    self.condition.notify_all()
+            self.active = self.active + 1
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.active = self.active - 1
+                self.condition.notify_all()
+
+
+CURRENT_WORKDIR = WORKDIR()
+
+
+def invoke_command(
+    command: click.Command,
+    argv: list,
+    color: bool | None = False,
+    cwd: str | None = None,
+) -> tuple[int, str, str]:
+    """_Run a zcli command line in-process and capture its output_
+
+    Args:
+        command (click.Command): _The root command (zcli.py main)_
+        argv (list): _The arguments, without the program name_
+        color (bool | None): _Force colored output on or off, None decides per stream (default False)_
+        cwd (str | None): _Directory relative paths of the command line are based on, None to run in the current one (see WORKDIR)_
+
+    Returns:
+        tuple[int, str, str]: _Return code, stdout and stderr of the command_
+    """
+    try:
+        with CURRENT_WORKDIR.use(cwd), capture_output() as (stdout, stderr):
+            try:
+                rc = command.main(
+                    args=list(argv),
+                    prog_name="zcli",
+                    obj={},
+                    auto_envvar_prefix="ZCLI",
+                    color=color,
+                    standalone_mode=False,
+                )
+            except click.ClickException as e:
+                e.show()
+                rc = e.exit_code
+            except click.Abort:
+                sys.stderr.write("Aborted!\n")
+                rc = 1
+            except SystemExit as e:
+                rc = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except Exception as e:
+                sys.stderr.write(f"ZCLI-UTILS-002S {argv} failed with {type(e).__name__}: {e}\n")
+                rc = 16
+            finally:
+                THREAD_LOG_LEVEL.reset()
+            if not isinstance(rc, int):
+                rc = 0
+    except OSError as e:
+        return 16, "", f"ZCLI-UTILS-003E Unable to change to directory {cwd}: {e}\n"
+    return rc, stdout.getvalue(), stderr.getvalue()
+
+
+def invoke_commands(
+    command: click.Command, argvs: list, parallel: int, ordered: bool = True
+):
+    """_Run zcli command lines concurrently in-process, see invoke_command()_
+
+    Args:
+        command (click.Command): _The root command (zcli.py main)_
+        argvs (list): _One argument list per command line_
+        parallel (int): _Number of command lines run at the same time_
+        ordered (bool): _Yield in the order of argvs, else as the commands end (default True)_
+
+    Yields:
+        tuple[int, tuple[int, str, str]]: _Index into argvs and the result of invoke_command()_
+    """
+    with ThreadPoolExecutor(max_workers=max(1, parallel)) as executor:
+        futures = {
+            executor.submit(invoke_command, command, argv): index
+            for index, argv in enumerate(argvs)
+        }
+        for future in futures if ordered else as_completed(futures):
+            yield futures[future], future.result()
+
+
 class RequiredIfOption(Option):
     """_Implements click requiredIf options_
 
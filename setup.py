@@ -15,4 +15,7 @@ setup(
         'click-help-colors==0.9.4',
         'urllib3==2.2.3',
     ],
+    extras_require={
+        'async': ['aiohttp==3.14.5'],
+    },
 )
\ No newline at end of file
@@ -0,0 +1,86 @@
+import asyncio
+import json
+
+import pytest
+
+from zosapi import client as C
+from zosapi import datasets as D
+from zosapi import software as S
+
+A = pytest.importorskip("zosapi.aio")
+pytest.importorskip("aiohttp")
+
+CLIENT = dict(protocol="https", hostname="h", username="u", password="p", port="443", cert_path="")
+
+
+def sent(client, call, is_async: bool) -> list:
+    """The requests a call of a sync or async client method sends"""
+    requests: list = []
+
+    def request(method, url, expected=(200,), headers=None, data=None, **kwargs):
+        requests.append((method, url, headers, data))
+        return C.RESULT(0, {}, C.build_response(200, b'{"status": "complete"}', url=url))
+
+    async def async_request(*args, **kwargs):
+        return request(*args, **kwargs)
+
+    client.request = async_request if is_async else request
+    if is_async:
+        asyncio.run(call(client))
+    else:
+        call(client)
+    return requests
+
+
+@pytest.fixture(autouse=True)
+def cert(monkeypatch):
+    monkeypatch.delenv("SSL_CERT_FILE", raising=False)
+
+
+def test_members_list():
+    def call(client):
+        return client.zosapi_datasets_members_list("A.PDS", pattern="X*")
+
+    sync = sent(D.DATASETS(**CLIENT), call, False)
+    asynchronous = sent(A.ASYNC_DATASETS(**CLIENT), call, True)
+
+    assert sync == asynchronous
+    assert sync[0][1] == "https://h:443/zosmf/restfiles/ds/A.PDS/member?pattern=X*"
+
+
+def test_csiquery():
+    def call(client):
+        return client.csiquery("SMPE.GLOBAL.CSI", "TGT1", "SYSMOD", "*", "FMID='X'")
+
+    def post(requests):
+        return [request for request in requests if request[0] == "POST"]
+
+    sync, asynchronous = S.SMS(**CLIENT), A.ASYNC_SMS(**CLIENT)
+    # No status monitor, the POST is all that is compared
+    sync.wait_for_status = lambda response, verify=True, stream=False: C.RESULT(0, {}, response)
+
+    async def wait_for_status(response, verify=True):
+        return C.RESULT(0, {}, response)
+
+    asynchronous.wait_for_status = wait_for_status
+
+    requests = post(sent(sync, call, False))
+    assert requests == post(sent(asynchronous, call, True))
+    assert json.loads(requests[0][3])["filter"] == "FMID='X'"
+
+
+def test_scan_missing_updates():
+    instances = [("SYS1", "ZOS31"), ("SYS2", "ZOS31")]
+
+    def call(client):
+        return client.scan_missing_updates(instances, updates=("critical", "fixcat"))
+
+    sync, asynchronous = S.SMS(**CLIENT), A.ASYNC_SMS(**CLIENT)
+    sync.wait_for_status = lambda response, verify=True: C.RESULT(0, {}, response)
+
+    async def wait_for_status(response, verify=True):
+        return C.RESULT(0, {}, response)
+
+    asynchronous.wait_for_status = wait_for_status
+
+    assert sorted(sent(sync, call, False)) == sorted(sent(asynchronous, call, True))
@@ -0,0 +1,60 @@
+import io
+import json
+
+import pytest
+import requests
+from urllib3.response import HTTPResponse
+
+from zosapi import client as C
+
+ENTRIES = [{"name": f"UJ{n:05}", "text": '"status": "running" {[' * 10} for n in range(2000)]
+
+
+def streamed(content: bytes) -> requests.Response:
+    """A response whose body has not been read, like one sent with stream=True"""
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = HTTPResponse(body=io.BytesIO(content), preload_content=False)
+    return response
+
+
+@pytest.mark.parametrize("first", [True, False])
+def test_body_value(first):
+    document = {"entries": ENTRIES, "status": "complete"}
+    if first:
+        document = {"status": "complete", "entries": ENTRIES}
+    content = json.dumps(document).encode()
+    body = C.BODY(streamed(content))
+
+    assert body.value("status", size=16) == "complete"
+    assert len(body.head) < len(content) if first else len(body.head) == len(content)
+    with pytest.raises(KeyError):
+        body.value("name")
+    assert body.read(5) + body.read() == content
+
+
+def test_body_value_number():
+    body = C.BODY(streamed(b'{"count": 12345}'))
+    assert body.value("count", size=13) == 12345
+
+
+def test_body_content():
+    content = b'{"status": "complete", "entries": [1, 2]}'
+    response = streamed(content)
+    body = C.BODY(response)
+
+    assert body.peek(4) == b'{"st'
+    assert body.read(2) == b'{"'
+    assert body.content() == content
+    assert response.json() == {"status": "complete", "entries": [1, 2]}
+    assert body.read() == content
+
+
+def test_result_body():
+    result = C.RESULT(0, {}, streamed(b'{"status": "complete"}'))
+
+    assert result.stream.value("status") == "complete"
+    assert result.body == {"status": "complete"}
+    assert result.body is result.body
+    assert C.RESULT(0, {}, C.build_response(200, b"text")).body == "text"
+    assert C.RESULT(16, {"rc": 16}).stream is None
@@ -0,0 +1,44 @@
+import pytest
+
+from commands import cmd_socket as k
+
+
+@pytest.mark.parametrize(
+    "argv, words, rest",
+    [
+        (["jobs", "list", "--owner", "daemon"], ["jobs", "list"], ["--owner", "daemon"]),
+        (["-pn", "batch", "--debug", "jobs", "follow"], ["jobs", "follow"], []),
+        (["--profile-name=prod", "--no-verify", "info"], ["info"], []),
+        (["--profiles", "lab", "batch", "lines.txt", "-p", "4"], ["batch", "lines.txt"], ["-p", "4"]),
+        (["--debug"], [], []),
+        ([], [], []),
+    ],
+)
+def test_split_command(argv, words, rest):
+    assert k.split_command(argv) == (words, rest)
+
+
+@pytest.mark.parametrize(
+    "argv, local",
+    [
+        (["daemon", "status"], True),
+        (["-pn", "prod", "daemon", "stop"], True),
+        (["jobs", "list", "--tui"], True),
+        (["info", "--tui=yes"], True),
+        (["jobs", "list", "--owner", "daemon"], False),
+        (["datasets", "list", "-dl", "batch"], False),
+        (["-pn", "daemon", "info"], False),
+        (["jobs", "follow", "-jn", "A", "-ji", "JOB1"], True),
+        (["--debug", "jobs", "run", "-fn", "a.jcl"], True),
+        (["jobs", "submit-many", "many.json"], True),
+        (["jobs", "submit", "-fn", "a.jcl", "--wait"], True),
+        (["jobs", "submit", "-fn", "a.jcl", "--no-wait"], False),
+        (["jobs", "submit", "-fn", "a.jcl"], False),
+        (["jobs", "files", "-fi", "2", "--tail=10"], True),
+        (["jobs", "files", "-fi", "2", "-r", "0-9"], True),
+        (["jobs", "files", "-fi", "2"], False),
+        (["jobs", "list", "-r", "1"], False),
+    ],
+)
+def test_matches(argv, local):
+    assert k.matches(argv, k.LOCAL_ONLY) is local
@@ -0,0 +1,70 @@
+import os
+import threading
+
+import pytest
+
+from commands import cmd_utils as u
+
+
+def test_workdir(tmp_path):
+    first, second = str(tmp_path / "first"), str(tmp_path / "second")
+    os.mkdir(first)
+    os.mkdir(second)
+    cwd = os.getcwd()
+    workdir = u.WORKDIR()
+    order: list = []
+    release = threading.Event()
+
+    def run(path: str, name: str, wait: bool = False):
+        with workdir.use(path):
+            order.append((name, os.getcwd()))
+            if wait:
+                release.wait(5)
+
+    def waiting(count: int) -> bool:
+        with workdir.condition:
+            return sum(workdir.waiting.values()) == count
+
+    try:
+        running = threading.Thread(target=run, args=(first, "running", True))
+        running.start()
+        while workdir.active == 0:
+            threading.Event().wait(0.01)
+
+        # Commands for the current directory run next to the running one
+        run(first, "same")
+        run(None, "nested")
+
+        other = threading.Thread(target=run, args=(second, "other"))
+        other.start()
+        while not waiting(1):
+            threading.Event().wait(0.01)
+        # Once a command waits for another directory, the current one is closed
+        late = threading.Thread(target=run, args=(first, "late"))
+        late.start()
+        while not waiting(2):
+            threading.Event().wait(0.01)
+
+        release.set()
+        for thread in (running, other, late):
+            thread.join(5)
+    finally:
+        os.chdir(cwd)
+
+    assert order == [
+        ("running", first),
+        ("same", first),
+        ("nested", first),
+        ("other", second),
+        ("late", first),
+    ]
+    assert workdir.active == 0 and workdir.waiting == {}
+
+
+def test_workdir_missing(tmp_path):
+    cwd = os.getcwd()
+    workdir = u.WORKDIR()
+    with pytest.raises(OSError):
+        with workdir.use(str(tmp_path / "missing")):
+            pass
+    assert workdir.path == cwd and workdir.active == 0 and workdir.waiting == {}
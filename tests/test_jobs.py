@@ -0,0 +1,181 @@
+import json
+import os
+
+import pytest
+
+from zosapi import cache as K
+from zosapi import client as C
+from zosapi import jobs as j
+
+
+@pytest.mark.parametrize(
+    "retcode, rc",
+    [
+        ("CC 0000", 0),
+        ("CC 0004", 4),
+        (" CC 12 ", 12),
+        ("CC 9999", 255),
+        (None, 0),
+        ("", 0),
+        ("ABEND S0C4", 16),
+        ("ABEND U4038", 16),
+        ("JCL ERROR", 16),
+        ("SEC ERROR", 16),
+        ("CANCELED", 16),
+    ],
+)
+def test_return_code(retcode, rc):
+    assert j.return_code(retcode) == rc
+
+
+def test_max_step_rc():
+    job = {
+        "retcode": "CC 0004",
+        "step-data": [{"completion": "CC 0000"}, {"completion": "CC 0008"}, {"completion": None}],
+    }
+    assert j.max_step_rc(job) == 8
+    assert j.max_step_rc({"retcode": "JCL ERROR"}) == 16
+    assert j.max_step_rc({"retcode": "CC 0004", "step-data": []}) == 4
+
+
+@pytest.mark.parametrize(
+    "record_range, expected",
+    [
+        ("0-9", (0, 10)),
+        ("5-5", (5, 6)),
+        ("10,5", (10, 15)),
+        ("10,0", (10, 10)),
+        ("7-", (7, None)),
+        ("7,", (7, None)),
+        (" 3 - 4 ", (3, 5)),
+    ],
+)
+def test_parse_record_range(record_range, expected):
+    assert j.parse_record_range(record_range) == expected
+
+
+@pytest.mark.parametrize("record_range", ["", "5", "-3", "a-b", "1-2-3", "1;2", "1.5-2"])
+def test_parse_record_range_invalid(record_range):
+    with pytest.raises(ValueError, match="JOBS-009E"):
+        j.parse_record_range(record_range)
+
+
+def write_manifest(tmp_path, manifest) -> str:
+    path = tmp_path / "manifest.json"
+    path.write_text(manifest if isinstance(manifest, str) else json.dumps(manifest))
+    return str(path)
+
+
+def test_read_job_manifest(tmp_path):
+    path = write_manifest(
+        tmp_path,
+        {
+            "jobs": [
+                {"name": "A", "file": "a.jcl"},
+                {"name": "B", "file": "sub/b.jcl", "after": {"A": 4}},
+                {"file": "/abs/c.jcl", "after": ["A", "B"]},
+            ]
+        },
+    )
+
+    jobs = j.read_job_manifest(path)
+
+    assert [job["name"] for job in jobs] == ["A", "B", "/abs/c.jcl"]
+    assert jobs[0]["file"] == os.path.join(str(tmp_path), "a.jcl")
+    assert jobs[1]["file"] == os.path.join(str(tmp_path), "sub/b.jcl")
+    assert jobs[2]["file"] == "/abs/c.jcl"
+    assert jobs[0]["after"] == {}
+    assert jobs[1]["after"] == {"A": 4}
+    assert jobs[2]["after"] == {"A": 0, "B": 0}
+
+
+@pytest.mark.parametrize(
+    "manifest, message",
+    [
+        ("{not json", "is not a job manifest"),
+        ({"job": []}, "is not a job manifest"),
+        ({"jobs": [{"name": "A"}]}, "is not a job manifest"),
+        ({"jobs": [{"name": "A", "file": "a.jcl", "after": {"B": "x"}}, {"name": "B", "file": "b"}]}, "is not a job manifest"),
+        ({"jobs": [{"name": "A", "file": "a.jcl"}, {"name": "A", "file": "b.jcl"}]}, "defined more than once"),
+        ({"jobs": [{"name": "A", "file": "a.jcl", "after": ["X"]}]}, "waits for X, which is not defined"),
+        ({"jobs": [{"name": "A", "file": "a.jcl", "after": ["A"]}]}, "jobs A wait for each other"),
+        (
+            {
+                "jobs": [
+                    {"name": "A", "file": "a.jcl"},
+                    {"name": "B", "file": "b.jcl", "after": ["A", "D"]},
+                    {"name": "C", "file": "c.jcl", "after": ["B"]},
+                    {"name": "D", "file": "d.jcl", "after": {"C": 4}},
+                    {"name": "E", "file": "e.jcl", "after": ["D"]},
+                ]
+            },
+            "jobs B, C, D, E wait for each other",
+        ),
+    ],
+)
+def test_read_job_manifest_invalid(tmp_path, manifest, message):
+    with pytest.raises(ValueError, match="JOBS-014E") as error:
+        j.read_job_manifest(write_manifest(tmp_path, manifest))
+    assert message in str(error.value)
+
+
+def test_read_job_manifest_missing(tmp_path):
+    with pytest.raises(ValueError, match="JOBS-014E"):
+        j.read_job_manifest(str(tmp_path / "missing.json"))
+
+
+def test_read_job_manifest_diamond(tmp_path):
+    path = write_manifest(
+        tmp_path,
+        {
+            "jobs": [
+                {"name": "D", "file": "d.jcl", "after": ["B", "C"]},
+                {"name": "B", "file": "b.jcl", "after": ["A"]},
+                {"name": "C", "file": "c.jcl", "after": ["A"]},
+                {"name": "A", "file": "a.jcl"},
+            ]
+        },
+    )
+    assert [job["name"] for job in j.read_job_manifest(path)] == ["D", "B", "C", "A"]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.delenv("SSL_CERT_FILE", raising=False)
+    return j.JOBS(protocol="https", hostname="h", username="u", password="p", port="443", cert_path="")
+
+
+def test_records_cache(tmp_path, monkeypatch, client):
+    cache = K.CACHE(str(tmp_path), ttl=0)
+    jobs = [{"jobname": "A", "jobid": "JOB1", "job-correlator": "J1", "retcode": "CC 0000", "status": "OUTPUT"}]
+    lookups: list = []
+    requests: list = []
+
+    def completed_job(jobname, jobid, correlator, verify=True):
+        lookups.append((jobname, jobid, correlator))
+        return jobs[-1]
+
+    def request(method, url, **kwargs):
+        requests.append(url)
+        response = C.build_response(200, f"spool of {jobs[-1]['job-correlator']}\n".encode(), url=url)
+        return C.RESULT(0, {}, response)
+
+    monkeypatch.setattr(client, "completed_job", completed_job)
+    monkeypatch.setattr(client, "request", request)
+
+    def records(**kwargs):
+        return client.records("url", "2", cache=cache, **kwargs).response.content
+
+    assert records(jobname="A", jobid="JOB1") == b"spool of J1\n"
+    assert records(jobname="A", jobid="JOB1") == b"spool of J1\n"
+    assert (len(lookups), len(requests)) == (2, 1)
+
+    # The job was found under its correlator before, no request at all
+    assert records(correlator="J1") == b"spool of J1\n"
+    assert (len(lookups), len(requests)) == (2, 1)
+
+    # JOB1 was purged and its job id given to a new job
+    jobs.append({"jobname": "A", "jobid": "JOB1", "job-correlator": "J2", "retcode": "CC 0004", "status": "OUTPUT"})
+    assert records(jobname="A", jobid="JOB1") == b"spool of J2\n"
+    assert records(correlator="J1") == b"spool of J1\n"
+    assert (len(lookups), len(requests)) == (3, 2)
@@ -0,0 +1,134 @@
+import io
+import json
+
+import pytest
+
+from zosapi import cache as K
+from zosapi import client as C
+from zosapi import software as s
+
+ENTRIES = [
+    {"name": "UJ00001", "text": "a ] b , c"},
+    {"name": "UJ00002", "text": "Grüße é€\U0001f600", "zones": ["TGT1", "TGT2"]},
+    {"name": "UJ00003", "nested": {"entries": [1, 2]}, "text": "\"quoted\" [x]"},
+]
+
+DOCUMENT = json.dumps({"status": "complete", "entries": ENTRIES, "more": [1]}, ensure_ascii=False)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 64, 1024 * 1024])
+def test_iter_entries_bytes(chunk_size):
+    stream = io.BytesIO(DOCUMENT.encode("utf-8"))
+    assert list(s.iter_entries(stream, chunk_size=chunk_size)) == ENTRIES
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1024])
+def test_iter_entries_text(chunk_size):
+    stream = io.StringIO(DOCUMENT)
+    assert list(s.iter_entries(stream, chunk_size=chunk_size)) == ENTRIES
+
+
+def test_iter_entries_key():
+    stream = io.BytesIO(b'{"items" : [ 1 , 2,3 ]}')
+    assert list(s.iter_entries(stream, key="items", chunk_size=2)) == [1, 2, 3]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 4])
+def test_iter_entries_numbers(chunk_size):
+    stream = io.BytesIO(b'{"entries": [12345, -6.5e3, true, null, "x"]}')
+    assert list(s.iter_entries(stream, chunk_size=chunk_size)) == [12345, -6500.0, True, None, "x"]
+
+
+def test_iter_entries_empty():
+    assert list(s.iter_entries(io.BytesIO(b'{"entries": [ ]}'), chunk_size=1)) == []
+
+
+def test_iter_entries_missing_key():
+    assert list(s.iter_entries(io.BytesIO(b'{"status": "complete"}'), chunk_size=3)) == []
+
+
+@pytest.mark.parametrize("document", [b'{"entries": [{"name": "a"}, {"na', b'{"entries": [1, 2'])
+def test_iter_entries_incomplete(document):
+    entries = s.iter_entries(io.BytesIO(document), chunk_size=4)
+    with pytest.raises(ValueError, match="SMS-008E"):
+        list(entries)
+
+
+@pytest.fixture
+def sms(monkeypatch):
+    monkeypatch.delenv("SSL_CERT_FILE", raising=False)
+    return s.SMS(protocol="https", hostname="h", username="u", password="p", port="443", cert_path="")
+
+
+def update(name, *zones, holdclass="HIPER"):
+    return {"name": name, "holdclass": holdclass, "heldsysmod": "UJ" + name, "fmid": "HBB77C0", "tgtzones": [*zones]}
+
+
+def test_holddata_delta(sms):
+    previous = [update("A1", "TGT1"), update("B1", "TGT1", "TGT2"), update("C1", "TGT1")]
+    current = [update("A1", "TGT1"), update("B1", "TGT2", "TGT3"), update("D1", "TGT1")]
+
+    added, resolved, unchanged = sms.holddata_delta(previous, current)
+
+    assert added == [update("B1", "TGT3"), update("D1", "TGT1")]
+    assert resolved == [update("B1", "TGT1"), update("C1", "TGT1")]
+    assert unchanged == 1
+
+
+def test_holddata_delta_hold_class(sms):
+    added, resolved, unchanged = sms.holddata_delta([update("A1", "TGT1")], [update("A1", "TGT1", holdclass="PE")])
+
+    assert added == [update("A1", "TGT1", holdclass="PE")]
+    assert resolved == [update("A1", "TGT1")]
+    assert unchanged == 0
+
+
+def test_holddata_delta_duplicates(sms):
+    previous = [update("A1", "TGT1"), update("A1", "TGT2")]
+    current = [update("A1", "TGT2", "TGT1")]
+
+    assert sms.holddata_delta(previous, current) == ([], [], 1)
+
+
+def test_holddata_delta_no_zones(sms):
+    previous = [{"name": "A1", "holdclass": "HIPER"}]
+    current = [{"name": "A1", "holdclass": "HIPER", "tgtzones": []}, {"name": "B1"}]
+
+    added, resolved, unchanged = sms.holddata_delta(previous, current)
+
+    assert added == [{"name": "B1", "tgtzones": []}]
+    assert resolved == []
+    assert unchanged == 1
+
+
+def test_holddata_delta_empty(sms):
+    assert sms.holddata_delta([], []) == ([], [], 0)
+    assert sms.holddata_delta([], [update("A1", "TGT1")]) == ([update("A1", "TGT1")], [], 0)
+    assert sms.holddata_delta([update("A1", "TGT1")], []) == ([], [update("A1", "TGT1")], 0)
+
+
+def test_csiquery_body(tmp_path, monkeypatch, sms):
+    cache = K.CACHE(str(tmp_path), ttl=0)
+    posted: list = []
+
+    def request(method, url, data=None, **kwargs):
+        posted.append(data)
+        return C.RESULT(0, {}, C.build_response(202, b'{"statusurl": "status"}', url=url))
+
+    def wait_for_status(response, verify=True, stream=False):
+        return C.RESULT(0, {}, C.build_response(200, b'{"status": "complete", "entries": []}', url="status"))
+
+    monkeypatch.setattr(sms, "request", request)
+    monkeypatch.setattr(sms, "wait_for_status", wait_for_status)
+
+    sms.csiquery("SMPE.GLOBAL.CSI", "TGT1,DLIB1", "SYSMOD", "MOD,FMID", "FMID='HBB77C0'", cache=cache)
+    sms.csiquery("SMPE.GLOBAL.CSI", "TGT1,DLIB1", "SYSMOD", "MOD,FMID", "FMID='HBB77C0'", cache=cache)
+
+    assert len(posted) == 1
+    assert json.loads(posted[0]) == {
+        "zones": ["TGT1", "DLIB1"],
+        "entries": ["SYSMOD"],
+        "subentries": ["MOD", "FMID"],
+        "filter": "FMID='HBB77C0'",
+    }
+    assert cache.get(["h", ":443", "SMPE.GLOBAL.CSI", posted[0]]) is not None
@@ -0,0 +1,197 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+ZCLI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "zcli.py")
+
+
+def profile(port: int) -> dict:
+    return {
+        "type": "zosmf",
+        "properties": {
+            "host": "127.0.0.1",
+            "protocol": "http",
+            "port": port,
+            "user": "U",
+            "password": "P",
+            "retries": 0,
+        },
+    }
+
+
+def write_config(tmp_path, profiles: dict, groups: dict) -> str:
+    config = {
+        "profiles": profiles,
+        "profile_groups": groups,
+        "defaults": [
+            {
+                "profiles": [{"zosmf": [*profiles][0]}],
+                "zcli": {"properties": {"cert_path": ""}},
+            }
+        ],
+    }
+    directory = tmp_path / ".config" / "zcli"
+    directory.mkdir(parents=True)
+    (directory / "zcli.json").write_text(json.dumps(config))
+    return str(tmp_path)
+
+
+@pytest.fixture
+def home(tmp_path):
+    """A home directory with a zcli.json whose profiles point at a closed port"""
+    return write_config(tmp_path, {"down": profile(1), "down2": profile(1)}, {"dead": ["down", "down2"]})
+
+
+class ZOSMF(BaseHTTPRequestHandler):
+    """
+    Software management of a z/OSMF where the instance S1/BAD and CSI queries
+    of FMID entries fail with status 500, everything else completes at once.
+    """
+
+    def reply(self, status: int, body: dict | None = None):
+        content = json.dumps(body or {}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def complete(self, body: dict):
+        self.server.results.append(dict(body, status="complete"))
+        url = f"http://127.0.0.1:{self.server.server_port}/zosmf/swmgmt/status/{len(self.server.results) - 1}"
+        self.reply(202, {"statusurl": url})
+
+    def do_GET(self):
+        if self.path == "/zosmf/swmgmt/swi":
+            return self.reply(200, {"swilist": [{"system": "S1", "name": "OK"}, {"system": "S1", "name": "BAD"}]})
+        if self.path.startswith("/zosmf/swmgmt/status/"):
+            return self.reply(200, self.server.results[int(self.path.split("/")[-1])])
+        self.reply(404)
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or "{}")
+        if "/S1/BAD/" in self.path or body.get("entries") == ["FMID"]:
+            return self.reply(500)
+        if self.path.endswith("/softwareupdatesearch"):
+            return self.complete({"updates": [{"name": "UJ00001"}]})
+        if "/csiquery/" in self.path:
+            return self.complete({"entries": [{"entryname": "UJ00001", "entrytype": "SYSMOD", "zonename": "TGT1"}]})
+        if self.path.startswith("/zosmf/swmgmt/swi/"):
+            return self.complete({"missingcriticalupdates": [], "missingfixcatupdates": []})
+        self.reply(404)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def zosmf(tmp_path):
+    """A home directory with a zcli.json whose profile points at a ZOSMF server"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ZOSMF)
+    server.results = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield write_config(tmp_path, {"lab": profile(server.server_port)}, {})
+    server.shutdown()
+    server.server_close()
+
+
+def zcli(home: str, *args: str, input: str | None = None) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, ZCLI, *args],
+        input=input,
+        cwd=home,
+        env=dict(os.environ, HOME=home),
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("datasets", "list", "-dl", "X"),
+        ("info",),
+        ("files", "list", "-pn", "/tmp"),
+    ],
+)
+def test_connection_failure(home, args):
+    process = zcli(home, *args)
+    assert process.returncode == 16, process.stderr
+    assert "'rc': 16" in process.stderr
+
+
+@pytest.mark.parametrize("wait", ["--wait", "--no-wait"])
+def test_submit_failure(home, wait):
+    with open(os.path.join(home, "test.jcl"), "w") as f:
+        f.write("//TEST JOB\n//STEP1 EXEC PGM=IEFBR14\n")
+
+    process = zcli(home, "jobs", "submit", "-fn", "test.jcl", wait)
+    assert process.returncode == 16, process.stderr
+
+    process = zcli(home, "jobs", "submit", "-fn", "missing.jcl", wait)
+    assert process.returncode == 16, process.stderr
+    assert "J05" in process.stderr
+
+
+def test_profiles_failure(home):
+    process = zcli(home, "--profiles", "dead", "info")
+    assert process.returncode == 16, process.stderr
+
+    records = [json.loads(line) for line in process.stdout.splitlines()]
+    assert [(record["profile"], record["rc"]) for record in records] == [("down", 16), ("down2", 16)]
+    assert all("'rc': 16" in record["stderr"] for record in records)
+
+
+def test_batch(home):
+    with open(os.path.join(home, "lines.txt"), "w") as f:
+        f.write("datasets list -dl batch\njobs list --owner daemon\ndaemon status\n# comment\ninfo --tui\n")
+
+    process = zcli(home, "batch", "lines.txt")
+    assert process.returncode == 16, process.stderr
+
+    records = [json.loads(line) for line in process.stdout.splitlines()]
+    assert [(record["line"], record["rc"]) for record in records] == [(1, 16), (2, 16), (3, 8), (5, 8)]
+    assert "CMD-BATCH-002E" in records[2]["stderr"]
+
+
+@pytest.mark.parametrize("output_format", ["json", "csv"])
+def test_fleetscan_failure(zosmf, output_format):
+    process = zcli(zosmf, "software", "query", "fleetscan", "-up", "all", "-f", output_format)
+    assert process.returncode == 8, process.stderr
+
+    if output_format == "json":
+        report = json.loads(process.stdout)
+        assert [(entry["instance"], entry["updates"]) for entry in report["failed"]] == [
+            ("S1/BAD", "critical"),
+            ("S1/BAD", "fixcat"),
+        ]
+
+
+def test_snapshot_failure(zosmf):
+    database = os.path.join(zosmf, "snapshot.db")
+    process = zcli(zosmf, "software", "csi", "snapshot", "-e", "SYSMOD,FMID", "-db", database)
+    assert process.returncode == 8, process.stderr
+
+    report = json.loads(process.stdout)
+    assert report["complete"] is False
+    assert [entry["entrytype"] for entry in report["failed"]] == ["FMID"]
+    assert [(entry["entrytype"], entry["entries"]) for entry in report["snapshot"]] == [("SYSMOD", 1)]
+
+    process = zcli(zosmf, "software", "csi", "snapshot", "-e", "SYSMOD", "-db", database)
+    assert process.returncode == 0, process.stderr
+    assert json.loads(process.stdout)["complete"] is True
+
+
+def test_softupdates_failure(zosmf):
+    process = zcli(zosmf, "software", "query", "softupdates", "--all-instances", "-sf", "-", input="UJ00001 UJ00002\n")
+    assert process.returncode == 8, process.stderr
+
+    report = json.loads(process.stdout)
+    assert [entry["instance"] for entry in report["failed"]] == ["S1/BAD"]
+    assert [(update["name"], update["instance"]) for update in report["updates"]] == [("UJ00001", "S1/OK")]
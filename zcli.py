@@ -1,11 +1,20 @@
 #!/usr/bin/env python
 import sys
+
+# Hand the command to a running zcli daemon before importing anything else
+if __name__ == "__main__":
+    from commands.cmd_socket import forward
+
+    rc: int | None = forward(sys.argv[1:])
+    if rc is not None:
+        sys.exit(rc)
+
 import click
+import json
 import logging
 
-from click_help_colors import HelpColorsGroup
-
 from commands.cmd_config import (
+    CONFIG_CACHE_DIR,
     FILES_CACHE_DIR,
     DATASET_CACHE_DIR,
     JOBS_CACHE_DIR,
@@ -14,38 +23,54 @@ from commands.cmd_config import (
     CONFIG,
 )
 
+from commands.cmd_socket import matches
 from commands.cmd_utils import (
     create_directory,
+    debug_logging,
+    expand_profiles,
     get_profile_data,
+    invoke_commands,
+    LazyGroup,
 )
 
-from commands.cmd_datasets import datasets_cli
-from commands.cmd_files import files_cli
-from commands.cmd_filesystems import filesystems_cli
-from commands.cmd_info import info
-from commands.cmd_jobs import jobs_cli
-from commands.cmd_rtd import get_rtd
-from commands.cmd_software import software_cli
-from commands.cmd_subsystems import subsystems_cli
-from commands.cmd_sysvar import sysvar_cli
-from commands.cmd_topology import topology_cli
-from commands.cmd_tso import tso_cli
-from commands.cmd_notifications import notifications_cli
-from commands.cmd_console import console_cli
-from commands.cmd_profile import profile_cli
 
 from commands.cmd_globals import (
     TERMINAL,
+    SESSIONS,
 )
 
+from zosapi import client as C
+from zosapi import auth as A
+
 FORMAT = "%(asctime)s %(filename)s:%(funcName)s:%(lineno)d %(levelname)s - %(message)s"
 datefmt = "%Y-%m-%d %H:%M:%S"
 
 logging.basicConfig(format=FORMAT, level=logging.INFO, datefmt=datefmt)
 
 
+# Subcommand modules are only imported when their command is invoked
 @click.group(
-    cls=HelpColorsGroup, help_headers_color="yellow", help_options_color="green"
+    cls=LazyGroup,
+    lazy_subcommands={
+        "batch": "commands.cmd_batch.batch",
+        "console": "commands.cmd_console.console_cli",
+        "daemon": "commands.cmd_daemon.daemon_cli",
+        "datasets": "commands.cmd_datasets.datasets_cli",
+        "files": "commands.cmd_files.files_cli",
+        "filesystems": "commands.cmd_filesystems.filesystems_cli",
+        "info": "commands.cmd_info.info",
+        "jobs": "commands.cmd_jobs.jobs_cli",
+        "notifications": "commands.cmd_notifications.notifications_cli",
+        "profile": "commands.cmd_profile.profile_cli",
+        "rtd": "commands.cmd_rtd.get_rtd",
+        "software": "commands.cmd_software.software_cli",
+        "subsystems": "commands.cmd_subsystems.subsystems_cli",
+        "sysvar": "commands.cmd_sysvar.sysvar_cli",
+        "topology": "commands.cmd_topology.topology_cli",
+        "tso": "commands.cmd_tso.tso_cli",
+    },
+    help_headers_color="yellow",
+    help_options_color="green",
 )
 @click.version_option(
     version="0.0.1a", message="Welcome to z/OS CLI %(prog)s, version %(version)s"
@@ -71,10 +96,18 @@ logging.basicConfig(format=FORMAT, level=logging.INFO, datefmt=datefmt)
     type=click.STRING,
     help="z/OSMF Profile to use.",
 )
+@click.option(
+    "--profiles",
+    "-ps",
+    default="",
+    type=click.STRING,
+    help="Comma separated z/OSMF profiles or profile groups to run the command against concurrently.",
+)
 @click.pass_context
 def main(
     ctx: click.Context,
     profile_name: str,
+    profiles: str,
     verify: bool,
     debug: bool,
 ) -> int:
@@ -88,17 +121,19 @@ def main(
     Environment: *ix Terminal CLI / Batch Job
     """
     if debug:
-        logging.basicConfig(
-            format=FORMAT, level=logging.DEBUG, datefmt=datefmt, force=True
-        )
+        debug_logging()
 
     logging.debug("ZCLI-MAIN-000D list() entered with:")
     logging.debug(f"                           verify: {verify}")
     logging.debug(f"                            debug: {debug}")
     logging.debug(f"                     profile name: {profile_name}")
+    logging.debug(f"                         profiles: {profiles}")
 
     ctx.ensure_object(dict)
 
+    if profiles != "":
+        ctx.exit(run_for_profiles(ctx, profiles, verify, debug))
+
     create_directory(FILES_CACHE_DIR)
     create_directory(DATASET_CACHE_DIR)
     create_directory(JOBS_CACHE_DIR)
@@ -192,6 +227,185 @@ def main(
             param_hint=["zcli.json"],
         )
 
+    POOL_CONNECTIONS = get_profile_data(
+        config=CONFIG,
+        profile_name=profile_name,
+        profile_type="zosmf",
+        key="pool_connections",
+    )
+    if POOL_CONNECTIONS == "":
+        POOL_CONNECTIONS = "10"
+
+    POOL_MAXSIZE = get_profile_data(
+        config=CONFIG,
+        profile_name=profile_name,
+        profile_type="zosmf",
+        key="pool_maxsize",
+    )
+    if POOL_MAXSIZE == "":
+        POOL_MAXSIZE = "10"
+
+    POOL_BLOCK = get_profile_data(
+        config=CONFIG,
+        profile_name=profile_name,
+        profile_type="zosmf",
+        key="pool_block",
+    )
+
+    MAX_RETRIES = get_profile_data(
+        config=CONFIG,
+        profile_name=profile_name,
+        profile_type="zosmf",
+        key="max_retries",
+    )
+    if MAX_RETRIES == "":
+        MAX_RETRIES = "0"
+
+    CONNECT_TIMEOUT = get_profile_data(
+        config=CONFIG,
+        profile_name=profile_name,
+        profile_type="zosmf",
+        key="connect_timeout",
+    )
+    if CONNECT_TIMEOUT == "":
+        CONNECT_TIMEOUT = "10"
+
+    READ_TIMEOUT = get_profile_data(
+        config=CONFIG,
+        profile_name=profile_name,
+        profile_type="zosmf",
+        key="read_timeout",
+    )
+    if READ_TIMEOUT == "":
+        READ_TIMEOUT = "300"
+
+    RETRIES = get_profile_data(
+        config=CONFIG,
+        profile_name=profile_name,
+        profile_type="zosmf",
+        key="retries",
+    )
+    if RETRIES == "":
+        RETRIES = "3"
+
+    BACKOFF_FACTOR = get_profile_data(
+        config=CONFIG,
+        profile_name=profile_name,
+        profile_type="zosmf",
+        key="backoff_factor",
+    )
+    if BACKOFF_FACTOR == "":
+        BACKOFF_FACTOR = "0.5"
+
+    BACKOFF_MAX = get_profile_data(
+        config=CONFIG,
+        profile_name=profile_name,
+        profile_type="zosmf",
+        key="backoff_max",
+    )
+    if BACKOFF_MAX == "":
+        BACKOFF_MAX = "30"
+
+    POLL_INTERVAL = get_profile_data(
+        config=CONFIG,
+        profile_name=profile_name,
+        profile_type="zosmf",
+        key="poll_interval",
+    )
+    if POLL_INTERVAL == "":
+        POLL_INTERVAL = "0.25"
+
+    POLL_INTERVAL_MAX = get_profile_data(
+        config=CONFIG,
+        profile_name=profile_name,
+        profile_type="zosmf",
+        key="poll_interval_max",
+    )
+    if POLL_INTERVAL_MAX == "":
+        POLL_INTERVAL_MAX = "10"
+
+    POLL_DEADLINE = get_profile_data(
+        config=CONFIG,
+        profile_name=profile_name,
+        profile_type="zosmf",
+        key="poll_deadline",
+    )
+    if POLL_DEADLINE == "":
+        POLL_DEADLINE = "3600"
+
+    logging.debug(
+        f"ZCLI-MAIN-000D Request policy for profile {profile_name}: connect_timeout={CONNECT_TIMEOUT}, "
+        f"read_timeout={READ_TIMEOUT}, retries={RETRIES}, backoff_factor={BACKOFF_FACTOR}, backoff_max={BACKOFF_MAX}, "
+        f"poll_interval={POLL_INTERVAL}, poll_interval_max={POLL_INTERVAL_MAX}, poll_deadline={POLL_DEADLINE}"
+    )
+
+    AUTH = get_profile_data(
+        config=CONFIG,
+        profile_name=profile_name,
+        profile_type="zosmf",
+        key="auth",
+    )
+    if AUTH == "":
+        AUTH = "token"
+
+    TOKEN_LIFETIME = get_profile_data(
+        config=CONFIG,
+        profile_name=profile_name,
+        profile_type="zosmf",
+        key="token_lifetime",
+    )
+    if TOKEN_LIFETIME == "":
+        TOKEN_LIFETIME = "7200"
+
+    logging.debug(
+        f"ZCLI-MAIN-000D Authentication for profile {profile_name} is {AUTH}, token lifetime {TOKEN_LIFETIME}"
+    )
+
+    if AUTH not in ("token", "basic"):
+        raise click.BadParameter(
+            f'ZCLI-MAIN-005S Property "auth" in profile definition {profile_name} must be "token" or "basic", unable to continue.',
+            param_hint=["zcli.json"],
+        )
+
+    logging.debug(
+        f"ZCLI-MAIN-000D Connection pool for profile {profile_name}: connections={POOL_CONNECTIONS}, "
+        f"maxsize={POOL_MAXSIZE}, block={POOL_BLOCK}, max_retries={MAX_RETRIES}"
+    )
+
+    # Commands run by a zcli daemon reuse the SESSION built for the profile
+    SESSION = SESSIONS.get(profile_name)
+    if SESSION is None:
+        try:
+            TOKEN = None
+            if AUTH == "token":
+                TOKEN = A.TOKEN(
+                    path=f"{create_directory(f'{CONFIG_CACHE_DIR}/tokens')}/{profile_name}.json",
+                    hostname=HOST_NAME,
+                    username=USER,
+                    lifetime=int(TOKEN_LIFETIME),
+                )
+            SESSION = C.SESSION(
+                pool_connections=int(POOL_CONNECTIONS),
+                pool_maxsize=int(POOL_MAXSIZE),
+                max_retries=int(MAX_RETRIES),
+                pool_block=POOL_BLOCK.lower() == "true",
+                connect_timeout=float(CONNECT_TIMEOUT),
+                read_timeout=float(READ_TIMEOUT),
+                retries=int(RETRIES),
+                backoff_factor=float(BACKOFF_FACTOR),
+                backoff_max=float(BACKOFF_MAX),
+                token=TOKEN,
+                poll_interval=float(POLL_INTERVAL),
+                poll_interval_max=float(POLL_INTERVAL_MAX),
+                poll_deadline=float(POLL_DEADLINE),
+            )
+        except ValueError:
+            raise click.BadParameter(
+                f'ZCLI-MAIN-004S Properties "pool_connections", "pool_maxsize", "max_retries", "connect_timeout", "read_timeout", "retries", "backoff_factor", "backoff_max", "token_lifetime", "poll_interval", "poll_interval_max" and "poll_deadline" in profile definition {profile_name} must be numeric, unable to continue.',
+                param_hint=["zcli.json"],
+            )
+        SESSION = SESSIONS.setdefault(profile_name, SESSION)
+
     ctx.obj["CERT_PATH"] = CERT_PATH
     ctx.obj["PROFILE_NAME"] = profile_name
     ctx.obj["PROTOCOL"] = PROTOCOL
@@ -200,6 +414,7 @@ def main(
     ctx.obj["ENCODING"] = ENCODING
     ctx.obj["USER"] = USER
     ctx.obj["PASSWORD"] = PASSWORD
+    ctx.obj["SESSION"] = SESSION
     ctx.obj["RC"] = 0
     ctx.obj["DEBUG"] = debug
     ctx.obj["TERMINAL"] = TERMINAL
@@ -209,22 +424,59 @@ def main(
     return ctx.obj["RC"]
 
 
-if __name__ == "__main__":
-    main.add_command(console_cli)
-    main.add_command(datasets_cli)
-    main.add_command(files_cli)
-    main.add_command(filesystems_cli)
-    main.add_command(get_rtd)
-    main.add_command(info)
-    main.add_command(jobs_cli)
-    main.add_command(notifications_cli)
-    main.add_command(profile_cli)
-    main.add_command(software_cli)
-    main.add_command(subsystems_cli)
-    main.add_command(sysvar_cli)
-    main.add_command(topology_cli)
-    main.add_command(tso_cli)
+def run_for_profiles(ctx: click.Context, profiles: str, verify: bool, debug: bool) -> int:
+    """
+    Run the subcommand line against each profile concurrently and write one
+    line of JSON per profile, tagged with profile and host, in the order the
+    profiles were given.
+
+    Args:
+        ctx (click.Context): The context of main.
+        profiles (str).....: Comma separated profiles and profile groups.
+        verify (bool)......: Certificate verification on or off.
+        debug (bool).......: Debugging on or off.
+
+    Returns:
+        int: The highest return code of all profiles.
+    """
+    names, unknown = expand_profiles(config=CONFIG, profiles=profiles)
+    if unknown != [] or names == []:
+        raise click.BadParameter(
+            f"ZCLI-MAIN-006S Unknown profiles or profile groups {unknown} in {profiles}, unable to continue.",
+            param_hint=["--profiles"],
+        )
 
+    args = ctx.meta["subcommand_args"]
+    if matches(args, ((("daemon",), ()), ((), ("--tui",)))):
+        raise click.BadParameter(
+            "ZCLI-MAIN-007S daemon and --tui can not run against several profiles, unable to continue.",
+            param_hint=["--profiles"],
+        )
+
+    options = [
+        "--verify" if verify else "--no-verify",
+        "--debug" if debug else "--no-debug",
+    ]
+    argvs = [["--profile-name", name] + options + args for name in names]
+
+    rc = 0
+    for index, (profile_rc, stdout, stderr) in invoke_commands(ctx.command, argvs, len(names)):
+        rc = max(rc, profile_rc)
+        record = {
+            "profile": names[index],
+            "host": get_profile_data(
+                config=CONFIG, profile_name=names[index], profile_type="zosmf", key="host"
+            ),
+            "rc": profile_rc,
+            "stdout": stdout,
+            "stderr": stderr,
+        }
+        sys.stdout.write(f"{json.dumps(record)}\n")
+        sys.stdout.flush()
+    return rc
+
+
+if __name__ == "__main__":
     rc: int = main(obj={}, auto_envvar_prefix="ZCLI")
 
     sys.exit(rc)
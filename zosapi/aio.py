@@ -0,0 +1,687 @@
+# Asynchronous variants of the zosapi clients
+import asyncio
+import http.cookiejar
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+from zosapi import client as C
+from zosapi import console as CON
+from zosapi import datasets as D
+from zosapi import files as F
+from zosapi import jobs as J
+from zosapi import poll as P
+from zosapi import software as S
+
+# aiohttp is optional (extra "async"), the clients of this module need it
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+def require_aiohttp() -> None:
+    """
+    Raises:
+        ImportError: aiohttp is not installed.
+    """
+    if aiohttp is None:
+        raise ImportError(
+            "AIO-001E The asynchronous clients need aiohttp, install it with pip install 'zosapi[async]'"
+        )
+
+
+class ASYNC_SESSION:
+    """
+    An aiohttp session with a concurrency limit per z/OSMF host.
+
+    The transport policy (timeouts, retries, backoff and session token) is taken
+    from a SESSION, so the async clients behave like the synchronous ones. Use it
+    as an async context manager, or call close() when done.
+    """
+
+    def __init__(self, session: C.SESSION | None = None, limit_per_host: int = 10):
+        """
+        Args:
+            session (SESSION)....: Session holding the transport policy. A default
+                                   SESSION is used if none is passed (default None).
+            limit_per_host (int).: Maximum number of requests in flight per host
+                                   (default 10).
+        """
+        require_aiohttp()
+        if session is None:
+            session = C.SESSION()
+
+        self.session = session
+        self.limit_per_host = limit_per_host
+        self.semaphores: dict = {}
+        self.logon_lock: asyncio.Lock | None = None
+        self.client_session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def semaphore(self, url: str) -> asyncio.Semaphore:
+        """
+        Args:
+            url (str): The URL a request is sent to.
+
+        Returns:
+            Semaphore: The semaphore limiting the requests to the host of url.
+        """
+        host = urlsplit(url).netloc
+        if host not in self.semaphores:
+            self.semaphores[host] = asyncio.Semaphore(self.limit_per_host)
+        return self.semaphores[host]
+
+    async def open(self) -> "aiohttp.ClientSession":
+        """
+        Returns:
+            ClientSession: The aiohttp session, created on first use.
+        """
+        if self.client_session is None or self.client_session.closed:
+            self.client_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=0),
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self.session.connect_timeout,
+                    sock_read=self.session.read_timeout,
+                ),
+            )
+        return self.client_session
+
+    async def close(self) -> None:
+        """
+        Close the aiohttp session and its connections.
+        """
+        if self.client_session is not None:
+            await self.client_session.close()
+            self.client_session = None
+
+
+class ASYNC_CLIENT(C.CLIENT):
+    """
+    The asynchronous counterpart of CLIENT. Methods are coroutines returning a
+    RESULT, like the synchronous clients.
+    """
+
+    def __init__(
+        self,
+        protocol: str,
+        hostname: str,
+        username: str,
+        password: str,
+        port: str,
+        cert_path: str,
+        session: ASYNC_SESSION | None = None,
+    ):
+        """
+        Args:
+            hostname (str)........: The hostname of the z/OSMF server.
+            username (str)........: The username for authentication.
+            password (str)........: The password for authentication.
+            port     (str)........: The port of z/OSMF API Server.
+            cert_path(str)........: The path to certificates.
+            session (ASYNC_SESSION): Session to send requests through. A private
+                                     session is created if none is passed (default None).
+        """
+        if session is None:
+            session = ASYNC_SESSION()
+
+        super().__init__(
+            protocol=protocol,
+            hostname=hostname,
+            username=username,
+            password=password,
+            port=port,
+            cert_path=cert_path,
+            session=session.session,
+        )
+        self.asession = session
+
+    async def send(
+        self, method: str, url: str, headers: dict, data, json, verify: bool
+    ) -> requests.Response:
+        """
+        Send a single request and read the complete response.
+
+        Returns:
+            Response: The response, converted to a requests Response.
+        """
+        client_session = await self.asession.open()
+        async with self.asession.semaphore(url):
+            async with client_session.request(
+                method,
+                url,
+                headers=headers,
+                data=data,
+                json=json,
+                ssl=verify,
+            ) as response:
+                content = await response.read()
+
+        cookies = requests.cookies.RequestsCookieJar()
+        for name, morsel in response.cookies.items():
+            expires = None
+            if morsel["expires"]:
+                expires = http.cookiejar.http2time(morsel["expires"])
+            cookies.set(name, morsel.value, expires=expires)
+
+        return C.build_response(
+            response.status,
+            content,
+            headers=dict(response.headers),
+            url=str(response.url),
+            reason=response.reason or "",
+            cookies=cookies,
+        )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        expected: tuple = (200,),
+        headers: dict | None = None,
+        data=None,
+        json=None,
+        verify: bool = True,
+        idempotent: bool | None = None,
+    ) -> C.RESULT:
+        """
+        Send a request to z/OSMF, see CLIENT.request(). At most limit_per_host
+        requests of the session are in flight per host at any time.
+
+        Returns:
+            RESULT: rc, errors, response and number of attempts.
+        """
+        prefix = type(self).__name__
+        method = method.upper()
+
+        if headers is None:
+            headers = self.headers
+        if idempotent is None:
+            idempotent = method in C.IDEMPOTENT_METHODS
+
+        attempt = 0
+        relogon = True
+        started = time.monotonic()
+
+        while True:
+            attempt += 1
+            sent = await self.authenticate(headers, verify=verify)
+            try:
+                response = await self.send(method, url, sent, data, json, verify)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if idempotent and attempt <= self.session.retries:
+                    delay = self.session.backoff(attempt)
+                    self.log.warning(
+                        f"{prefix}-003W {method} {url} failed with {e!r}, retry {attempt} in {delay:.2f}s"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                errors = {"rc": 16, "request_error": e}
+                self.log.critical(
+                    f"{prefix}-001S Catched an unexpected exception after {attempt} attempt(s) {str(errors)}"
+                )
+                return C.RESULT(
+                    rc=16,
+                    errors=errors,
+                    response=None,
+                    attempts=attempt,
+                    elapsed=time.monotonic() - started,
+                )
+
+            if response.status_code == 401 and "Cookie" in sent and relogon:
+                self.log.debug(f"{prefix}-000D Session token rejected, logging on again")
+                self.session.token.clear(stale=self.session.token.value)
+                relogon = False
+                attempt -= 1
+                continue
+
+            if (
+                response.status_code in C.RETRY_STATUS_CODES
+                and attempt <= self.session.retries
+            ):
+                delay = self.session.backoff(
+                    attempt, response.headers.get("Retry-After")
+                )
+                self.log.warning(
+                    f"{prefix}-004W {method} {url} returned {response.status_code}, retry {attempt} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            break
+
+        if response.status_code not in expected:
+            self.log.debug(
+                f"{prefix}-002E An unexpected statuscode {response.status_code} has been received:"
+            )
+            self.log.debug(f"         {response.text}")
+            errors = {
+                "rc": 8,
+                "status_code": response.status_code,
+                "reason": response.reason,
+            }
+            return C.RESULT(
+                rc=8,
+                errors=errors,
+                response=response,
+                attempts=attempt,
+                elapsed=time.monotonic() - started,
+            )
+
+        return C.RESULT(
+            rc=0,
+            errors={},
+            response=response,
+            attempts=attempt,
+            elapsed=time.monotonic() - started,
+        )
+
+    async def authenticate(self, headers: dict, verify: bool = True) -> dict:
+        """
+        Replace Basic authentication by the session token, see CLIENT.authenticate().
+        """
+        token = self.session.token
+        if token is None or not await self.logon(verify=verify):
+            return headers
+
+        headers = {k: v for k, v in headers.items() if k != "Authorization"}
+        headers["Cookie"] = token.cookie()
+        return headers
+
+    async def logon(self, verify: bool = True) -> bool:
+        """
+        Obtain a session token, see CLIENT.logon(). Concurrent requests wait for
+        a single logon.
+        """
+        token = self.session.token
+        if token.valid():
+            return True
+        if token.failed:
+            return False
+
+        if self.asession.logon_lock is None:
+            self.asession.logon_lock = asyncio.Lock()
+
+        async with self.asession.logon_lock:
+            if token.valid():
+                return True
+            if token.failed:
+                return False
+
+            url = f"{self.path_to_api}/services/authenticate"
+            try:
+                response = await self.send("POST", url, self.headers, None, None, verify)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.log.debug(f"CLIENT-000D Logon to {url} failed with {e!r}")
+                return False
+
+            if response.status_code != 200 or not token.update(response):
+                token.failed = True
+                self.log.warning(
+                    f"CLIENT-005W No session token received from {url} (status {response.status_code}), using Basic authentication"
+                )
+                return False
+
+            self.log.debug(f"CLIENT-000D Logged on to {url}, received {token.name}")
+            return True
+
+
+class ASYNC_JOBS(ASYNC_CLIENT):
+    """
+    Asynchronous variant of JOBS.
+    """
+
+    async def get_job_list(
+        self,
+        owner: str = "*",
+        prefix: str = "*",
+        max_jobs: int = 1000,
+        exec_data: str = "Y",
+        active_only: bool = False,
+        verify: bool = True,
+    ):
+        """
+        Get a list of jobs from z/OS, see JOBS.get_job_list().
+        """
+        url = J.job_list_url(self, owner, prefix, max_jobs, exec_data, active_only)
+
+        result = await self.request("GET", url, expected=(200,), verify=verify)
+        return result
+
+    async def get_job_by_jobname_jobid(
+        self,
+        jobname: str,
+        jobid: str,
+        stepdata: str = "Y",
+        files: bool = False,
+        verify: bool = True,
+    ):
+        """
+        Get a single job by its ID, see JOBS.get_job_by_jobname_jobid().
+        """
+        url = J.job_url(self, jobname, jobid, stepdata, files)
+
+        result = await self.request("GET", url, expected=(200,), verify=verify)
+        return result
+
+    async def get_files_by_jobname_jobid(
+        self, jobname: str, jobid: str, verify: bool = True
+    ):
+        """
+        Get the list of spool files of a job, see JOBS.get_files_by_jobname_jobid().
+        """
+        url = J.job_url(self, jobname, jobid, files=True)
+
+        result = await self.request("GET", url, expected=(200,), verify=verify)
+        return result
+
+    async def get_job_file_by_id(
+        self,
+        fileid: str = "",
+        jobname: str = "",
+        jobid: str = "",
+        correlator: str = "",
+        verify: bool = True,
+    ):
+        """
+        Get a JES spool file by its file ID, see JOBS.get_job_file_by_id().
+        """
+        errors, url = J.job_files_url(self, jobname, jobid, correlator)
+        if errors:
+            return C.RESULT(8, errors)
+
+        if fileid == "":
+            self.log.error("JOBS-007E A spool file id is required.")
+            return C.RESULT(
+                8,
+                {
+                    "rc": 8,
+                    "status_code": "A spool file id is required.",
+                    "reason": "J03",
+                },
+            )
+
+        url = url + f"/{fileid}/records"
+
+        result = await self.request("GET", url, expected=(200,), verify=verify)
+        return result
+
+    async def get_job_jcl(
+        self,
+        jobname: str = "",
+        jobid: str = "",
+        correlator: str = "",
+        verify: bool = True,
+    ):
+        """
+        Get the JCL of a job, see JOBS.get_job_jcl().
+        """
+        errors, url = J.job_files_url(self, jobname, jobid, correlator)
+        if errors:
+            return C.RESULT(8, errors)
+
+        url = url + "/JCL/records"
+
+        result = await self.request("GET", url, expected=(200,), verify=verify)
+        return result
+
+    async def submit_job(
+        self, file_name: str, jes_name: str = "", inline: bool = True, verify: bool = True
+    ):
+        """
+        Submit a job to z/OS, see JOBS.submit_job().
+        """
+        errors, url, headers, data = J.submit_request(self, file_name, jes_name, inline)
+        if errors:
+            return C.RESULT(errors["rc"], errors)
+
+        result = await self.request(
+            "PUT", url, expected=(201,), headers=headers, data=data, verify=verify
+        )
+        return result
+
+
+class ASYNC_DATASETS(ASYNC_CLIENT):
+    """
+    Asynchronous variant of DATASETS.
+    """
+
+    async def zosapi_datasets_list(
+        self, dsn_level: str, volser: str = "", start: str = "", verify: bool = True
+    ):
+        """
+        List z/OS data sets, see DATASETS.zosapi_datasets_list().
+        """
+        url, headers = D.list_request(self, dsn_level, volser, start)
+
+        result = await self.request(
+            "GET", url, expected=(200,), headers=headers, verify=verify
+        )
+        return result
+
+    async def zosapi_datasets_members_list(
+        self, dataset_name: str, pattern: str = "", verify: bool = True
+    ):
+        """
+        List the members of a PDS or PDS/E, see DATASETS.zosapi_datasets_members_list().
+        """
+        url, headers = D.members_list_request(self, dataset_name, pattern)
+
+        result = await self.request(
+            "GET", url, expected=(200,), headers=headers, verify=verify
+        )
+        return result
+
+    async def zosapi_datasets_read(
+        self,
+        dataset_name: str,
+        volser: str = "",
+        member: str = "",
+        encoding: str = "",
+        enq_exclusive: bool = False,
+        verify: bool = True,
+    ):
+        """
+        Read a sequential data set or member, see DATASETS.zosapi_datasets_read().
+        """
+        url, headers = D.read_request(
+            self, dataset_name, volser, member, encoding, enq_exclusive
+        )
+
+        result = await self.request(
+            "GET", url, expected=(200,), headers=headers, verify=verify
+        )
+        return result
+
+
+class ASYNC_FILES(ASYNC_CLIENT):
+    """
+    Asynchronous variant of FILES.
+    """
+
+    async def zosapi_files_list(self, file_path: str, verify: bool = True):
+        """
+        List a z/UNIX directory, see FILES.zosapi_files_list().
+        """
+        url = F.list_url(self, file_path)
+
+        result = await self.request("GET", url, expected=(200,), verify=verify)
+        return result
+
+    async def zosapi_files_retrieve(
+        self,
+        zunix_file_name: str,
+        zunix_file_type: str = "text",
+        encoding: str = "IBM-1047",
+        charset: str = "ISO8859-1",
+        verify: bool = True,
+    ):
+        """
+        Read a z/UNIX file, see FILES.zosapi_files_retrieve().
+        """
+        url, headers = F.retrieve_request(
+            self, zunix_file_name, zunix_file_type, encoding, charset
+        )
+
+        result = await self.request(
+            "GET", url, expected=(200,), headers=headers, verify=verify
+        )
+        return result
+
+
+class ASYNC_SMS(ASYNC_CLIENT):
+    """
+    Asynchronous variant of SMS.
+    """
+
+    async def wait_for_status(self, response, verify: bool = True) -> C.RESULT:
+        """
+        Poll the status monitor of an asynchronous software management request
+        like POLLER.wait(), driving POLLER.steps() with asyncio.sleep() instead
+        of a thread. Cancel the task to stop polling.
+        """
+        try:
+            statusurl: str = response.json()["statusurl"]
+        except Exception as e:
+            errors = {"rc": 16, "request_error": e}
+            self.log.critical(
+                f"SMS-001S Catched an unexpected exception, can not continue {str(errors)}"
+            )
+            return C.RESULT(16, errors, response)
+
+        poller = P.POLLER(self)
+        steps = poller.steps(statusurl)
+        try:
+            delay = next(steps)
+            while True:
+                await asyncio.sleep(delay)
+                if poller.cancel.is_set():
+                    delay = steps.send(None)
+                else:
+                    delay = steps.send(
+                        await self.request("GET", statusurl, expected=(200,), verify=verify)
+                    )
+        except StopIteration as stop:
+            return stop.value
+
+    async def post_and_wait(self, url: str, data=None, verify: bool = True):
+        """
+        POST an asynchronous request and wait for its result.
+
+        Returns:
+            RESULT: The final status response.
+        """
+        result = await self.request(
+            "POST", url, expected=(202,), data=data, verify=verify
+        )
+        if result.rc == 0:
+            result = await self.wait_for_status(result.response, verify=verify)
+        return result
+
+    async def list_software_instances(self, pswi: bool = False, verify: bool = True):
+        """
+        List software or portable software instances, see SMS.list_software_instances().
+        """
+        url = S.instances_url(self, pswi)
+
+        result = await self.request("GET", url, expected=(200,), verify=verify)
+        return result
+
+    async def missing_critical_updates(
+        self,
+        nickname: str = "",
+        instance: str = "",
+        uuid: str = "",
+        verify: bool = True,
+    ):
+        """
+        Get missing critical updates, see SMS.missing_critical_updates().
+        """
+        errors, url = S.swi_url(self, nickname, instance, uuid)
+        if errors:
+            return C.RESULT(8, errors)
+
+        return await self.post_and_wait(url + "/missingcriticalupdates", verify=verify)
+
+    async def missing_fixcat_updates(
+        self,
+        nickname: str = "",
+        instance: str = "",
+        uuid: str = "",
+        verify: bool = True,
+    ):
+        """
+        Get missing FIXCAT updates, see SMS.missing_fixcat_updates().
+        """
+        errors, url = S.swi_url(self, nickname, instance, uuid)
+        if errors:
+            return C.RESULT(8, errors)
+
+        return await self.post_and_wait(url + "/missingfixcatupdates", verify=verify)
+
+    async def scan_missing_updates(
+        self,
+        instances: list,
+        updates: tuple = ("critical",),
+        parallel: int | None = None,
+        verify: bool = True,
+    ) -> dict:
+        """
+        Run the missing critical and/or FIXCAT updates queries of many software
+        instances at the same time, see SMS.scan_missing_updates(). The queries
+        wait for their status monitors as tasks of one event loop instead of a
+        thread each.
+
+        Returns:
+            dict: One list of RESULTs per kind of updates, in the order of instances.
+        """
+        running = asyncio.Semaphore(parallel or self.session.pool_maxsize)
+        scans, requests = S.missing_updates_requests(self, instances, updates)
+
+        async def scan(url: str, data) -> C.RESULT:
+            async with running:
+                return await self.post_and_wait(url, data=data, verify=verify)
+
+        results = await asyncio.gather(*[scan(url, data) for url, data in requests])
+        return S.missing_updates_results(scans, updates, results)
+
+    async def csiquery(
+        self,
+        global_name: str,
+        zones: str,
+        entries: str = "",
+        subentries: str = "",
+        filter: str = "",
+        verify: bool = False,
+    ):
+        """
+        Query an SMP/E CSI, see SMS.csiquery().
+        """
+        url, data = S.csiquery_request(self, global_name, zones, entries, subentries, filter)
+
+        return await self.post_and_wait(url, data=data, verify=verify)
+
+
+class ASYNC_CONSOLE(ASYNC_CLIENT):
+    """
+    Asynchronous variant of CONSOLE.
+    """
+
+    async def issue_zos_command(
+        self, command: str, console_name: str = "defcn", verify: bool = True
+    ):
+        """
+        Issue a z/OS command, see CONSOLE.issue_zos_command().
+        """
+        url, data = CON.command_request(self, command, console_name)
+
+        result = await self.request(
+            "PUT", url, expected=(200,), data=data, verify=verify
+        )
+        return result
@@ -0,0 +1,168 @@
+# z/OSMF session token handling
+import base64
+import json
+import logging
+import os
+import threading
+import time
+
+# Cookies z/OSMF returns from its authentication service, preferred first
+TOKEN_COOKIES: tuple = ("jwtToken", "LtpaToken2")
+
+# Seconds before the recorded expiry at which a token is no longer used
+EXPIRY_MARGIN: int = 60
+
+
+class TOKEN:
+    """
+    A z/OSMF session token (LTPA or JWT), cached on disk per profile.
+
+    The token is obtained once with the profile's user and password through the
+    z/OSMF authentication service and reused by later zcli invocations until it
+    expires or z/OSMF rejects it with 401.
+    """
+
+    def __init__(
+        self, path: str, hostname: str, username: str, lifetime: int = 7200
+    ):
+        """
+        Args:
+            path (str).....: The file the token of this profile is cached in.
+            hostname (str).: The z/OSMF host the token belongs to.
+            username (str).: The user the token belongs to.
+            lifetime (int).: Seconds an LTPA token is valid when z/OSMF does not
+                             say otherwise (default 7200, the z/OSMF default).
+        """
+        log = logging.getLogger(__name__)
+        log.addHandler(logging.NullHandler())
+
+        self.path = path
+        self.hostname = hostname
+        self.username = username
+        self.lifetime = lifetime
+        self.name: str = ""
+        self.value: str = ""
+        self.expires: float = 0.0
+        self.failed: bool = False
+        self.lock = threading.Lock()
+        self.log = log
+
+        self.load()
+
+    def valid(self) -> bool:
+        """
+        Returns:
+            bool: True if a token is held and has not (nearly) expired.
+        """
+        return self.value != "" and time.time() < self.expires - EXPIRY_MARGIN
+
+    def cookie(self) -> str:
+        """
+        Returns:
+            str: The token formatted as value of a Cookie header.
+        """
+        return f"{self.name}={self.value}"
+
+    def load(self) -> None:
+        """
+        Read the cached token, ignoring it if it belongs to another host or user.
+        """
+        try:
+            with open(self.path, "r") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if (
+            cached.get("hostname") != self.hostname
+            or cached.get("username") != self.username
+        ):
+            self.log.debug(f"AUTH-000D Cached token {self.path} is for another host or user")
+            return
+
+        self.name = cached.get("name", "")
+        self.value = cached.get("value", "")
+        self.expires = float(cached.get("expires", 0))
+        self.log.debug(f"AUTH-000D Loaded {self.name} from {self.path}, expires {time.ctime(self.expires)}")
+
+    def save(self) -> None:
+        """
+        Write the token to its cache file, readable by the owner only.
+        """
+        cached = {
+            "hostname": self.hostname,
+            "username": self.username,
+            "name": self.name,
+            "value": self.value,
+            "expires": self.expires,
+        }
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(cached, f)
+        except OSError as e:
+            self.log.warning(f"AUTH-001W Unable to cache token in {self.path}: {e}")
+
+    def clear(self, stale: str = "") -> None:
+        """
+        Forget the token and remove its cache file.
+
+        Args:
+            stale (str): Only clear if the held token still is this value, so a
+                         token refreshed meanwhile by another thread is kept
+                         (default "", clear unconditionally).
+        """
+        if stale != "" and stale != self.value:
+            return
+        self.name = ""
+        self.value = ""
+        self.expires = 0.0
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def update(self, response) -> bool:
+        """
+        Take the token from the response of the authentication service.
+
+        Args:
+            response (Response): Response of POST /zosmf/services/authenticate.
+
+        Returns:
+            bool: True if the response carried a token.
+        """
+        for name in TOKEN_COOKIES:
+            cookie = next((c for c in response.cookies if c.name == name), None)
+            if cookie is None:
+                continue
+            self.name = name
+            self.value = cookie.value
+            self.expires = self.expiry(cookie)
+            self.save()
+            self.log.debug(f"AUTH-000D Received {name}, expires {time.ctime(self.expires)}")
+            return True
+        return False
+
+    def expiry(self, cookie) -> float:
+        """
+        Work out when a token expires: the exp claim of a JWT, the expiry of the
+        cookie, or the configured lifetime, whichever is known first.
+
+        Args:
+            cookie (Cookie): The token cookie.
+
+        Returns:
+            float: Expiry as seconds since the epoch.
+        """
+        if cookie.name == "jwtToken":
+            try:
+                payload = cookie.value.split(".")[1]
+                payload = payload + "=" * (-len(payload) % 4)
+                return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+            except (IndexError, KeyError, ValueError):
+                pass
+        if cookie.expires:
+            return float(cookie.expires)
+        return time.time() + self.lifetime
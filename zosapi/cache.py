@@ -0,0 +1,123 @@
+# Local file cache for results of expensive z/OSMF requests
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+
+class CACHE:
+    """
+    A directory of cached results, one file per key.
+
+    The modification time of a file is the time it was stored and is used for
+    the time to live; the access time is set on every hit and is used to evict
+    the least recently used files once the directory grows beyond max_bytes.
+    """
+
+    def __init__(self, directory: str, ttl: float = 3600, max_bytes: int = 100 * 1024 * 1024):
+        """
+        Args:
+            directory (str)...: The cache directory, created if missing.
+            ttl (float).......: Seconds a result is valid, 0 or less for ever (default 3600).
+            max_bytes (int)...: Upper limit of the size of all cached files (default 100 MB).
+        """
+        log = logging.getLogger(__name__)
+        log.addHandler(logging.NullHandler())
+
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.log = log
+
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key) -> str:
+        """
+        Args:
+            key: Anything JSON serialisable identifying the result.
+
+        Returns:
+            str: The file holding the result of key.
+        """
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+        return os.path.join(self.directory, digest)
+
+    def get(self, key) -> bytes | None:
+        """
+        Args:
+            key: Anything JSON serialisable identifying the result.
+
+        Returns:
+            bytes | None: The cached result, None if there is none or it expired.
+        """
+        path = self.path(key)
+        try:
+            stored = os.stat(path).st_mtime
+            if self.ttl > 0 and time.time() - stored > self.ttl:
+                self.log.debug(f"CACHE-000D {key} expired")
+                os.remove(path)
+                return None
+            with open(path, "rb") as f:
+                content = f.read()
+            os.utime(path, (time.time(), stored))
+        except OSError:
+            return None
+
+        self.log.debug(f"CACHE-000D {key} found in {path}")
+        return content
+
+    def put(self, key, content: bytes) -> None:
+        """
+        Store a result and evict the least recently used ones beyond max_bytes.
+
+        Args:
+            key: Anything JSON serialisable identifying the result.
+            content (bytes): The result.
+        """
+        path = self.path(key)
+        try:
+            fd, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(temporary, path)
+        except OSError as e:
+            self.log.warning(f"CACHE-001W Unable to cache {key} in {path}: {e}")
+            return
+        self.evict()
+
+    def remove(self, key) -> None:
+        """
+        Args:
+            key: Anything JSON serialisable identifying the result.
+        """
+        try:
+            os.remove(self.path(key))
+        except OSError:
+            pass
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used files until the cache fits into max_bytes.
+        Temporary files are left alone, another writer may be about to rename it.
+        """
+        files: list = []
+        for entry in os.scandir(self.directory):
+            try:
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    stat = entry.stat()
+                    files.append((stat.st_atime, stat.st_size, entry.path))
+            except OSError:
+                continue
+
+        size = sum(file_size for _, file_size, _ in files)
+        for _, file_size, path in sorted(files):
+            if size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                size = size - file_size
+                self.log.debug(f"CACHE-000D Evicted {path}")
+            except OSError:
+                pass
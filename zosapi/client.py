@@ -1,8 +1,369 @@
 # Import necessary libraries
 import base64
+import io
+import json
 import ssl
 import os
 import logging
+import random
+import re
+import time
+from types import MappingProxyType
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from zosapi.auth import TOKEN
+
+# Methods that may be sent again after a connection or read failure
+IDEMPOTENT_METHODS: tuple = ("GET", "HEAD", "OPTIONS")
+
+# Status codes z/OSMF uses when it sheds load; the request was not processed
+RETRY_STATUS_CODES: tuple = (429, 503)
+
+# Characters where BODY.value() has to look at a JSON document
+STRUCTURE = re.compile(r'["{}\[\]]')
+WHITESPACE = re.compile(r"\s*")
+
+# Marks RESULT.body as not parsed yet, None is a valid body
+UNPARSED = object()
+
+
+def build_response(
+    status_code: int,
+    content: bytes,
+    headers: dict | None = None,
+    url: str = "",
+    reason: str = "",
+    cookies: requests.cookies.RequestsCookieJar | None = None,
+) -> requests.Response:
+    """
+    Build a requests Response from data that did not come through a SESSION,
+    so callers always get the same kind of response object.
+
+    Args:
+        status_code (int)...: The HTTP status code.
+        content (bytes).....: The response body.
+        headers (dict)......: The response headers (default None).
+        url (str)...........: The URL of the request (default "").
+        reason (str)........: The HTTP reason phrase (default "").
+        cookies (CookieJar).: Cookies set by the response (default None).
+
+    Returns:
+        Response: The response object.
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response._content_consumed = True
+    response.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    response.url = url
+    response.reason = reason
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    if cookies is not None:
+        response.cookies = cookies
+    return response
+
+
+class SESSION(requests.Session):
+    """
+    A requests session with a keep-alive connection pool.
+
+    One SESSION is meant to be shared by all CLIENT instances talking to the
+    same z/OSMF server, so TCP connections and TLS sessions are reused instead
+    of being set up again for every single REST call.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        max_retries: int = 0,
+        pool_block: bool = False,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 300.0,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 30.0,
+        token: TOKEN | None = None,
+        poll_interval: float = 0.25,
+        poll_interval_max: float = 10.0,
+        poll_deadline: float = 3600.0,
+    ):
+        """
+        Initialize the session and mount a pooling adapter for http and https.
+
+        Args:
+            pool_connections (int): Number of host pools to keep (default 10).
+            pool_maxsize (int)....: Maximum connections kept per host (default 10).
+            max_retries (int).....: Retries on failed connection attempts (default 0).
+            pool_block (bool).....: Block instead of opening extra connections when
+                                    pool_maxsize is reached (default False).
+            connect_timeout (float): Seconds to wait for a connection (default 10).
+            read_timeout (float)...: Seconds to wait for response data (default 300).
+            retries (int)..........: Retries of idempotent requests and of requests
+                                     answered with 429/503 (default 3).
+            backoff_factor (float).: First retry delay in seconds, doubled for every
+                                     further retry (default 0.5).
+            backoff_max (float)....: Upper limit of a single retry delay (default 30).
+            token (TOKEN)..........: Session token to authenticate with instead of
+                                     user and password (default None).
+            poll_interval (float)..: Seconds before the first poll of a status
+                                     monitor (default 0.25).
+            poll_interval_max (float): Upper limit of the poll interval, which grows
+                                     with every poll (default 10).
+            poll_deadline (float)..: Seconds after which polling a status monitor
+                                     is given up (default 3600).
+        """
+        super().__init__()
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+            pool_block=pool_block,
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.pool_block = pool_block
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.token = token
+        self.poll_interval = poll_interval
+        self.poll_interval_max = poll_interval_max
+        self.poll_deadline = poll_deadline
+
+    def backoff(self, attempt: int, retry_after: str | None = None) -> float:
+        """
+        Return the delay before retry number attempt, exponential with jitter.
+
+        Args:
+            attempt (int).....: The number of the retry (1 for the first one).
+            retry_after (str).: Value of a Retry-After header, if any (default None).
+
+        Returns:
+            float: Seconds to sleep.
+        """
+        delay = min(self.backoff_max, self.backoff_factor * 2 ** (attempt - 1))
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        if retry_after is not None and retry_after.isdigit():
+            delay = max(delay, min(self.backoff_max, float(retry_after)))
+        return delay
+
+
+class BODY:
+    """
+    A binary file over a response body. A response requested with stream=True
+    is read as it arrives, so a large JSON document can be handed to a parser
+    like iter_entries() without holding all of it. Bytes looked at with peek()
+    are returned again by read().
+    """
+
+    def __init__(self, response: requests.Response):
+        """
+        Args:
+            response (Response): The response, streamed or not.
+        """
+        self.response = response
+        self.head = b""
+        self.position = 0
+        self.eof = False
+        if response._content is False:
+            response.raw.decode_content = True
+            self.source = response.raw
+        else:
+            self.source = io.BytesIO(response.content)
+
+    def peek(self, size: int) -> bytes:
+        """
+        Args:
+            size (int): Bytes wanted from the start of the body.
+
+        Returns:
+            bytes: The first size bytes of the body, less at its end.
+        """
+        while len(self.head) < size and not self.eof:
+            chunk = self.source.read(size - len(self.head))
+            self.eof = not chunk
+            self.head = self.head + chunk
+        return self.head
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Args:
+            size (int): Bytes to read, all if negative (default -1).
+
+        Returns:
+            bytes: The next bytes of the body, b"" at its end.
+        """
+        data = b""
+        if self.position < len(self.head):
+            end = len(self.head) if size < 0 else min(len(self.head), self.position + size)
+            data = self.head[self.position:end]
+            self.position = end
+            if size >= 0:
+                return data
+        if size < 0:
+            data = data + self.source.read()
+        else:
+            data = self.source.read(size)
+        self.position = self.position + len(data)
+        return data
+
+    def value(self, key: str, size: int = 64 * 1024):
+        """
+        Get a value of the outermost JSON object without parsing the rest of
+        the document, e.g. the status of a large CSI query result. Only the
+        head of the body is read, more of it only if the key is not in there.
+
+        Args:
+            key (str)..: The name of the value.
+            size (int).: Bytes looked at first (default 64 KB).
+
+        Returns:
+            The value.
+
+        Raises:
+            ValueError: The body is not JSON.
+            KeyError: The outermost object has no such key.
+        """
+        decoder = json.JSONDecoder()
+        while True:
+            text = self.peek(size).decode("utf-8", errors="replace")
+            try:
+                depth = 0
+                position = 0
+                while (match := STRUCTURE.search(text, position)) is not None:
+                    position = match.end()
+                    char = match.group()
+                    if char != '"':
+                        depth = depth + (1 if char in "{[" else -1)
+                        continue
+                    string, position = json.decoder.scanstring(text, position)
+                    colon = WHITESPACE.match(text, position).end()
+                    if depth == 1 and string == key and text[colon:colon + 1] == ":":
+                        value, end = decoder.raw_decode(text, WHITESPACE.match(text, colon + 1).end())
+                        # A number at the end of the head may go on
+                        if end < len(text) or self.eof:
+                            return value
+                        break
+                raise KeyError(key)
+            except (KeyError, ValueError):
+                if self.eof:
+                    raise
+            size = size * 4
+
+    def content(self) -> bytes:
+        """
+        Read the rest of a streamed body into the response, so response.content
+        and response.json() work. Reading starts over at the start of the body.
+
+        Returns:
+            bytes: The complete body.
+        """
+        if self.response._content is False:
+            self.response._content = self.head + self.source.read()
+            self.response._content_consumed = True
+        self.source = io.BytesIO(self.response.content)
+        self.head = b""
+        self.position = 0
+        self.eof = False
+        return self.response.content
+
+
+class RESULT:
+    """
+    The outcome of a single call of a zosapi method.
+
+    Every call gets its own RESULT, so clients can be shared between threads.
+    A RESULT unpacks like the (errors, response) tuple the methods used to return:
+
+        errors, response = client.get_job_list()
+    """
+
+    def __init__(
+        self,
+        rc: int = 0,
+        errors: dict | None = None,
+        response: requests.Response | None = None,
+        attempts: int = 0,
+        elapsed: float = 0.0,
+    ):
+        """
+        Args:
+            rc (int)...........: 0 ok, 8 unexpected status code or invalid arguments,
+                                 16 request failed.
+            errors (dict)......: Return Code and some details about the error.
+            response (Response): Response object returned by z/OSMF, None if no
+                                 request was sent or it failed before a response
+                                 was received.
+            attempts (int).....: Number of times the request has been sent.
+            elapsed (float)....: Seconds spent sending the request, retries included.
+        """
+        self.rc = rc
+        self.errors = errors if errors is not None else {}
+        self.response = response
+        self.attempts = attempts
+        self.elapsed = elapsed
+        self._body = UNPARSED
+        self._stream: BODY | None = None
+
+    def __iter__(self):
+        return iter((self.errors, self.response))
+
+    def __getitem__(self, index: int):
+        return (self.errors, self.response)[index]
+
+    def __repr__(self) -> str:
+        return f"RESULT(rc={self.rc}, status={self.status}, errors={self.errors}, elapsed={self.elapsed:.3f})"
+
+    @property
+    def status(self) -> int | None:
+        """
+        Returns:
+            int: The HTTP status code, None if there is no response.
+        """
+        if self.response is None:
+            return None
+        return self.response.status_code
+
+    @property
+    def body(self):
+        """
+        Returns:
+            dict | list | str: The response body, parsed if it is JSON, None if
+                               there is no response. It is parsed only once.
+        """
+        if self.response is None:
+            return None
+        if self._body is UNPARSED:
+            if self._stream is not None:
+                self._stream.content()
+            try:
+                self._body = self.response.json()
+            except ValueError:
+                self._body = self.response.text
+        return self._body
+
+    @property
+    def stream(self) -> BODY | None:
+        """
+        Returns:
+            BODY: The response body as a binary file, read as it arrives if the
+                  request was sent with stream=True, None if there is no response.
+        """
+        if self.response is None:
+            return None
+        if self._stream is None:
+            self._stream = BODY(self.response)
+        return self._stream
 
 
 class CLIENT:
@@ -18,6 +379,7 @@ class CLIENT:
         password: str,
         port: str,
         cert_path: str,
+        session: SESSION | None = None,
     ):
         """
         Initialize the client with the z/OSMF server details.
@@ -28,6 +390,8 @@ class CLIENT:
             password (str): The password for authentication.
             port     (str): The port of z/OSMF API Server (default None).
             cert_path(str): The path to certificates (default None).
+            session  (SESSION): Pooled session to send requests through. A private
+                                session is created if none is passed (default None).
         """
         log = logging.getLogger(__name__)
         log.addHandler(logging.NullHandler())
@@ -49,12 +413,212 @@ class CLIENT:
             "Authorization": f"Basic {authb64.decode()}",
         }
 
-        self.headers = headers
+        if session is None:
+            session = SESSION()
+            log.debug("CLIENT-000D No session passed, created a private session")
+
+        # Read-only, methods add their headers to a copy for each request
+        self.headers = MappingProxyType(headers)
         self.hostname = hostname
         self.port = ":" + port
         self.path_to_api = f"{protocol}://{self.hostname}{self.port}/zosmf"
         self.cert_path = cert_path
+        self.session = session
         self.log = log
 
+    def request(
+        self,
+        method: str,
+        url: str,
+        expected: tuple = (200,),
+        headers: dict | None = None,
+        data=None,
+        json=None,
+        verify: bool = True,
+        idempotent: bool | None = None,
+        stream: bool = False,
+    ) -> RESULT:
+        """
+        Send a request to z/OSMF through the session.
+
+        Connection and read failures are retried for idempotent requests, responses
+        with status 429 or 503 are retried for every method, both with exponential
+        backoff and jitter. Errors are returned, never raised.
+
+        Args:
+            method (str).......: The HTTP method (GET, PUT, POST, DELETE).
+            url (str)..........: The full URL of the request.
+            expected (tuple)...: Status codes that count as success (default (200,)).
+            headers (dict).....: Request headers (default self.headers).
+            data...............: Request body (default None).
+            json...............: Request body to be serialized as JSON (default None).
+            verify (bool)......: Whether or not to verify SSL certificates (default True).
+            idempotent (bool)..: Whether the request may be sent again after a failure.
+                                 Defaults to True for GET, HEAD and OPTIONS.
+            stream (bool)......: Do not read the response body up front (default False).
+
+        Returns:
+            RESULT: rc, errors, response and number of attempts.
+        """
+        prefix = type(self).__name__
+        method = method.upper()
+
+        if headers is None:
+            headers = self.headers
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        if not verify:
+            requests.packages.urllib3.disable_warnings()
+
+        timeout = (self.session.connect_timeout, self.session.read_timeout)
+        attempt = 0
+        relogon = True
+        started = time.monotonic()
+
+        while True:
+            attempt += 1
+            sent = self.authenticate(headers, verify=verify)
+            try:
+                response = self.session.request(
+                    method,
+                    url,
+                    headers=sent,
+                    data=data,
+                    json=json,
+                    verify=verify,
+                    timeout=timeout,
+                    stream=stream,
+                )
+            except requests.exceptions.RequestException as e:
+                if idempotent and attempt <= self.session.retries:
+                    delay = self.session.backoff(attempt)
+                    self.log.warning(
+                        f"{prefix}-003W {method} {url} failed with {e}, retry {attempt} in {delay:.2f}s"
+                    )
+                    time.sleep(delay)
+                    continue
+                errors = {"rc": 16, "request_error": e}
+                self.log.critical(
+                    f"{prefix}-001S Catched an unexpected exception after {attempt} attempt(s) {str(errors)}"
+                )
+                return RESULT(
+                    rc=16,
+                    errors=errors,
+                    response=None,
+                    attempts=attempt,
+                    elapsed=time.monotonic() - started,
+                )
+
+            if response.status_code == 401 and "Cookie" in sent and relogon:
+                self.log.debug(f"{prefix}-000D Session token rejected, logging on again")
+                self.session.token.clear(stale=self.session.token.value)
+                response.close()
+                relogon = False
+                attempt -= 1
+                continue
+
+            if (
+                response.status_code in RETRY_STATUS_CODES
+                and attempt <= self.session.retries
+            ):
+                delay = self.session.backoff(
+                    attempt, response.headers.get("Retry-After")
+                )
+                self.log.warning(
+                    f"{prefix}-004W {method} {url} returned {response.status_code}, retry {attempt} in {delay:.2f}s"
+                )
+                response.close()
+                time.sleep(delay)
+                continue
+
+            break
+
+        if response.status_code not in expected:
+            self.log.debug(
+                f"{prefix}-002E An unexpected statuscode {response.status_code} has been received:"
+            )
+            if not stream:
+                self.log.debug(f"         {response.text}")
+            errors = {
+                "rc": 8,
+                "status_code": response.status_code,
+                "reason": response.reason,
+            }
+            return RESULT(
+                rc=8,
+                errors=errors,
+                response=response,
+                attempts=attempt,
+                elapsed=time.monotonic() - started,
+            )
+
+        return RESULT(
+            rc=0,
+            errors={},
+            response=response,
+            attempts=attempt,
+            elapsed=time.monotonic() - started,
+        )
+
+    def authenticate(self, headers: dict, verify: bool = True) -> dict:
+        """
+        Replace Basic authentication by the session token, if the session has one.
+
+        Args:
+            headers (dict).: The request headers.
+            verify (bool)..: Whether or not to verify SSL certificates (default True).
+
+        Returns:
+            dict: The headers to send.
+        """
+        token = self.session.token
+        if token is None or not self.logon(verify=verify):
+            return headers
+
+        headers = {k: v for k, v in headers.items() if k != "Authorization"}
+        headers["Cookie"] = token.cookie()
+        return headers
+
+    def logon(self, verify: bool = True) -> bool:
+        """
+        Obtain a session token from the z/OSMF authentication service, unless a
+        valid one is cached. If z/OSMF does not hand out a token, user and
+        password are used for the rest of the session.
+
+        Args:
+            verify (bool): Whether or not to verify SSL certificates (default True).
+
+        Returns:
+            bool: True if a valid token is available.
+        """
+        token = self.session.token
+        with token.lock:
+            if token.valid():
+                return True
+            if token.failed:
+                return False
+
+            url = f"{self.path_to_api}/services/authenticate"
+            try:
+                response = self.session.post(
+                    url,
+                    headers=self.headers,
+                    verify=verify,
+                    timeout=(self.session.connect_timeout, self.session.read_timeout),
+                )
+            except requests.exceptions.RequestException as e:
+                self.log.debug(f"CLIENT-000D Logon to {url} failed with {e}")
+                return False
+
+            if response.status_code != 200 or not token.update(response):
+                token.failed = True
+                self.log.warning(
+                    f"CLIENT-005W No session token received from {url} (status {response.status_code}), using Basic authentication"
+                )
+                return False
+
+            self.log.debug(f"CLIENT-000D Logged on to {url}, received {token.name}")
+            return True
+
     def verify_off(self):
         pass
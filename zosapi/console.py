@@ -1,14 +1,24 @@
 import json
-import sys
-import requests
 
 from zosapi import client as C
 
 
-class CONSOLE(C.CLIENT):
-    errors: dict = {}
-    rc: int = 0
+def command_request(
+    client: C.CLIENT, command: str, console_name: str = "defcn"
+) -> tuple[str, str]:
+    """
+    Build the request of CONSOLE.issue_zos_command(), shared with the
+    asynchronous client.
+
+    Returns:
+        str: The URL.
+        str: The request body.
+    """
+    url = f"{client.path_to_api}/restconsoles/consoles/{console_name}"
+    return url, json.dumps({"cmd": command})
+
 
+class CONSOLE(C.CLIENT):
     def issue_zos_command(
         self, command: str, console_name: str = "defcn", verify: bool = True
     ):
@@ -27,36 +37,9 @@ class CONSOLE(C.CLIENT):
             dict: Dictionary with errors or empty dict.
             list: Command response or in case of an error empty list.
         """
-        url = f"{self.path_to_api}/restconsoles/consoles/{console_name}"
-        data = {
-            "cmd": command,
-        }
-        # Convert Python to JSON
-        json_object = json.dumps(data)
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-        try:
-            response = requests.put(
-                url, headers=self.headers, data=json_object, verify=verify
-            )
-        except Exception as e:
-            CONSOLE.rc = 16
-            CONSOLE.errors = {"rc": CONSOLE.rc, "request_error": e}
-            self.log.critical(
-                f"CONSOLE-001S Catched and unexpected exception, can not continue {str(CONSOLE.errors)}"
-            )
-            sys.exit(CONSOLE.rc)
-
-        if response.status_code != 200:
-            self.log.debug(
-                f"CONSOLE-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"            {response.text}")
-            CONSOLE.rc = 8
-            CONSOLE.errors = {
-                "rc": CONSOLE.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-
-        return CONSOLE.errors, response
+        url, data = command_request(self, command, console_name)
+        result = self.request(
+            "PUT", url, expected=(200,), data=data, verify=verify
+        )
+
+        return result
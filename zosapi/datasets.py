@@ -1,13 +1,88 @@
-import sys
-import requests
-
 from zosapi import client as d
 
 
-class DATASETS(d.CLIENT):
-    errors: dict = {}
-    rc: int = 0
+def list_request(
+    client: d.CLIENT, dsn_level: str, volser: str = "", start: str = ""
+) -> tuple[str, dict]:
+    """
+    Build the request of DATASETS.zosapi_datasets_list(), shared with the
+    asynchronous client.
+
+    Returns:
+        str: The URL.
+        dict: The request headers.
+    """
+    url = f"{client.path_to_api}/restfiles/ds"
+    if dsn_level != "":
+        url = url + f"?dslevel={dsn_level}"
+    if volser != "":
+        url = url + f"&volser={volser}"
+    if start != "":
+        url = url + f"&start={start}"
+
+    headers = dict(client.headers)
+    headers["X-IBM-Attributes"] = "base,total"
+    headers["X-IBM-Max-Items"] = "0"
+    return url, headers
+
+
+def members_list_request(
+    client: d.CLIENT, dataset_name: str, pattern: str = ""
+) -> tuple[str, dict]:
+    """
+    Build the request of DATASETS.zosapi_datasets_members_list(), shared with
+    the asynchronous client.
+
+    Returns:
+        str: The URL.
+        dict: The request headers.
+    """
+    url = f"{client.path_to_api}/restfiles/ds/{dataset_name}/member"
+    if pattern != "":
+        url = url + f"?pattern={pattern}"
+
+    headers = dict(client.headers)
+    headers["X-IBM-Attributes"] = "base,total"
+    headers["X-IBM-Max-Items"] = "0"
+    return url, headers
+
+
+def read_request(
+    client: d.CLIENT,
+    dataset_name: str,
+    volser: str = "",
+    member: str = "",
+    encoding: str = "",
+    enq_exclusive: bool = False,
+) -> tuple[str, dict]:
+    """
+    Build the request of DATASETS.zosapi_datasets_read(), shared with the
+    asynchronous client.
+
+    Returns:
+        str: The URL.
+        dict: The request headers.
+    """
+    url = f"{client.path_to_api}/restfiles/ds"
+    if volser != "":
+        url = url + f"/-({volser})"
+    if dataset_name != "":
+        url = url + f"/{dataset_name}"
+    if member != "":
+        url = url + f"({member})"
+
+    headers = dict(client.headers)
+    headers["X-IBM-Data-Type"] = "text"
+    headers["X-IBM-Obtain-ENQ"] = "SHRW"
+    headers["X-IBM-Return-Etag"] = "true"
+    if enq_exclusive:
+        headers["X-IBM-Obtain-ENQ"] = "EXCLU"
+    if encoding != "":
+        headers["X-IBM-Dsname-Encoding"] = f"{encoding}"
+    return url, headers
 
+
+class DATASETS(d.CLIENT):
     def zosapi_datasets_list(
         self, dsn_level: str, volser: str = "", start: str = "", verify: bool = True
     ):
@@ -25,43 +100,13 @@ class DATASETS(d.CLIENT):
             response: Command response or in case of an error empty list.
         """
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
+        url, headers = list_request(self, dsn_level, volser, start)
 
-        url = f"{self.path_to_api}/restfiles/ds"
-        if dsn_level != "":
-            url = url + f"?dslevel={dsn_level}"
-        if volser != "":
-            url = url + f"&volser={volser}"
-        if start != "":
-            url = url + f"&start={start}"
-
-        self.headers["X-IBM-Attributes"] = "base,total"
-        self.headers["X-IBM-Max-Items"] = "0"
-
-        try:
-            response = requests.get(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            DATASETS.rc = 16
-            DATASETS.errors = {"rc": DATASETS.rc, "request_error": e}
-            self.log.critical(
-                f"DATASETS-001S Catched an unexpected exception, can not continue {str(DATASETS.errors)}"
-            )
-            sys.exit(DATASETS.rc)
-
-        if response.status_code != 200:
-            self.log.debug(
-                f"DATASETS-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"             {response.text}")
-            DATASETS.rc = 8
-            DATASETS.errors = {
-                "rc": DATASETS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-
-        return DATASETS.errors, response
+        result = self.request(
+            "GET", url, expected=(200,), headers=headers, verify=verify
+        )
+
+        return result
 
     def zosapi_datasets_members_list(
         self, dataset_name: str, pattern: str = "", verify: bool = True
@@ -79,40 +124,13 @@ class DATASETS(d.CLIENT):
             response: Command response or in case of an error empty list.
         """
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
-        url = f"{self.path_to_api}/restfiles/ds/{dataset_name}/member"
-
-        if pattern != "":
-            url = url + f"&pattern={pattern}"
-
-        self.headers["X-IBM-Attributes"] = "base,total"
-        self.headers["X-IBM-Max-Items"] = "0"
-
-        try:
-            response = requests.get(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            DATASETS.rc = 16
-            DATASETS.errors = {"rc": DATASETS.rc, "request_error": e}
-            self.log.critical(
-                f"DATASETS-001S Catched an unexpected exception, can not continue {str(DATASETS.errors)}"
-            )
-            sys.exit(DATASETS.rc)
-
-        if response.status_code != 200:
-            self.log.debug(
-                f"DATASETS-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"             {response.text}")
-            DATASETS.rc = 8
-            DATASETS.errors = {
-                "rc": DATASETS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-
-        return DATASETS.errors, response
+        url, headers = members_list_request(self, dataset_name, pattern)
+
+        result = self.request(
+            "GET", url, expected=(200,), headers=headers, verify=verify
+        )
+
+        return result
 
     def zosapi_datasets_read(
         self,
@@ -139,49 +157,15 @@ class DATASETS(d.CLIENT):
             response: Command response or in case of an error empty list.
         """
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
+        url, headers = read_request(
+            self, dataset_name, volser, member, encoding, enq_exclusive
+        )
 
-        url = f"{self.path_to_api}/restfiles/ds"
+        result = self.request(
+            "GET", url, expected=(200,), headers=headers, verify=verify
+        )
 
-        if volser != "":
-            url = url + f"/-({volser})"
-        if dataset_name != "":
-            url = url + f"/{dataset_name}"
-        if member != "":
-            url = url + f"({member})"
-
-        self.headers["X-IBM-Data-Type"] = "text"
-        self.headers["X-IBM-Obtain-ENQ"] = "SHRW"
-        self.headers["X-IBM-Return-Etag"] = "true"
-        if enq_exclusive:
-            self.headers["X-IBM-Obtain-ENQ"] = "EXCLU"
-        if encoding != "":
-            self.headers["X-IBM-Dsname-Encoding"] = f"{encoding}"
-
-        try:
-            response = requests.get(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            DATASETS.rc = 16
-            DATASETS.errors = {"rc": DATASETS.rc, "request_error": e}
-            self.log.critical(
-                f"DATASETS-001S Catched an unexpected exception, can not continue {str(DATASETS.errors)}"
-            )
-            sys.exit(DATASETS.rc)
-
-        if response.status_code != 200:
-            self.log.debug(
-                f"DATASETS-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"             {response.text}")
-            DATASETS.rc = 8
-            DATASETS.errors = {
-                "rc": DATASETS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-
-        return DATASETS.errors, response
+        return result
 
     def zosapi_datasets_create(
         self,
@@ -232,9 +216,6 @@ class DATASETS(d.CLIENT):
             response: Command response or in case of an error empty list.
         """
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
         url = f"{self.path_to_api}/restfiles/ds/{ds_name}"
         payload = {
             "volser": volser,
@@ -255,33 +236,14 @@ class DATASETS(d.CLIENT):
             "like": like,
         }
 
-        self.headers["Content-Type"] = "application/json"
-
-        try:
-            response = requests.post(
-                url, headers=self.headers, json=payload, verify=verify
-            )
-        except Exception as e:
-            DATASETS.rc = 16
-            DATASETS.errors = {"rc": DATASETS.rc, "request_error": e}
-            self.log.critical(
-                f"DATASETS-001S Catched an unexpected exception, can not continue {str(DATASETS.errors)}"
-            )
-            sys.exit(DATASETS.rc)
-
-        if response.status_code != 201:
-            self.log.debug(
-                f"DATASETS-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"             {response.text}")
-            DATASETS.rc = 8
-            DATASETS.errors = {
-                "rc": DATASETS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-
-        return DATASETS.errors, response
+        headers = dict(self.headers)
+        headers["Content-Type"] = "application/json"
+
+        result = self.request(
+            "POST", url, expected=(201,), headers=headers, json=payload, verify=verify
+        )
+
+        return result
 
     def zosapi_datasets_delete(
         self,
@@ -313,33 +275,14 @@ class DATASETS(d.CLIENT):
         if member_name != "":
             url = url + f"/{member_name}"
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
-        self.headers["Content-Type"] = "application/json"
-
-        try:
-            response = requests.delete(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            DATASETS.rc = 16
-            DATASETS.errors = {"rc": DATASETS.rc, "request_error": e}
-            self.log.critical(
-                f"DATASETS-001S Catched an unexpected exception, can not continue {str(DATASETS.errors)}"
-            )
-            sys.exit(DATASETS.rc)
-        if response.status_code != 201:
-            self.log.debug(
-                f"DATASETS-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"             {response.text}")
-            DATASETS.rc = 8
-            DATASETS.errors = {
-                "rc": DATASETS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-
-        return DATASETS.errors, response
+        headers = dict(self.headers)
+        headers["Content-Type"] = "application/json"
+
+        result = self.request(
+            "DELETE", url, expected=(201,), headers=headers, verify=verify
+        )
+
+        return result
 
     def zosapi_datasets_utils(
         self,
@@ -356,10 +299,8 @@ class DATASETS(d.CLIENT):
     ):
         url = f"{self.path_to_api}/restfiles/ds/"
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
-        self.headers["Content-Type"] = "application/json"
+        headers = dict(self.headers)
+        headers["Content-Type"] = "application/json"
 
         data = "{ " + '"request": ' + '"' + f"{utility_name}" + '", {'
         if (
@@ -379,25 +320,8 @@ class DATASETS(d.CLIENT):
         data = data + " }"
         self.log.debug(f"DATASETS-000D Request body: {data}")
 
-        try:
-            response = requests.put(url, headers=self.headers, data=data, verify=verify)
-        except Exception as e:
-            DATASETS.rc = 16
-            DATASETS.errors = {"rc": DATASETS.rc, "request_error": e}
-            self.log.critical(
-                f"DATASETS-001S Catched an unexpected exception, can not continue {str(DATASETS.errors)}"
-            )
-            sys.exit(DATASETS.rc)
-        if response.status_code != 200:
-            self.log.debug(
-                f"DATASETS-002E Ans unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"             {response.text}")
-            DATASETS.rc = 8
-            DATASETS.errors = {
-                "rc": DATASETS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-
-        return DATASETS.errors, response
\ No newline at end of file
+        result = self.request(
+            "PUT", url, expected=(200,), headers=headers, data=data, verify=verify
+        )
+
+        return result
\ No newline at end of file
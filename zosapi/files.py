@@ -1,13 +1,47 @@
-import sys
-import requests
-
 from zosapi import client as f
 
 
-class FILES(f.CLIENT):
-    errors: dict = {}
-    rc: int = 0
+def list_url(client: f.CLIENT, file_path: str) -> str:
+    """
+    Build the URL of FILES.zosapi_files_list(), shared with the asynchronous
+    client.
+
+    Returns:
+        str: The URL.
+    """
+    url = f"{client.path_to_api}/restfiles/fs"
+    if file_path != "":
+        url = url + f"?path={file_path}"
+    return url
+
+
+def retrieve_request(
+    client: f.CLIENT,
+    zunix_file_name: str,
+    zunix_file_type: str = "text",
+    encoding: str = "IBM-1047",
+    charset: str = "ISO8859-1",
+) -> tuple[str, dict]:
+    """
+    Build the request of FILES.zosapi_files_retrieve(), shared with the
+    asynchronous client.
+
+    Returns:
+        str: The URL.
+        dict: The request headers.
+    """
+    url = f"{client.path_to_api}/restfiles/fs{zunix_file_name}"
+
+    headers = dict(client.headers)
+    headers["X-IBM-Data-Type"] = f"{zunix_file_type};fileEncoding={encoding}"
+    if zunix_file_type == "text":
+        headers["Content-Type"] = f"text/plain;charset={charset}"
+    else:
+        headers["Content-Type"] = "text/plain"
+    return url, headers
 
+
+class FILES(f.CLIENT):
     def zosapi_files_list(self, file_path: str, verify: bool = True):
         """
         Use this operation to list the files and directories in a z/UNIX
@@ -22,36 +56,11 @@ class FILES(f.CLIENT):
             response: Command response or in case of an error empty list.
         """
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
-        url = f"{self.path_to_api}/restfiles/fs"
-        if file_path != "":
-            url = url + f"?path={file_path}"
-
-        try:
-            response = requests.get(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            FILES.rc = 16
-            FILES.errors = {"rc": FILES.rc, "request_error": e}
-            self.log.critical(
-                f"FILES-001S Catched an unexpected exception, can not continue {str(FILES.errors)}"
-            )
-            sys.exit(FILES.rc)
+        url = list_url(self, file_path)
 
-        if response.status_code != 200:
-            self.log.debug(
-                f"FILES-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"           {response.text}")
-            FILES.rc = 8
-            FILES.errors = {
-                "rc": FILES.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request("GET", url, expected=(200,), verify=verify)
 
-        return FILES.errors, response
+        return result
 
     def zosapi_files_retrieve(
         self,
@@ -76,43 +85,15 @@ class FILES(f.CLIENT):
             response: Command response or in case of an error empty list.
         """
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
-        url = f"{self.path_to_api}/restfiles/fs{zunix_file_name}"
-
-        self.headers["X-IBM-Data-Type"] = f"{zunix_file_type};fileEncoding={encoding}"
-
-        if zunix_file_type == "text":
-            self.headers["Content-Type"] = f"text/plain;charset={charset}"
-        elif zunix_file_type == "binary":
-            self.headers["Content-Type"] = "text/plain"
-        else:
-            self.headers["Content-Type"] = "text/plain"
-
-        try:
-            response = requests.get(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            FILES.rc = 16
-            FILES.errors = {"rc": FILES.rc, "request_error": e}
-            self.log.critical(
-                f"FILES-001S Catched an unexpected exception, can not continue {str(FILES.errors)}"
-            )
-            sys.exit(FILES.rc)
+        url, headers = retrieve_request(
+            self, zunix_file_name, zunix_file_type, encoding, charset
+        )
 
-        if response.status_code != 200:
-            self.log.debug(
-                f"FILES-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"           {response.text}")
-            FILES.rc = 8
-            FILES.errors = {
-                "rc": FILES.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request(
+            "GET", url, expected=(200,), headers=headers, verify=verify
+        )
 
-        return FILES.errors, response
+        return result
 
     def zosapi_files_write(
         self,
@@ -141,54 +122,35 @@ class FILES(f.CLIENT):
             response: Command response or in case of an error empty list.
         """
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
         url = f"{self.path_to_api}/restfiles/fs{zunix_file_name}"
 
+        headers = dict(self.headers)
+
         if etag != "":
-            self.headers["If-Match"] = etag
+            headers["If-Match"] = etag
 
-        self.headers["X-IBM-Data-Type"] = f"{zunix_file_type};fileEncoding={encoding}"
+        headers["X-IBM-Data-Type"] = f"{zunix_file_type};fileEncoding={encoding}"
         if zunix_file_type == "text":
-            self.headers["Content-Type"] = f"text/plain;charset={charset}"
+            headers["Content-Type"] = f"text/plain;charset={charset}"
         elif zunix_file_type == "binary":
-            self.headers["Content-Type"] = "text/plain"
+            headers["Content-Type"] = "text/plain"
         else:
             self.log.error(
                 f"FILES-003E An unkown file_type of {zunix_file_type} has been specified."
             )
-            FILES.rc = 12
-            FILES.errors = {
+            rc = 12
+            errors = {
                 "rc": 12,
                 "status_code": None,
                 "reason": f"An unkown file_type {zunix_file_type}, only text/binary allowed",
             }
-            return FILES.errors, {}
-
-        try:
-            response = requests.put(url, headers=self.headers, data=data, verify=verify)
-        except Exception as e:
-            FILES.rc = 16
-            FILES.errors = {"rc": FILES.rc, "request_error": e}
-            self.log.critical(
-                f"FILES-001S Catched an unexpected exception, can not continue {str(FILES.errors)}"
-            )
-            sys.exit(FILES.rc)
+            return f.RESULT(rc, errors)
 
-        if response.status_code != 201 and response.status_code != 204:
-            self.log.debug(
-                f"FILES-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"           {response.text}")
-            FILES.rc = 8
-            FILES.errors = {
-                "rc": FILES.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request(
+            "PUT", url, expected=(201, 204), headers=headers, data=data, verify=verify
+        )
 
-        return FILES.errors, response
+        return result
     
 
     def zosapi_files_create(
@@ -212,37 +174,14 @@ class FILES(f.CLIENT):
             response: Command response or in case of an error empty list.
         """
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
         url = f"{self.path_to_api}/restfiles/fs{zunix_file_path}"
         print(url)
 
         data = {"type": zunix_type, "mode": zunix_file_mode.upper()}
 
-        try:
-            response = requests.post(url, headers=self.headers, json=data, verify=verify)
-        except Exception as e:
-            FILES.rc = 16
-            FILES.errors = {"rc": FILES.rc, "request_error": e}
-            self.log.critical(
-                f"FILES-001S Catched an unexpected exception, can not continue {str(FILES.errors)}"
-            )
-            sys.exit(FILES.rc)
+        result = self.request("POST", url, expected=(201,), json=data, verify=verify)
 
-        if response.status_code != 201:
-            self.log.debug(
-                f"FILES-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"           {response.text}")
-            FILES.rc = 8
-            FILES.errors = {
-                "rc": FILES.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-
-        return FILES.errors, response
+        return result
     
 
     def zosapi_files_delete(
@@ -264,37 +203,18 @@ class FILES(f.CLIENT):
             response: Command response or in case of an error empty list.
         """
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
         url = f"{self.path_to_api}/restfiles/fs{zunix_file_path}"
 
+        headers = dict(self.headers)
+
         if recursive:
-            self.headers["X-IBM-Option"] = "recursive"  
+            headers["X-IBM-Option"] = "recursive"  
         
-        try:
-            response = requests.delete(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            FILES.rc = 16
-            FILES.errors = {"rc": FILES.rc, "request_error": e}
-            self.log.critical(
-                f"FILES-001S Catched an unexpected exception, can not continue {str(FILES.errors)}"
-            )
-            sys.exit(FILES.rc)
-
-        if response.status_code != 204:
-            self.log.debug(
-                f"FILES-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"           {response.text}")
-            FILES.rc = 8
-            FILES.errors = {
-                "rc": FILES.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request(
+            "DELETE", url, expected=(204,), headers=headers, verify=verify
+        )
 
-        return FILES.errors, response
+        return result
     
     def zosapi_files_util_chmod(
         self,
@@ -319,9 +239,6 @@ class FILES(f.CLIENT):
             response: Command response or in case of an error empty list.
         """
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
         url = f"{self.path_to_api}/restfiles/fs{zunix_file_path}"
 
         str_link = "follow"
@@ -335,29 +252,9 @@ class FILES(f.CLIENT):
             "recursive": recursive
         }
 
-        try:
-            response = requests.put(url, headers=self.headers, json=data, verify=verify)
-        except Exception as e:
-            FILES.rc = 16
-            FILES.errors = {"rc": FILES.rc, "request_error": e}
-            self.log.critical(
-                f"FILES-001S Catched an unexpected exception, can not continue {str(FILES.errors)}"
-            )
-            sys.exit(FILES.rc)
+        result = self.request("PUT", url, expected=(200,), json=data, verify=verify)
 
-        if response.status_code != 200:
-            self.log.debug(
-                f"FILES-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"           {response.text}")
-            FILES.rc = 8
-            FILES.errors = {
-                "rc": FILES.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-
-        return FILES.errors, response
+        return result
     
     def zosapi_files_util_chown(
         self,
@@ -384,9 +281,6 @@ class FILES(f.CLIENT):
             response: Command response or in case of an error empty list.
         """
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
         url = f"{self.path_to_api}/restfiles/fs{zunix_file_path}"
 
         str_link = "follow"
@@ -401,29 +295,9 @@ class FILES(f.CLIENT):
             "recursive": recursive
         }
 
-        try:
-            response = requests.put(url, headers=self.headers, json=data, verify=verify)
-        except Exception as e:
-            FILES.rc = 16
-            FILES.errors = {"rc": FILES.rc, "request_error": e}
-            self.log.critical(
-                f"FILES-001S Catched an unexpected exception, can not continue {str(FILES.errors)}"
-            )
-            sys.exit(FILES.rc)
+        result = self.request("PUT", url, expected=(200,), json=data, verify=verify)
 
-        if response.status_code != 200:
-            self.log.debug(
-                f"FILES-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"           {response.text}")
-            FILES.rc = 8
-            FILES.errors = {
-                "rc": FILES.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-
-        return FILES.errors, response
+        return result
 
     def zosapi_files_util_chtag(
         self,
@@ -452,9 +326,6 @@ class FILES(f.CLIENT):
             response: Command response or in case of an error empty list.
         """
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
         url = f"{self.path_to_api}/restfiles/fs{zunix_file_path}"
 
         str_link = "change"
@@ -472,29 +343,9 @@ class FILES(f.CLIENT):
         if action == "set":
             data["codeset"] = codeset
 
-        try:
-            response = requests.put(url, headers=self.headers, json=data, verify=verify)
-        except Exception as e:
-            FILES.rc = 16
-            FILES.errors = {"rc": FILES.rc, "request_error": e}
-            self.log.critical(
-                f"FILES-001S Catched an unexpected exception, can not continue {str(FILES.errors)}"
-            )
-            sys.exit(FILES.rc)
+        result = self.request("PUT", url, expected=(200,), json=data, verify=verify)
 
-        if response.status_code != 200:
-            self.log.debug(
-                f"FILES-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"           {response.text}")
-            FILES.rc = 8
-            FILES.errors = {
-                "rc": FILES.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-
-        return FILES.errors, response
+        return result
     
     def zosapi_files_util_extattr(
         self,
@@ -517,9 +368,6 @@ class FILES(f.CLIENT):
             response: Command response or in case of an error empty list.
         """
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
         url = f"{self.path_to_api}/restfiles/fs{zunix_file_path}"
 
         data = {
@@ -529,27 +377,7 @@ class FILES(f.CLIENT):
         if action != "" and attributes != "":
             data[f"{action}"] = attributes
 
-        try:
-            response = requests.put(url, headers=self.headers, json=data, verify=verify)
-        except Exception as e:
-            FILES.rc = 16
-            FILES.errors = {"rc": FILES.rc, "request_error": e}
-            self.log.critical(
-                f"FILES-001S Catched an unexpected exception, can not continue {str(FILES.errors)}"
-            )
-            sys.exit(FILES.rc)
-
-        if response.status_code != 200:
-            self.log.debug(
-                f"FILES-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"           {response.text}")
-            FILES.rc = 8
-            FILES.errors = {
-                "rc": FILES.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request("PUT", url, expected=(200,), json=data, verify=verify)
 
-        return FILES.errors, response
+        return result
 
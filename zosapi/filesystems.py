@@ -1,13 +1,7 @@
-import sys
-import requests
-
 from zosapi import client as f
 
 
 class FILESYSTEMS(f.CLIENT):
-    errors: dict = {}
-    rc: int = 0
-
     def zosapi_filessystems_create(
             self, 
             zfs_dataset_name: str, 
@@ -42,9 +36,6 @@ class FILESYSTEMS(f.CLIENT):
             error: Dictionalry with return code and error messages if any.
             response: Command response or in case of an error empty list.
         """
-        
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
 
         url = f"{self.path_to_api}/restfiles/mfs/zfs"
         if zfs_dataset_name != "":
@@ -70,29 +61,9 @@ class FILESYSTEMS(f.CLIENT):
         if volumes != []:
             data["volumes"] = volumes
 
-        try:
-            response = requests.post(url, headers=self.headers, json=data, verify=verify)
-        except Exception as e:
-            FILESYSTEMS.rc = 16
-            FILESYSTEMS.errors = {"rc": FILESYSTEMS.rc, "request_error": e}
-            self.log.critical(
-                f"FILES-001S Catched an unexpected exception, can not continue {str(FILESYSTEMS.errors)}"
-            )
-            sys.exit(FILESYSTEMS.rc)
-
-        if response.status_code != 201:
-            self.log.debug(
-                f"FILES-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"           {response.text}")
-            FILESYSTEMS.rc = 8
-            FILESYSTEMS.errors = {
-                "rc": FILESYSTEMS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request("POST", url, expected=(201,), json=data, verify=verify)
 
-        return FILESYSTEMS.errors, response
+        return result
 
     def zosapi_filessystems_delete(
             self, 
@@ -110,37 +81,14 @@ class FILESYSTEMS(f.CLIENT):
             error: Dictionalry with return code and error messages if any.
             response: Command response or in case of an error empty list.
         """
-        
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
 
         url = f"{self.path_to_api}/restfiles/mfs/zfs"
         if zfs_dataset_name != "":
             url = url + f"/{zfs_dataset_name}"
 
-        try:
-            response = requests.delete(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            FILESYSTEMS.rc = 16
-            FILESYSTEMS.errors = {"rc": FILESYSTEMS.rc, "request_error": e}
-            self.log.critical(
-                f"FILES-001S Catched an unexpected exception, can not continue {str(FILESYSTEMS.errors)}"
-            )
-            sys.exit(FILESYSTEMS.rc)
+        result = self.request("DELETE", url, expected=(201,), verify=verify)
 
-        if response.status_code != 201:
-            self.log.debug(
-                f"FILES-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"           {response.text}")
-            FILESYSTEMS.rc = 8
-            FILESYSTEMS.errors = {
-                "rc": FILESYSTEMS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-
-        return FILESYSTEMS.errors, response
+        return result
     
     def zosapi_filessystems_mount_unmount(
             self, 
@@ -168,9 +116,6 @@ class FILESYSTEMS(f.CLIENT):
             error: Dictionalry with return code and error messages if any.
             response: Command response or in case of an error empty list.
         """
-        
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
 
         url = f"{self.path_to_api}/restfiles/mfs/{file_system_name}"
 
@@ -187,29 +132,9 @@ class FILESYSTEMS(f.CLIENT):
             else:
                 data["mode"] = data["mode"] + " nosetuid"
 
-        try:
-            response = requests.put(url, headers=self.headers, json=data, verify=verify)
-        except Exception as e:
-            FILESYSTEMS.rc = 16
-            FILESYSTEMS.errors = {"rc": FILESYSTEMS.rc, "request_error": e}
-            self.log.critical(
-                f"FILES-001S Catched an unexpected exception, can not continue {str(FILESYSTEMS.errors)}"
-            )
-            sys.exit(FILESYSTEMS.rc)
-
-        if response.status_code != 200 and response.status_code != 204:
-            self.log.debug(
-                f"FILES-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"           {response.text}")
-            FILESYSTEMS.rc = 8
-            FILESYSTEMS.errors = {
-                "rc": FILESYSTEMS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request("PUT", url, expected=(200, 204), json=data, verify=verify)
 
-        return FILESYSTEMS.errors, response
+        return result
 
     def zosapi_filessystems_list(
             self, 
@@ -229,9 +154,6 @@ class FILESYSTEMS(f.CLIENT):
             error: Dictionalry with return code and error messages if any.
             response: Command response or in case of an error empty list.
         """
-        
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
 
         if file_system_name != "":
             url = f"{self.path_to_api}/restfiles/mfs/?fsname={file_system_name}"
@@ -240,27 +162,7 @@ class FILESYSTEMS(f.CLIENT):
         else:
             url = f"{self.path_to_api}/restfiles/mfs"
 
-        try:
-            response = requests.get(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            FILESYSTEMS.rc = 16
-            FILESYSTEMS.errors = {"rc": FILESYSTEMS.rc, "request_error": e}
-            self.log.critical(
-                f"FILES-001S Catched an unexpected exception, can not continue {str(FILESYSTEMS.errors)}"
-            )
-            sys.exit(FILESYSTEMS.rc)
-
-        if response.status_code != 200 and response.status_code != 204:
-            self.log.debug(
-                f"FILES-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"           {response.text}")
-            FILESYSTEMS.rc = 8
-            FILESYSTEMS.errors = {
-                "rc": FILESYSTEMS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request("GET", url, expected=(200, 204), verify=verify)
 
-        return FILESYSTEMS.errors, response
+        return result
 
@@ -1,14 +1,306 @@
+import codecs
+import json
+import os
+import re
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-import requests
-
+from zosapi import cache as K
 from zosapi import client as C
+from zosapi import poll as P
+
+# Bytes written at a time when a spool file is streamed to disk
+SPOOL_CHUNK_SIZE: int = 1024 * 1024
+
+# Status of a job whose spool content does not change any more
+COMPLETED: str = "OUTPUT"
+
+
+def return_code(retcode: str | None) -> int:
+    """_Map the retcode of a job or the completion code of a step to a return code_
+
+    Args:
+        retcode (str | None): _e.g. "CC 0004", "ABEND S0C4" or "JCL ERROR"._
+
+    Returns:
+        int: _The condition code of "CC nnnn" up to 255, 0 if there is none,
+             16 for abends, JCL and security errors and cancelled jobs._
+    """
+    if retcode is None or retcode.strip() == "":
+        return 0
+    match = re.fullmatch(r"\s*CC\s+(\d+)\s*", retcode)
+    if match is None:
+        return 16
+    return min(int(match.group(1)), 255)
+
+
+def read_job_manifest(path: str) -> list:
+    """_Read the jobs and their dependencies for JOBS.submit_many()_
+
+    The manifest is JSON, e.g.
+
+        {"jobs": [{"name": "A", "file": "a.jcl"},
+                  {"name": "B", "file": "b.jcl", "after": {"A": 4}}]}
+
+    name defaults to file, a relative file is relative to the manifest. after
+    maps the jobs to wait for to the highest return code they may end with; a
+    list of names is the same as all of them with 0.
+
+    Args:
+        path (str): _The manifest file._
+
+    Returns:
+        list: _One dict per job with name, file and after (dict), in the order of
+              the manifest._
+    """
+    try:
+        with open(path, "r") as f:
+            manifest = json.load(f)
+        entries = manifest["jobs"]
+        jobs: list = []
+        for entry in entries:
+            after = entry.get("after") or {}
+            if isinstance(after, list):
+                after = {name: 0 for name in after}
+            jobs.append(
+                {
+                    "name": str(entry.get("name") or entry["file"]),
+                    "file": os.path.join(os.path.dirname(os.path.abspath(path)), entry["file"]),
+                    "after": {str(name): int(rc) for name, rc in after.items()},
+                }
+            )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"JOBS-014E {path} is not a job manifest: {e!r}")
+
+    names = [job["name"] for job in jobs]
+    for job in jobs:
+        if names.count(job["name"]) > 1:
+            raise ValueError(f"JOBS-014E {path}: job {job['name']} is defined more than once")
+        for name in job["after"]:
+            if name not in names:
+                raise ValueError(f"JOBS-014E {path}: job {job['name']} waits for {name}, which is not defined")
+
+    # Drop the jobs that wait for nothing that is left, whatever remains is a cycle
+    waiting = {job["name"]: set(job["after"]) for job in jobs}
+    while True:
+        ready = [name for name, after in waiting.items() if after.isdisjoint(waiting)]
+        if ready == []:
+            break
+        for name in ready:
+            del waiting[name]
+    if waiting != {}:
+        raise ValueError(f"JOBS-014E {path}: jobs {', '.join(sorted(waiting))} wait for each other")
+
+    return jobs
+
+
+def max_step_rc(job: dict) -> int:
+    """_The highest return code of the steps of a complete job_
+
+    Args:
+        job (dict): _The job document with step data, e.g. from wait_for_job()._
+
+    Returns:
+        int: _The highest return_code() of the step completions and the job retcode._
+    """
+    codes = [return_code(step.get("completion")) for step in job.get("step-data") or []]
+    return max(codes + [return_code(job.get("retcode"))])
+
+
+def new_run(file_name: str) -> dict:
+    """_The record of a job run by JOBS.run_job() or JOBS.submit_many()_
+
+    Args:
+        file_name (str): _The JCL submitted._
+
+    Returns:
+        dict: _file, jobname, jobid, job-correlator, retcode, steps, rc, errors,
+              manifest and the times submitted, ended and saved, all still empty._
+    """
+    return {
+        "file": file_name,
+        "jobname": None,
+        "jobid": None,
+        "job-correlator": None,
+        "retcode": None,
+        "steps": [],
+        "rc": 0,
+        "errors": {},
+        "manifest": None,
+        "submitted": None,
+        "ended": None,
+        "saved": None,
+    }
+
+
+def fail_run(run: dict, result: C.RESULT) -> dict:
+    """_Record a failed request in a run_
+
+    Args:
+        run (dict)........: _The run, see new_run()._
+        result (RESULT)...: _The failed request._
+
+    Returns:
+        dict: _run, with rc raised to the one of result and its errors._
+    """
+    run["rc"] = max(run["rc"], result.rc)
+    run["errors"] = {
+        key: value if isinstance(value, (int, str)) else str(value)
+        for key, value in result.errors.items()
+    }
+    return run
+
+
+def end_run(run: dict, job: dict) -> dict:
+    """_Record the end of a job in a run_
+
+    Args:
+        run (dict)..: _The run, see new_run()._
+        job (dict)..: _The job document of the complete job, with step data._
+
+    Returns:
+        dict: _run, with retcode, steps, rc (max_step_rc()) and ended._
+    """
+    run["ended"] = time.time()
+    run["retcode"] = job.get("retcode")
+    run["steps"] = [
+        {
+            "step-name": step.get("step-name"),
+            "proc-step-name": step.get("proc-step-name"),
+            "completion": step.get("completion"),
+            "rc": return_code(step.get("completion")),
+        }
+        for step in job.get("step-data") or []
+    ]
+    run["rc"] = max_step_rc(job)
+    return run
+
+
+def parse_record_range(record_range: str) -> tuple[int, int | None]:
+    """_Parse an X-IBM-Record-Range value_
+
+    Args:
+        record_range (str): _"SSS-EEE" (first and last record) or "SSS,NNN" (first
+                            record and number of records), records count from 0._
+
+    Returns:
+        int: _The first record._
+        int | None: _The record after the last one, None for all up to the end._
+    """
+    match = re.fullmatch(r"\s*(\d+)\s*([-,])\s*(\d*)\s*", record_range)
+    if match is None:
+        raise ValueError(f"JOBS-009E Invalid record range {record_range}")
+    start = int(match.group(1))
+    if match.group(3) == "":
+        return start, None
+    if match.group(2) == "-":
+        return start, int(match.group(3)) + 1
+    return start, start + int(match.group(3))
+
+
+def job_list_url(
+    client: C.CLIENT,
+    owner: str = "*",
+    prefix: str = "*",
+    max_jobs: int = 1000,
+    exec_data: str = "Y",
+    active_only: bool = False,
+) -> str:
+    """_The URL of JOBS.get_job_list(), shared with the asynchronous client_"""
+    url = f"{client.path_to_api}/restjobs/jobs?owner={owner}&prefix={prefix}&exec-data={exec_data}&max-jobs={max_jobs}"
+    if active_only:
+        url = url + "&status=active"
+    return url
+
+
+def job_url(
+    client: C.CLIENT, jobname: str, jobid: str, stepdata: str = "Y", files: bool = False
+) -> str:
+    """_The URL of JOBS.get_job_by_jobname_jobid(), shared with the asynchronous client_"""
+    if files:
+        return f"{client.path_to_api}/restjobs/jobs/{jobname}/{jobid}/files"
+    return f"{client.path_to_api}/restjobs/jobs/{jobname}/{jobid}?step-data={stepdata}"
+
+
+def job_files_url(
+    client: C.CLIENT, jobname: str = "", jobid: str = "", correlator: str = ""
+) -> tuple[dict, str]:
+    """_The URL of the spool files of a job, by job name and job ID or by correlator_
+
+    Args:
+        client (CLIENT)........: _The client the request is sent with._
+        jobname (str)..........: _The z/OS job name; cannot exceed 8 characters._
+        jobid (str)............: _The z/OS jobid of job name; cannot exceed 8 characters._
+        correlator (str).......: _The job correlator._
+
+    Returns:
+        dict: _Return Code and some details about the error, empty if the URL could be built._
+        str: _The URL._
+    """
+    url = f"{client.path_to_api}/restjobs/jobs"
+
+    if jobname != "":
+        if jobid == "":
+            client.log.error("JOBS-004E Job Name and Job ID required.")
+            return {
+                "rc": 8,
+                "status_code": "Job Name and Job ID required.",
+                "reason": "J01",
+            }, url
+        return {}, url + f"/{jobname}/{jobid}/files"
+
+    if correlator == "":
+        client.log.error("JOBS-005E One of Job Name and Job ID or Correlator required.")
+        return {
+            "rc": 8,
+            "status_code": "One of Job Name and Job ID or Correlator required.",
+            "reason": "J02",
+        }, url
+    return {}, url + f"/{correlator}/files"
+
+
+def submit_request(
+    client: C.CLIENT, file_name: str, jes_name: str = "", inline: bool = True
+) -> tuple[dict, str, dict, str]:
+    """_The request of JOBS.submit_job(), shared with the asynchronous client_
+
+    Args:
+        client (CLIENT).........: _The client the request is sent with._
+        file_name (str).........: _Name of the local file (inline) or z/Unix file with the JCL._
+        jes_name (str)..........: _Secondary JES name_. Defaults to ''.
+        inline (bool)...........: _Whether the JCL is sent inline or read from file_name on z/OS_. Defaults to True.
+
+    Returns:
+        dict: _Return Code and some details about the error, empty if the request could be built._
+        str: _The URL._
+        dict: _The request headers._
+        str: _The request body._
+    """
+    url = f"{client.path_to_api}/restjobs/jobs/"
+    if jes_name != "":
+        url = url + f"-{jes_name}"
+
+    headers = dict(client.headers)
+    if not inline:
+        headers["Content-Type"] = "application/json"
+        return {}, url, headers, json.dumps({"file": file_name})
+
+    headers["Content-Type"] = "text/plain"
+    try:
+        with open(file_name, "r") as f:
+            data = f.read()
+    except OSError as e:
+        client.log.error(f"JOBS-013E Unable to read {file_name}: {e}")
+        errors = {"rc": 16, "status_code": f"Unable to read {file_name}: {e}", "reason": "J05"}
+        return errors, url, headers, ""
+    client.log.debug(f"JOBS-000D submit_job() read file {file_name}")
+    client.log.debug(f"            data: {data}")
+    return {}, url, headers, data
 
 
 class JOBS(C.CLIENT):
-    errors: dict = {}
-    rc: int = 0
-
     def traverse_job_list(
         self, prefix: str, job_list: list, filter: str = "all"
     ) -> list:
@@ -62,8 +354,6 @@ class JOBS(C.CLIENT):
             dict: _Return Code and some details about the error_
             response: _Response object returned by z/OSMF._
         """
-        JOBS.rc: int = 0
-        JOBS.errors = {}
 
         self.log.debug("JOBS-000D get_job_list() entered with:")
         self.log.debug(f"                owner: {owner}")
@@ -72,40 +362,15 @@ class JOBS(C.CLIENT):
         self.log.debug(f"          active_only: {active_only}")
         self.log.debug(f"               verify: {verify}")
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
-        url = f"{self.path_to_api}/restjobs/jobs?owner={owner}&prefix={prefix}&exec-data={exec_data}&max-jobs={max_jobs}"
-
-        if active_only:
-            url = url + "&status=active"
-        try:
-            response = requests.get(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            JOBS.rc = 16
-            JOBS.errors = {"rc": JOBS.rc, "request_error": e}
-            self.log.critical(
-                f"JOBS-001S Catched and unexpected error, can not continue {str(JOBS.errors)}"
-            )
-            sys.exit(JOBS.rc)
-
-        if response.status_code != 200:
-            self.log.debug(
-                f"JOBS-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"         {response.text}")
-            JOBS.errors = {
-                "rc": JOBS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-            JOBS.rc = 8
+        url = job_list_url(self, owner, prefix, max_jobs, exec_data, active_only)
+        result = self.request("GET", url, expected=(200,), verify=verify)
+        response = result.response
 
         self.log.debug("JOBS-000D get_job_list() returned with:")
-        self.log.debug(f"            errors: {JOBS.errors}")
+        self.log.debug(f"            errors: {result.errors}")
         self.log.debug(f"          response: {response}")
 
-        return JOBS.errors, response
+        return result
 
     def get_job_by_jobname_jobid(
         self,
@@ -128,8 +393,6 @@ class JOBS(C.CLIENT):
             dict: _Return Code and some details about the error_
             response: _Response object returned by z/OSMF._
         """
-        JOBS.rc: int = 0
-        JOBS.errors = {}
 
         self.log.debug("JOBS-000D get_job_by_jobname_jobid() entered with:")
         self.log.debug(f"           Job Name: {jobname}")
@@ -138,40 +401,16 @@ class JOBS(C.CLIENT):
         self.log.debug(f"              Files: {files}")
         self.log.debug(f"             Verify: {verify}")
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
+        url = job_url(self, jobname, jobid, stepdata, files)
 
-        url = f"{self.path_to_api}/restjobs/jobs/{jobname}/{jobid}?step-data={stepdata}"
-        if files:
-            url = f"{self.path_to_api}/restjobs/jobs/{jobname}/{jobid}/files"
-
-        try:
-            response = requests.get(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            JOBS.rc = 16
-            JOBS.errors = {"rc": JOBS.rc, "request_error": e}
-            self.log.critical(
-                f"JOBS-001S Catched and unexpected error, can not continue {str(JOBS.errors)}"
-            )
-            sys.exit(JOBS.rc)
-
-        if response.status_code != 200:
-            self.log.debug(
-                f"JOBS-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"         {response.text}")
-            JOBS.rc = 8
-            JOBS.errors = {
-                "rc": JOBS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request("GET", url, expected=(200,), verify=verify)
+        response = result.response
 
         self.log.debug("JOBS-000D get_job_by_jobname_jobid() returned with:")
-        self.log.debug(f"            errors: {JOBS.errors}")
-        self.log.debug(f"          response: {response.json()}")
+        self.log.debug(f"            errors: {result.errors}")
+        self.log.debug(f"          response: {response}")
 
-        return JOBS.errors, response
+        return result
 
     def get_job_by_job_correlator(
         self,
@@ -187,13 +426,10 @@ class JOBS(C.CLIENT):
             correlator (str)....: _The z/OS jobs job correlator._
             verify (bool).......: _Whether or not to verify SSL certificates; default is True._
 
-
         Returns:
             dict: _Return Code and some details about the error_
             response: _Response object returned by z/OSMF._
         """
-        JOBS.rc: int = 0
-        JOBS.errors = {}
 
         self.log.debug("JOBS-000D get_job_by_job_correlator() entered with:")
         self.log.debug(f"          correlator: {correlator}")
@@ -205,33 +441,14 @@ class JOBS(C.CLIENT):
         if files:
             url = f"{self.path_to_api}/restjobs/jobs/{correlator}/files"
 
-        try:
-            response = requests.get(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            JOBS.rc = 16
-            JOBS.errors = {"rc": JOBS.rc, "request_error": e}
-            self.log.critical(
-                f"JOBS-001S Catched and unexpected error, can not continue {str(JOBS.errors)}"
-            )
-            sys.exit(JOBS.rc)
-
-        if response.status_code != 200:
-            JOBS.rc = 8
-            self.log.debug(
-                f"JOBS-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"         {response.text}")
-            JOBS.errors = {
-                "rc": JOBS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request("GET", url, expected=(200,), verify=verify)
+        response = result.response
 
         self.log.debug("JOBS-000D get_job_by_job_correlator() returned with:")
-        self.log.debug(f"            errors: {JOBS.errors}")
-        self.log.debug(f"          response: {response.json()}")
+        self.log.debug(f"            errors: {result.errors}")
+        self.log.debug(f"          response: {response}")
 
-        return JOBS.errors, response
+        return result
 
     def get_files_by_jobname_jobid(self, jobname: str, jobid: str, verify: bool = True):
         """_Get the spool files of a job by its jobname and jobid_
@@ -247,46 +464,22 @@ class JOBS(C.CLIENT):
             dict: _Return Code and some details about the error_
             response: _Response object returned by z/OSMF._
         """
-        JOBS.rc: int = 0
-        JOBS.errors = {}
 
         self.log.debug("JOBS-000D get_files_by_jobname_jobid() entered with:")
         self.log.debug(f"          Job Name: {jobname}")
         self.log.debug(f"            Job ID: {jobid}")
         self.log.debug(f"            Verify: {verify}")
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
-        url = f"{self.path_to_api}/restjobs/jobs/{jobname}/{jobid}/files"
+        url = job_url(self, jobname, jobid, files=True)
 
-        try:
-            response = requests.get(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            JOBS.rc = 16
-            JOBS.errors = {"rc": JOBS.rc, "request_error": e}
-            self.log.critical(
-                f"JOBS-001S Catched and unexpected error, can not continue {str(JOBS.errors)}"
-            )
-            sys.exit(JOBS.rc)
-
-        if response.status_code != 200:
-            JOBS.rc = 8
-            self.log.debug(
-                f"JOBS-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"         {response.text}")
-            JOBS.errors = {
-                "rc": JOBS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request("GET", url, expected=(200,), verify=verify)
+        response = result.response
 
         self.log.debug("JOBS-000D get_files_by_jobname_jobid() returned with:")
-        self.log.debug(f"            errors: {JOBS.errors}")
-        self.log.debug(f"          response: {response.json()}")
+        self.log.debug(f"            errors: {result.errors}")
+        self.log.debug(f"          response: {response}")
 
-        return JOBS.errors, response
+        return result
 
     def get_files_by_job_correlator(self, correlator: str, verify: bool = True):
         """_Get the spool files of a jobs correlator_
@@ -300,45 +493,21 @@ class JOBS(C.CLIENT):
             dict: _Return Code and some details about the error_
             response: _Response object returned by z/OSMF._
         """
-        JOBS.rc: int = 0
-        JOBS.errors = {}
 
         self.log.debug("JOBS-000D get_files_by_job_correlator() entered with:")
         self.log.debug(f"          correlator: {correlator}")
         self.log.debug(f"              Verify: {verify}")
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
         url = f"{self.path_to_api}/restjobs/jobs/{correlator}/files"
 
-        try:
-            response = requests.get(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            JOBS.rc = 16
-            JOBS.errors = {"rc": JOBS.rc, "request_error": e}
-            self.log.critical(
-                f"JOBS-001S Catched and unexpected error, can not continue {str(JOBS.errors)}"
-            )
-            sys.exit(JOBS.rc)
-
-        if response.status_code == 200:
-            JOBS.rc = 8
-            self.log.debug(
-                f"JOBS-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"         {response.text}")
-            JOBS.errors = {
-                "rc": JOBS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request("GET", url, expected=(200,), verify=verify)
+        response = result.response
 
         self.log.debug("JOBS-000D get_files_by_job_correlator() returned with:")
-        self.log.debug(f"            errors: {JOBS.errors}")
-        self.log.debug(f"          response: {response.json()}")
+        self.log.debug(f"            errors: {result.errors}")
+        self.log.debug(f"          response: {response}")
 
-        return JOBS.errors, response
+        return result
 
     def get_job_file_by_url(self, url: str, verify: bool = True):
         pass
@@ -350,6 +519,9 @@ class JOBS(C.CLIENT):
         jobid: str = "",
         correlator: str = "",
         verify: bool = True,
+        stream: bool = False,
+        cache: K.CACHE | None = None,
+        record_range: str = "",
     ):
         """Get a JES Spool File by its file ID._
 
@@ -360,96 +532,478 @@ class JOBS(C.CLIENT):
             correlator (str).......: _The job correlator._
                       id (str).....: _The id of the spool file to retrieve._
             verify (bool)..........: _Turn certificate verification on/off_. Defaults to True (on)._
+            stream (bool)..........: _Do not read the records up front_. Defaults to False.
+            cache (CACHE)..........: _Spool cache for completed jobs, see records()_. Defaults to None.
+            record_range (str).....: _The records to get, see parse_record_range()_. Defaults to all.
 
         Returns:
             dict: _Return Code and some details about the error_
             response: _Response object returned by z/OSMF._
         """
-        JOBS.rc: int = 0
-        JOBS.errors = {}
+        rc: int = 0
+        errors: dict = {}
 
         self.log.debug("JOBS-000D get_job_file_by_id() entered with:")
         self.log.debug(f"                    name: {jobname}")
         self.log.debug(f"                   jobid: {jobid}")
         self.log.debug(f"          job-correlator: {correlator}")
         self.log.debug(f"                      id: {fileid}")
+        self.log.debug(f"            record range: {record_range}")
         self.log.debug(f"                  Verify: {verify}")
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
-        url = f"{self.path_to_api}/restjobs/jobs"
-
-        if jobname != "":
-            url = url + f"/{jobname}"
-            if jobid != "":
-                url = url + f"/{jobid}/files"
-            else:
-                JOBS.rc = 8
-                self.log.error("JOBS-004E Job Name and Job ID required.")
-                response = None
-                JOBS.errors = {
-                    "rc": JOBS.rc,
-                    "status_code": "Job Name and Job ID required.",
-                    "reason": "J01",
-                }
-                return JOBS.errors, response
-        else:
-            if correlator != "":
-                url = url + f"/{correlator}/files"
-            else:
-                JOBS.rc = 8
-                self.log.error(
-                    "JOBS-005E One of Job Name and Job ID or Correlator required."
-                )
-                response = None
-                JOBS.errors = {
-                    "rc": JOBS.rc,
-                    "status_code": "One of Job Name and Job ID or Correlator required.",
-                    "reason": "J02",
-                }
-                return JOBS.errors, response
+        errors, url = job_files_url(self, jobname, jobid, correlator)
+        if errors:
+            return C.RESULT(errors["rc"], errors)
 
         if fileid != "":
             url = url + f"/{fileid}/records"
         else:
-            JOBS.rc = 8
+            rc = 8
             self.log.error("JOBS-007E A spool file id is required.")
             response = None
-            JOBS.errors = {
-                "rc": JOBS.rc,
+            errors = {
+                "rc": rc,
                 "status_code": "A spool file id is required.",
                 "reason": "J03",
             }
-            return JOBS.errors, response
+            return C.RESULT(rc, errors, response)
+
+        result = self.records(
+            url,
+            fileid,
+            jobname=jobname,
+            jobid=jobid,
+            correlator=correlator,
+            cache=cache,
+            verify=verify,
+            stream=stream,
+            record_range=record_range,
+        )
+        response = result.response
+
+        self.log.debug("JOBS-000D get_job_file_by_id() returned with:")
+        self.log.debug(f"            errors: {result.errors}")
+        self.log.debug(f"          response: {response}")
+
+        return result
+
+    def completed_job(
+        self, jobname: str = "", jobid: str = "", correlator: str = "", verify: bool = True
+    ) -> dict | None:
+        """_Get the job document of a job whose spool content can not change any more_
+
+        Args:
+            jobname (str)..........: _The z/OS job name; cannot exceed 8 characters._
+            jobid (str)............: _The z/OS jobid of job name; cannot exceed 8 characters._
+            correlator (str).......: _The job correlator._
+            verify (bool)..........: _Turn certificate verification on/off_. Defaults to True (on)._
+
+        Returns:
+            dict | None: _The job document, None if the job is not complete or unknown._
+        """
+        if jobname != "":
+            result = self.get_job_by_jobname_jobid(jobname, jobid, stepdata="N", verify=verify)
+        else:
+            result = self.get_job_by_job_correlator(correlator, stepdata="N", verify=verify)
+
+        job = result.body
+        if result.rc != 0 or not isinstance(job, dict) or job.get("status") != COMPLETED:
+            return None
+        return job
+
+    def job_key(self, correlator: str) -> list:
+        """_The spool cache key of the completion identity of a job, see records()_"""
+        return ["job", self.hostname, self.port, correlator]
+
+    def cached_job(self, cache: K.CACHE, correlator: str) -> dict | None:
+        """_Get the completion identity of a job known to be complete_
+
+        Args:
+            cache (CACHE)..........: _The spool cache._
+            correlator (str).......: _The job correlator._
+
+        Returns:
+            dict | None: _jobname, jobid, job-correlator and retcode, None if the job
+                         is not known to be complete._
+        """
+        content = cache.get(self.job_key(correlator))
+        if content is None:
+            return None
+        try:
+            job = json.loads(content)
+        except ValueError:
+            return None
+        self.log.debug(f"JOBS-000D {job.get('jobname')}({job.get('jobid')}) known to be complete with {job.get('retcode')}")
+        return job
+
+    def cache_job(self, cache: K.CACHE, job: dict) -> None:
+        """_Keep the completion identity of a complete job under its job correlator, see cached_job()_
+
+        Args:
+            cache (CACHE)..........: _The spool cache._
+            job (dict).............: _The job document of the complete job._
+        """
+        if not job.get("job-correlator"):
+            return
+        identity = {name: job.get(name) for name in ("jobname", "jobid", "job-correlator", "retcode")}
+        cache.put(self.job_key(job["job-correlator"]), json.dumps(identity).encode())
+
+    def records(
+        self,
+        url: str,
+        fileid: str,
+        jobname: str = "",
+        jobid: str = "",
+        correlator: str = "",
+        cache: K.CACHE | None = None,
+        verify: bool = True,
+        stream: bool = False,
+        record_range: str = "",
+    ):
+        """_Get the records of a spool file_
+
+        Once a job is complete its spool content does not change any more, so
+        with a cache the records of a completed job are kept under its job
+        correlator, job id and file id and served from the cache from then on.
+        A job id is given to a new job once its job is purged, a job
+        correlator is never reused, so the spool files are cached under the
+        job correlator. For a job asked for by job name and id, whether it is
+        complete and its job correlator are asked every time; for a job asked
+        for by correlator only once, its completion identity is kept in the
+        cache, so a later hit needs no request at all. A record range of a
+        cached spool file is cut from the cached records.
+
+        Args:
+            url (str)..............: _The records URL of the spool file._
+            fileid (str)...........: _The id of the spool file, JCL for the JCL._
+            jobname (str)..........: _The z/OS job name; cannot exceed 8 characters._
+            jobid (str)............: _The z/OS jobid of job name; cannot exceed 8 characters._
+            correlator (str).......: _The job correlator._
+            cache (CACHE)..........: _The spool cache_. Defaults to None, no caching.
+            verify (bool)..........: _Turn certificate verification on/off_. Defaults to True (on)._
+            stream (bool)..........: _Do not read the records up front, they are not cached then_.
+                                     Defaults to False.
+            record_range (str).....: _The records to get, see parse_record_range(); a range is
+                                     never cached_. Defaults to all.
+
+        Returns:
+            dict: _Return Code and some details about the error_
+            response: _Response object returned by z/OSMF._
+        """
+        key = None
+        if cache is not None:
+            job = self.cached_job(cache, correlator) if jobname == "" else None
+            if job is None:
+                job = self.completed_job(jobname, jobid, correlator, verify=verify)
+                if job is not None:
+                    self.cache_job(cache, job)
+            if job is not None:
+                key = [self.hostname, self.port, job.get("job-correlator"), job.get("jobid"), fileid]
+                content = cache.get(key)
+                if content is not None:
+                    self.log.debug(f"JOBS-000D Spool file {fileid} taken from cache {cache.path(key)}")
+                    if record_range != "":
+                        start, end = parse_record_range(record_range)
+                        content = b"".join(content.splitlines(keepends=True)[start:end])
+                    response = C.build_response(
+                        200, content, {"Content-Type": "text/plain"}, url=url, reason="OK"
+                    )
+                    return C.RESULT(0, {}, response)
+
+        headers = None
+        if record_range != "":
+            headers = dict(self.headers)
+            headers["X-IBM-Record-Range"] = record_range
+
+        result = self.request(
+            "GET", url, expected=(200,), headers=headers, verify=verify, stream=stream
+        )
+
+        if key is not None and result.rc == 0 and not stream and record_range == "":
+            cache.put(key, result.response.content)
+
+        return result
+
+    def get_record_count(
+        self,
+        fileid: str,
+        jobname: str = "",
+        jobid: str = "",
+        correlator: str = "",
+        verify: bool = True,
+    ):
+        """_Get the number of records of a spool file from the spool files of its job_
+
+        Args:
+            fileid (str)...........: _The id of the spool file._
+            jobname (str)..........: _The z/OS job name; cannot exceed 8 characters._
+            jobid (str)............: _The z/OS jobid of job name; cannot exceed 8 characters._
+            correlator (str).......: _The job correlator._
+            verify (bool)..........: _Turn certificate verification on/off_. Defaults to True (on)._
+
+        Returns:
+            RESULT: _The result of the spool files request._
+            int | None: _The record count, None if the spool file is unknown._
+        """
+        if jobname != "":
+            result = self.get_files_by_jobname_jobid(jobname, jobid, verify=verify)
+        else:
+            result = self.get_files_by_job_correlator(correlator, verify=verify)
+        if result.rc != 0:
+            return result, None
+
+        for ddname in result.body if isinstance(result.body, list) else []:
+            if str(ddname.get("id")) == str(fileid):
+                return result, ddname.get("record-count")
+
+        self.log.error(f"JOBS-010E Spool file {fileid} not found")
+        errors = {"rc": 8, "status_code": f"Spool file {fileid} not found", "reason": "J04"}
+        return C.RESULT(8, errors, result.response), None
+
+    def write_records(self, response, out=None) -> int:
+        """_Write the records of a response as they arrive_
 
+        Args:
+            response (Response)....: _A spool file response, streamed or not._
+            out (file).............: _Where to write_. Defaults to sys.stdout.
+
+        Returns:
+            int: _Number of characters written._
+        """
+        out = out or sys.stdout
+        decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+        count = 0
         try:
-            response = requests.get(url, headers=self.headers, verify=verify)
+            for chunk in response.iter_content(chunk_size=SPOOL_CHUNK_SIZE):
+                text = decoder.decode(chunk)
+                out.write(text)
+                count = count + len(text)
+            text = decoder.decode(b"", final=True)
+            out.write(text)
+        finally:
+            response.close()
+        return count + len(text)
+
+    def follow_job(
+        self,
+        jobname: str = "",
+        jobid: str = "",
+        correlator: str = "",
+        ddnames: tuple = (),
+        out=None,
+        cancel=None,
+        verify: bool = True,
+    ):
+        """_Write the records of a job's spool files as they are written_
+
+        Every poll reads the status of the job, then the spool files, and gets
+        only the records added to each file since the poll before. The interval
+        between polls starts at poll_interval of the session, grows while the
+        job writes nothing, up to poll_interval_max, and falls back once it
+        writes again. Following ends after the first poll that finds the job
+        complete, so its last records are never missed.
+
+        Args:
+            jobname (str)..........: _The z/OS job name; cannot exceed 8 characters._
+            jobid (str)............: _The z/OS jobid of job name; cannot exceed 8 characters._
+            correlator (str).......: _The job correlator._
+            ddnames (tuple)........: _Follow only these DD names_. Defaults to all.
+            out (file).............: _Where to write_. Defaults to sys.stdout.
+            cancel (Event).........: _Set it to stop following_. Defaults to None.
+            verify (bool)..........: _Turn certificate verification on/off_. Defaults to True (on)._
+
+        Returns:
+            dict: _Return Code and some details about the error_
+            response: _The last job document returned by z/OSMF._
+        """
+        out = out or sys.stdout
+        poller = P.POLLER(self, cancel=cancel)
+        seen: dict = {}
+        current = None
+        delay = poller.interval
+
+        while True:
+            if jobname != "":
+                job = self.get_job_by_jobname_jobid(jobname, jobid, stepdata="N", verify=verify)
+                files = self.get_files_by_jobname_jobid(jobname, jobid, verify=verify)
+            else:
+                job = self.get_job_by_job_correlator(correlator, stepdata="N", verify=verify)
+                files = self.get_files_by_job_correlator(correlator, verify=verify)
+            if job.rc != 0:
+                return job
+            # Spool files are not there until the job has been converted
+            if files.rc != 0 and files.status != 404:
+                return files
+
+            written = False
+            for ddname in files.body if files.rc == 0 and isinstance(files.body, list) else []:
+                if ddnames != () and ddname["ddname"] not in ddnames:
+                    continue
+                count = ddname.get("record-count") or 0
+                first = seen.get(ddname["id"], 0)
+                if count <= first:
+                    continue
+
+                result = self.get_job_file_by_id(
+                    fileid=str(ddname["id"]),
+                    jobname=jobname,
+                    jobid=jobid,
+                    correlator=correlator,
+                    verify=verify,
+                    stream=True,
+                    record_range=f"{first}-{count - 1}",
+                )
+                if result.rc != 0:
+                    return result
+                if current != ddname["id"]:
+                    out.write(f"==> {ddname.get('stepname') or 'JES'}.{ddname['ddname']} <==\n")
+                    current = ddname["id"]
+                self.write_records(result.response, out)
+                out.flush()
+                seen[ddname["id"]] = count
+                written = True
+
+            if job.body.get("status") == COMPLETED:
+                return job
+
+            delay = poller.interval if written else min(poller.interval_max, delay * poller.factor)
+            if poller.cancel.wait(delay):
+                self.log.warning(f"JOBS-011W Following {jobname or correlator} {jobid} cancelled")
+                return poller.failed("P03", "Following cancelled", job)
+
+    def save_job_file(
+        self,
+        fileid: str,
+        path: str,
+        jobname: str = "",
+        jobid: str = "",
+        correlator: str = "",
+        verify: bool = True,
+    ):
+        """_Stream a JES spool file to disk_
+
+        Args:
+            fileid (str)...........: _The id of the spool file to retrieve._
+            path (str).............: _The file to write, replaced once it is complete._
+            jobname (str)..........: _The z/OS job name; cannot exceed 8 characters._
+            jobid (str)............: _The z/OS jobid of job name; cannot exceed 8 characters._
+            correlator (str).......: _The job correlator._
+            verify (bool)..........: _Turn certificate verification on/off_. Defaults to True (on)._
+
+        Returns:
+            dict: _Return Code and some details about the error_
+            response: _Response object returned by z/OSMF._
+        """
+        result = self.get_job_file_by_id(
+            fileid=fileid,
+            jobname=jobname,
+            jobid=jobid,
+            correlator=correlator,
+            verify=verify,
+            stream=True,
+        )
+        if result.rc != 0:
+            return result
+
+        response = result.response
+        temporary = ""
+        try:
+            fd, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                for chunk in response.iter_content(chunk_size=SPOOL_CHUNK_SIZE):
+                    f.write(chunk)
+            os.replace(temporary, path)
         except Exception as e:
-            JOBS.rc = 16
-            JOBS.errors = {"rc": JOBS.rc, "request_error": e}
-            self.log.critical(
-                f"JOBS-001S Catched and unexpected error, can not continue {str(JOBS.errors)}"
+            errors = {"rc": 16, "request_error": e}
+            self.log.error(f"JOBS-008E Unable to write spool file {fileid} to {path}: {e}")
+            if temporary != "" and os.path.exists(temporary):
+                os.remove(temporary)
+            return C.RESULT(16, errors, response, result.attempts, result.elapsed)
+        finally:
+            response.close()
+
+        return result
+
+    def save_job_files(
+        self,
+        ddnames: list,
+        directory: str,
+        jobname: str = "",
+        jobid: str = "",
+        correlator: str = "",
+        parallel: int | None = None,
+        verify: bool = True,
+    ) -> dict:
+        """_Stream many JES spool files of a job to disk at the same time_
+
+        Every spool file is written to <directory>/<step>.<ddname>, followed by
+        .<id> if the name is taken already. A manifest.json listing the files
+        is written to the directory last.
+
+        Args:
+            ddnames (list).........: _The spool files as listed by get_files_by_jobname_jobid()._
+            directory (str)........: _The directory to write to, created if missing._
+            jobname (str)..........: _The z/OS job name; cannot exceed 8 characters._
+            jobid (str)............: _The z/OS jobid of job name; cannot exceed 8 characters._
+            correlator (str).......: _The job correlator._
+            parallel (int).........: _Spool files fetched at the same time_. Defaults to pool_maxsize.
+            verify (bool)..........: _Turn certificate verification on/off_. Defaults to True (on)._
+
+        Returns:
+            dict: _The manifest: jobname, jobid, directory and one entry per spool
+                  file with its file name, record and byte counts and rc._
+        """
+        os.makedirs(directory, exist_ok=True)
+        parallel = parallel or self.session.pool_maxsize
+
+        taken: set = set()
+        names: list = []
+        for ddname in ddnames:
+            name = f"{ddname.get('stepname') or 'JES'}.{ddname['ddname']}".replace("/", "_")
+            if name in taken:
+                name = f"{name}.{ddname['id']}"
+            taken.add(name)
+            names.append(name)
+
+        def save(index: int) -> C.RESULT:
+            return self.save_job_file(
+                fileid=str(ddnames[index]["id"]),
+                path=os.path.join(directory, names[index]),
+                jobname=jobname,
+                jobid=jobid,
+                correlator=correlator,
+                verify=verify,
             )
-            sys.exit(JOBS.rc)
 
-        if response.status_code != 200:
-            JOBS.rc = 8
-            self.log.debug(
-                f"JOBS-002E An unexpected statuscode {response.status_code} has been received:"
+        results: list = []
+        if ddnames != []:
+            with ThreadPoolExecutor(max_workers=min(parallel, len(ddnames))) as executor:
+                results = [*executor.map(save, range(len(ddnames)))]
+
+        files: list = []
+        for ddname, name, result in zip(ddnames, names, results):
+            path = os.path.join(directory, name)
+            files.append(
+                {
+                    "id": ddname["id"],
+                    "stepname": ddname.get("stepname"),
+                    "procstep": ddname.get("procstep"),
+                    "ddname": ddname["ddname"],
+                    "file": name,
+                    "record-count": ddname.get("record-count"),
+                    "byte-count": ddname.get("byte-count"),
+                    "bytes": os.path.getsize(path) if result.rc == 0 else 0,
+                    "rc": result.rc,
+                    "errors": {key: str(value) for key, value in result.errors.items()},
+                }
             )
-            self.log.debug(f"         {response.text}")
-            JOBS.errors = {
-                "rc": JOBS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
 
-        self.log.debug("JOBS-000D get_job_file_by_id() returned with:")
-        self.log.debug(f"            errors: {JOBS.errors}")
-        self.log.debug(f"          response: {response}")
+        manifest = {"jobname": jobname, "jobid": jobid, "directory": directory, "files": files}
+        with open(os.path.join(directory, "manifest.json"), "w") as f:
+            json.dump(manifest, f, indent=2)
 
-        return JOBS.errors, response
+        self.log.debug(f"JOBS-000D save_job_files() wrote {len(files)} spool files to {directory}")
+        return manifest
 
     def get_job_jcl(
         self,
@@ -457,6 +1011,7 @@ class JOBS(C.CLIENT):
         jobid: str = "",
         correlator: str = "",
         verify: bool = True,
+        cache: K.CACHE | None = None,
     ):
         """Get the jobs JCL.
 
@@ -467,86 +1022,49 @@ class JOBS(C.CLIENT):
             correlator (str).......: The job correlator.
                       id (str).....: The id of the spool file to retrieve.
             verify (bool)..........: Turn certificate verification on/off_. Defaults to True (on).
+            cache (CACHE)..........: Spool cache for completed jobs, see records(). Defaults to None.
 
         Returns:
             dict: Return Code and some details about the error
             response: Response object returned by z/OSMF.
         """
-        JOBS.rc: int = 0
-        JOBS.errors = {}
-
         self.log.debug("JOBS-000D get_job_jcl() entered with:")
         self.log.debug(f"                    name: {jobname}")
         self.log.debug(f"                   jobid: {jobid}")
         self.log.debug(f"          job-correlator: {correlator}")
         self.log.debug(f"                  Verify: {verify}")
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
-        url = f"{self.path_to_api}/restjobs/jobs"
-
-        if jobname != "":
-            url = url + f"/{jobname}"
-            if jobid != "":
-                url = url + f"/{jobid}/files"
-            else:
-                JOBS.rc = 8
-                self.log.error("JOBS-004E Job Name and Job ID required.")
-                response = None
-                JOBS.errors = {
-                    "rc": JOBS.rc,
-                    "status_code": "Job Name and Job ID required.",
-                    "reason": "J01",
-                }
-                return JOBS.errors, response
-        else:
-            if correlator != "":
-                url = url + f"/{correlator}/files"
-            else:
-                JOBS.rc = 8
-                self.log.error(
-                    "JOBS-005E One of Job Name and Job ID or Correlator required."
-                )
-                response = None
-                JOBS.errors = {
-                    "rc": JOBS.rc,
-                    "status_code": "One of Job Name and Job ID or Correlator required.",
-                    "reason": "J02",
-                }
-                return JOBS.errors, response
+        errors, url = job_files_url(self, jobname, jobid, correlator)
+        if errors:
+            return C.RESULT(errors["rc"], errors)
 
         url = url + "/JCL/records"
 
-        try:
-            response = requests.get(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            JOBS.rc = 16
-            JOBS.errors = {"rc": JOBS.rc, "request_error": e}
-            self.log.critical(
-                f"JOBS-001S Catched and unexpected error, can not continue {str(JOBS.errors)}"
-            )
-            sys.exit(JOBS.rc)
-
-        if response.status_code != 200:
-            JOBS.rc = 8
-            self.log.debug(
-                f"JOBS-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"         {response.text}")
-            JOBS.errors = {
-                "rc": JOBS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.records(
+            url,
+            "JCL",
+            jobname=jobname,
+            jobid=jobid,
+            correlator=correlator,
+            cache=cache,
+            verify=verify,
+        )
+        response = result.response
 
         self.log.debug("JOBS-000D get_job_jcl() returned with:")
-        self.log.debug(f"            errors: {JOBS.errors}")
+        self.log.debug(f"            errors: {result.errors}")
         self.log.debug(f"          response: {response}")
 
-        return JOBS.errors, response
+        return result
 
-    def submit_job(self, file_name: str, jes_name: str = "", inline: bool = True, verify: bool = True):
+    def submit_job(
+        self,
+        file_name: str,
+        jes_name: str = "",
+        inline: bool = True,
+        verify: bool = True,
+        notification_url: str = "",
+    ):
         """_Submit job to z/OS_
 
         Args:
@@ -554,67 +1072,330 @@ class JOBS(C.CLIENT):
             jes_name (str)..........: _Secondary JES name_. Defaults to ''.
             inline (bool)...........: _Whether the JCL is inline or in a file_. Defaults to True.
             verify (bool)...........: _Turn certificate verification on/off_. Defaults to True (on).
+            notification_url (str)..: _URL z/OSMF notifies once the job is complete, see
+                                      notify.LISTENER_. Defaults to '', no notification.
 
         Returns:
             dict: _Return Code and some details about the error_
             response: _Response object returned by z/OSMF._
         """
-        JOBS.rc: int = 0
-        JOBS.errors = {}
 
         self.log.debug("JOBS-000D submit_job() entered with:")
         self.log.debug(f"                   File Name: {file_name}")
         self.log.debug(f"          Secondary JES Name: {jes_name}")
+        self.log.debug(f"            Notification URL: {notification_url}")
         self.log.debug(f"                      Verify: {verify}")
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
+        errors, url, headers, data = submit_request(self, file_name, jes_name, inline)
+        if errors:
+            return C.RESULT(errors["rc"], errors)
 
-        url = f"{self.path_to_api}/restjobs/jobs/"
+        if notification_url != "":
+            headers["X-IBM-Notification-URL"] = notification_url
+            headers["X-IBM-Notification-Options"] = '{ "events": ["complete"] }'
 
-        if jes_name != "":
-            url = url + f"-{jes_name}"
+        result = self.request(
+            "PUT", url, expected=(201,), headers=headers, data=data, verify=verify
+        )
+        response = result.response
 
-        if inline:
-            self.headers["Content-Type"] = "text/plain"
-            with open(file_name, "r") as f:
-                data = f.read()
-            self.log.debug(f"JOBS-000D submit_job() read file {file_name}")
-            self.log.debug(f"            data: {data}")
-        else:
-            self.headers["Content-Type"] = "application/json"
-            data = "{ " + '"file": ' + '"' + f"{file_name}" + '" }'
+        self.log.debug("JOBS-000D submit_job() returned with:")
+        self.log.debug(f"            errors: {result.errors}")
+        self.log.debug(f"          response: {response}")
 
-        self.headers["X-IBM-Notification-URL"] = "https://192.168.9.39:4443"
-        self.headers["X-IBM-Notification-Options"] = '{ "events": ["active", "ready", "complete"] }'
+        return result
 
-        try:
-            response = requests.put(url, headers=self.headers, data=data, verify=verify)
-        except Exception as e:
-            JOBS.rc = 16
-            JOBS.errors = {"rc": JOBS.rc, "request_error": e}
-            self.log.critical(
-                f"JOBS-001S Catched and unexpected error, can not continue {str(JOBS.errors)}"
-            )
-            sys.exit(JOBS.rc)
+    def wait_for_job(
+        self,
+        job: dict,
+        listener=None,
+        cancel=None,
+        verify: bool = True,
+    ):
+        """_Wait until a submitted job is complete_
 
-        if response.status_code != 201:
-            JOBS.rc = 8
-            self.log.debug(
-                f"JOBS-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"         {response.text}")
-            JOBS.errors = {
-                "rc": JOBS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        With a listener the job status is read as soon as the complete
+        notification of the job arrives, and otherwise only every
+        poll_interval_max seconds in case the notification gets lost. Without
+        one the status is polled with the growing interval of poll.POLLER.
+        Waiting ends at poll_deadline of the session.
 
-        self.log.debug("JOBS-000D submit_job() returned with:")
-        self.log.debug(f"            errors: {JOBS.errors}")
-        self.log.debug(f"          response: {response}")
+        Args:
+            job (dict).............: _The job document returned by submit_job()._
+            listener (LISTENER)....: _The listener registered as notification URL_. Defaults to None.
+            cancel (Event).........: _Set it to stop waiting_. Defaults to None.
+            verify (bool)..........: _Turn certificate verification on/off_. Defaults to True (on)._
+
+        Returns:
+            dict: _Return Code and some details about the error_
+            response: _The job document of the complete job, with step data._
+        """
+        poller = P.POLLER(self, cancel=cancel)
+        end = time.monotonic() + poller.deadline
+        notified = listener is None
+        delay = poller.interval if notified else poller.interval_max
+        result = None
+
+        while True:
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                self.log.error(f"JOBS-012E {job['jobname']}({job['jobid']}) not complete after {poller.deadline}s")
+                return poller.failed("P02", f"Not complete after {poller.deadline} seconds", result)
+            if not notified:
+                notified = listener.wait(job, timeout=min(delay, remaining)) is not None
+                if notified:
+                    self.log.debug(f"JOBS-000D {job['jobname']}({job['jobid']}) complete notification received")
+                    delay = poller.interval
+            else:
+                poller.cancel.wait(min(delay, remaining))
+                delay = min(poller.interval_max, delay * poller.factor)
+            if poller.cancel.is_set():
+                self.log.warning(f"JOBS-011W Waiting for {job['jobname']}({job['jobid']}) cancelled")
+                return poller.failed("P03", "Waiting cancelled", result)
+
+            result = self.get_job_by_jobname_jobid(job["jobname"], job["jobid"], verify=verify)
+            if result.rc != 0:
+                return result
+            if result.body.get("status") == COMPLETED:
+                return result
+
+    def run_job(
+        self,
+        file_name: str,
+        directory: str,
+        ddnames: list | None = None,
+        jes_name: str = "",
+        inline: bool = True,
+        listener=None,
+        cancel=None,
+        parallel: int | None = None,
+        verify: bool = True,
+    ) -> dict:
+        """_Submit a job, wait until it is complete and download its spool files_
+
+        All requests go through the session of the client, so the connections
+        opened for the submit are used again for the status and the spool files.
+        The spool files are written by save_job_files() to
+        <directory>/<jobname>/<jobid>.
+
+        Args:
+            file_name (str)........: _The JCL to submit, see submit_job()._
+            directory (str)........: _The directory to write the spool files to._
+            ddnames (list).........: _DD names of the spool files to download_. Defaults to None, all;
+                                     _[] downloads none._
+            jes_name (str).........: _Secondary JES name_. Defaults to ''.
+            inline (bool)..........: _Whether the JCL is inline or in a file_. Defaults to True.
+            listener (LISTENER)....: _The listener for the complete notification_. Defaults to None, polling.
+            cancel (Event).........: _Set it to stop waiting_. Defaults to None.
+            parallel (int).........: _Spool files fetched at the same time_. Defaults to pool_maxsize.
+            verify (bool)..........: _Turn certificate verification on/off_. Defaults to True (on)._
+
+        Returns:
+            dict: _The run: file, jobname, jobid, job-correlator, retcode, steps, rc
+                  (max_step_rc() or the rc of a failed request, whichever is higher),
+                  errors, manifest (None if nothing was downloaded) and the times
+                  submitted, ended and saved (time.time(), None if not reached)._
+        """
+        run = new_run(file_name)
+        run["submitted"] = time.time()
+        result = self.submit_job(
+            file_name=file_name,
+            jes_name=jes_name,
+            inline=inline,
+            verify=verify,
+            notification_url=listener.url if listener is not None else "",
+        )
+        if result.rc != 0:
+            return fail_run(run, result)
+        job = result.body
+        run.update(jobname=job["jobname"], jobid=job["jobid"], **{"job-correlator": job.get("job-correlator")})
+
+        result = self.wait_for_job(job, listener=listener, cancel=cancel, verify=verify)
+        if result.rc != 0:
+            return fail_run(run, result)
+        job = result.body
+        end_run(run, job)
+        self.log.debug(f"JOBS-000D run_job() {job['jobname']}({job['jobid']}) ended with {job.get('retcode')}")
+
+        if ddnames == []:
+            return run
+        result = self.get_files_by_jobname_jobid(job["jobname"], job["jobid"], verify=verify)
+        if result.rc != 0:
+            return fail_run(run, result)
+        selected = None if ddnames is None else {ddname.upper() for ddname in ddnames}
+        spool_files = [
+            ddname for ddname in result.body if selected is None or ddname["ddname"] in selected
+        ]
+
+        run["manifest"] = self.save_job_files(
+            spool_files,
+            os.path.join(directory, job["jobname"], job["jobid"]),
+            jobname=job["jobname"],
+            jobid=job["jobid"],
+            parallel=parallel,
+            verify=verify,
+        )
+        run["saved"] = time.time()
+        run["rc"] = max([run["rc"]] + [file["rc"] for file in run["manifest"]["files"]])
+        return run
+
+    def submit_many(
+        self,
+        jobs: list,
+        jes_name: str = "",
+        inline: bool = True,
+        listener=None,
+        cancel=None,
+        parallel: int | None = None,
+        verify: bool = True,
+    ) -> list:
+        """_Submit jobs as soon as the jobs they wait for have ended well enough_
+
+        A job is ready once every job of its after has ended with a return code
+        up to the one given for it, and is skipped as soon as one of them ended
+        with a higher one, failed or was skipped. Every ready job is submitted
+        at once. The jobs in flight are then watched together, like
+        wait_for_job() watches one: with a listener the status of a job is read
+        once its complete notification arrives, and only every
+        poll_interval_max seconds otherwise; without one it is polled with the
+        growing interval of poll.POLLER. Submit and status requests are sent by
+        at most parallel threads, however many jobs are in flight.
+
+        Args:
+            jobs (list)............: _The jobs as returned by read_job_manifest()._
+            jes_name (str).........: _Secondary JES name_. Defaults to ''.
+            inline (bool)..........: _Whether the JCL is inline or in a file_. Defaults to True.
+            listener (LISTENER)....: _The listener for the complete notifications_. Defaults to None, polling.
+            cancel (Event).........: _Set it to stop waiting_. Defaults to None.
+            parallel (int).........: _Requests sent at the same time_. Defaults to pool_maxsize.
+            verify (bool)..........: _Turn certificate verification on/off_. Defaults to True (on)._
+
+        Returns:
+            list: _One run per job, in the order of jobs: the run of run_job() with
+                  name, status (ended, failed or skipped) and ready (time.time()
+                  the job became ready, None if skipped) added._
+        """
+        parallel = parallel or self.session.pool_maxsize
+        poller = P.POLLER(self, cancel=cancel)
+        pending = {job["name"]: job for job in jobs}
+        runs: dict = {}
+        active: dict = {}
+
+        def state(job: dict) -> tuple[str, str]:
+            if poller.cancel.is_set():
+                return "skipped", "waiting cancelled"
+            reasons: list = []
+            for name, rc in job["after"].items():
+                run = runs.get(name)
+                if run is None:
+                    return "waiting", ""
+                if run["status"] != "ended" or run["rc"] > rc:
+                    reasons.append(f"{name} {run['status']} with rc {run['rc']}")
+            return ("skipped", ", ".join(reasons)) if reasons != [] else ("ready", "")
+
+        def release() -> list:
+            released: list = []
+            changed = True
+            while changed:
+                changed = False
+                for name, job in [*pending.items()]:
+                    job_state, reason = state(job)
+                    if job_state == "waiting":
+                        continue
+                    del pending[name]
+                    changed = True
+                    if job_state == "ready":
+                        self.log.debug(f"JOBS-000D submit_many() {name} is ready")
+                        released.append(dict(new_run(job["file"]), name=name, status="failed", ready=time.time()))
+                        continue
+                    self.log.warning(f"JOBS-015W {name} skipped, {reason}")
+                    runs[name] = {
+                        "name": name,
+                        "file": job["file"],
+                        "status": "skipped",
+                        "rc": None,
+                        "errors": {"status_code": f"Skipped, {reason}", "reason": "J06"},
+                        "ready": None,
+                    }
+            return released
+
+        def submit(run: dict) -> C.RESULT:
+            run["submitted"] = time.time()
+            return self.submit_job(
+                file_name=run["file"],
+                jes_name=jes_name,
+                inline=inline,
+                verify=verify,
+                notification_url=listener.url if listener is not None else "",
+            )
 
-        return JOBS.errors, response
+        def status(name: str) -> C.RESULT:
+            job = active[name]["job"]
+            return self.get_job_by_jobname_jobid(job["jobname"], job["jobid"], verify=verify)
+
+        def finish(name: str, run: dict, run_status: str) -> None:
+            run["status"] = run_status
+            runs[name] = run
+            active.pop(name, None)
+            self.log.debug(f"JOBS-000D submit_many() {name} {run_status} with rc {run['rc']}")
+
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+            released = release()
+            while released != [] or active != {}:
+                for run, result in zip(released, executor.map(submit, released)):
+                    if result.rc != 0:
+                        finish(run["name"], fail_run(run, result), "failed")
+                        continue
+                    job = result.body
+                    run.update(jobname=job["jobname"], jobid=job["jobid"], **{"job-correlator": job.get("job-correlator")})
+                    now = time.monotonic()
+                    active[run["name"]] = {
+                        "run": run,
+                        "job": dict(job, name=run["name"]),
+                        "notified": listener is None,
+                        "delay": poller.interval if listener is None else poller.interval_max,
+                        "due": now + (poller.interval if listener is None else poller.interval_max),
+                        "end": now + poller.deadline,
+                    }
+                if active == {}:
+                    released = release()
+                    continue
+
+                timeout = max(0, min(watch["due"] for watch in active.values()) - time.monotonic())
+                waiting = [watch["job"] for watch in active.values() if not watch["notified"]]
+                if waiting != []:
+                    for job in listener.wait_any(waiting, timeout=timeout):
+                        self.log.debug(f"JOBS-000D {job['jobname']}({job['jobid']}) complete notification received")
+                        active[job["name"]].update(notified=True, delay=poller.interval, due=time.monotonic())
+                else:
+                    poller.cancel.wait(timeout)
+
+                if poller.cancel.is_set():
+                    for name, watch in [*active.items()]:
+                        self.log.warning(f"JOBS-011W Waiting for {watch['job']['jobname']}({watch['job']['jobid']}) cancelled")
+                        finish(name, fail_run(watch["run"], poller.failed("P03", "Waiting cancelled")), "failed")
+                    released = release()
+                    continue
+
+                now = time.monotonic()
+                due = [name for name, watch in active.items() if watch["due"] <= now]
+                for name, result in zip(due, executor.map(status, due)):
+                    watch = active[name]
+                    if result.rc != 0:
+                        finish(name, fail_run(watch["run"], result), "failed")
+                    elif result.body.get("status") == COMPLETED:
+                        finish(name, end_run(watch["run"], result.body), "ended")
+                    elif time.monotonic() >= watch["end"]:
+                        self.log.error(f"JOBS-012E {watch['job']['jobname']}({watch['job']['jobid']}) not complete after {poller.deadline}s")
+                        failed = poller.failed("P02", f"Not complete after {poller.deadline} seconds", result)
+                        finish(name, fail_run(watch["run"], failed), "failed")
+                    else:
+                        watch["due"] = time.monotonic() + watch["delay"]
+                        if watch["notified"]:
+                            watch["delay"] = min(poller.interval_max, watch["delay"] * poller.factor)
+                released = release()
+
+        return [runs[job["name"]] for job in jobs]
 
     def hold_job(
         self,
@@ -639,8 +1420,8 @@ class JOBS(C.CLIENT):
             dict: _Return Code and some details about the error_
             response: _Response object returned by z/OSMF._
         """
-        JOBS.rc: int = 0
-        JOBS.errors = {}
+        rc: int = 0
+        errors: dict = {}
 
         self.log.debug("JOBS-000D hold_job() entered with:")
         self.log.debug(f"          Job Name: {jobname}")
@@ -649,9 +1430,6 @@ class JOBS(C.CLIENT):
         self.log.debug(f"        correlator: {correlator}")
         self.log.debug(f"            Verify: {verify}")
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
         url = f"{self.path_to_api}/restjobs/jobs/"
 
         data = "{ " + '"request": "hold", '
@@ -669,58 +1447,39 @@ class JOBS(C.CLIENT):
             if jobid != "":
                 url = url + f"{jobid}"
             else:
-                JOBS.rc = 8
+                rc = 8
                 self.log.error("JOBS-004E Job Name and Job ID required.")
                 response = None
-                JOBS.errors = {
-                    "rc": JOBS.rc,
+                errors = {
+                    "rc": rc,
                     "status_code": "Job Name and Job ID required.",
                     "reason": "J01",
                 }
-                return JOBS.errors, response
+                return C.RESULT(rc, errors, response)
         else:
             if correlator != "":
                 url = url + f"{correlator}"
             else:
-                JOBS.rc = 8
+                rc = 8
                 self.log.error(
                     "JOBS-005E One of Job Name and Job ID or Correlator required."
                 )
                 response = None
-                JOBS.errors = {
-                    "rc": JOBS.rc,
+                errors = {
+                    "rc": rc,
                     "status_code": "One of Job Name and Job ID or Correlator required.",
                     "reason": "J02",
                 }
-                return JOBS.errors, response
+                return C.RESULT(rc, errors, response)
 
-        try:
-            response = requests.put(url, headers=self.headers, data=data, verify=verify)
-        except Exception as e:
-            JOBS.rc = 16
-            JOBS.errors = {"rc": JOBS.rc, "request_error": e}
-            self.log.critical(
-                f"JOBS-001S Catched and unexpected error, can not continue {str(JOBS.errors)}"
-            )
-            sys.exit(JOBS.rc)
-
-        if response.status_code != 200 or response.status_code != 202:
-            JOBS.rc = 8
-            self.log.debug(
-                f"JOBS-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"         {response.text}")
-            JOBS.errors = {
-                "rc": JOBS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request("PUT", url, expected=(200, 202), data=data, verify=verify)
+        response = result.response
 
         self.log.debug("JOBS-000D hold_job() returned with:")
-        self.log.debug(f"            errors: {JOBS.errors}")
+        self.log.debug(f"            errors: {result.errors}")
         self.log.debug(f"          response: {response}")
 
-        return JOBS.errors, response
+        return result
 
     def release_job(
         self,
@@ -745,8 +1504,8 @@ class JOBS(C.CLIENT):
             dict: _Return Code and some details about the error_
             response: _Response object returned by z/OSMF._
         """
-        JOBS.rc: int = 0
-        JOBS.errors = {}
+        rc: int = 0
+        errors: dict = {}
 
         self.log.debug("JOBS-000D release_job() entered with:")
         self.log.debug(f"          Job Name: {jobname}")
@@ -755,9 +1514,6 @@ class JOBS(C.CLIENT):
         self.log.debug(f"        correlator: {correlator}")
         self.log.debug(f"            Verify: {verify}")
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
         url = f"{self.path_to_api}/restjobs/jobs/"
 
         data = "{ " + '"request": "release", '
@@ -775,58 +1531,39 @@ class JOBS(C.CLIENT):
             if jobid != "":
                 url = url + f"{jobid}"
             else:
-                JOBS.rc = 8
+                rc = 8
                 self.log.error("JOBS-004E Job Name and Job ID required.")
                 response = None
-                JOBS.errors = {
-                    "rc": JOBS.rc,
+                errors = {
+                    "rc": rc,
                     "status_code": "Job Name and Job ID required.",
                     "reason": "J01",
                 }
-                return JOBS.errors, response
+                return C.RESULT(rc, errors, response)
         else:
             if correlator != "":
                 url = url + f"{correlator}"
             else:
-                JOBS.rc = 8
+                rc = 8
                 self.log.error(
                     "JOBS-005E One of Job Name and Job ID or Correlator required."
                 )
                 response = None
-                JOBS.errors = {
-                    "rc": JOBS.rc,
+                errors = {
+                    "rc": rc,
                     "status_code": "One of Job Name and Job ID or Correlator required.",
                     "reason": "J02",
                 }
-                return JOBS.errors, response
-
-        try:
-            response = requests.put(url, headers=self.headers, data=data, verify=verify)
-        except Exception as e:
-            JOBS.rc = 16
-            JOBS.errors = {"rc": JOBS.rc, "request_error": e}
-            self.log.critical(
-                f"JOBS-001S Catched and unexpected error, can not continue {str(JOBS.errors)}"
-            )
-            sys.exit(JOBS.rc)
+                return C.RESULT(rc, errors, response)
 
-        if response.status_code != 200 or response.status_code != 202:
-            JOBS.rc = 8
-            self.log.debug(
-                f"JOBS-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"         {response.text}")
-            JOBS.errors = {
-                "rc": JOBS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request("PUT", url, expected=(200, 202), data=data, verify=verify)
+        response = result.response
 
         self.log.debug("JOBS-000D release_job() returned with:")
-        self.log.debug(f"            errors: {JOBS.errors}")
+        self.log.debug(f"            errors: {result.errors}")
         self.log.debug(f"          response: {response}")
 
-        return JOBS.errors, response
+        return result
 
     def change_job_class(
         self,
@@ -853,8 +1590,8 @@ class JOBS(C.CLIENT):
             dict: _Return Code and some details about the error_
             response: _Response object returned by z/OSMF._
         """
-        JOBS.rc: int = 0
-        JOBS.errors = {}
+        rc: int = 0
+        errors: dict = {}
 
         self.log.debug("JOBS-000D change_job_class() entered with:")
         self.log.debug(f"          Job Name: {jobname}")
@@ -864,9 +1601,6 @@ class JOBS(C.CLIENT):
         self.log.debug(f"        correlator: {correlator}")
         self.log.debug(f"            Verify: {verify}")
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
         url = f"{self.path_to_api}/restjobs/jobs/"
 
         if jobclass != "":
@@ -876,15 +1610,15 @@ class JOBS(C.CLIENT):
             else:
                 data = data + '"version": ' + '"2.0"}'
         else:
-            JOBS.rc = 8
+            rc = 8
             self.log.error("JOBS-007E A new class name is required.")
             response = None
-            JOBS.errors = {
-                "rc": JOBS.rc,
+            errors = {
+                "rc": rc,
                 "status_code": "A new class name is required.",
                 "reason": "J03",
             }
-            return JOBS.errors, response
+            return C.RESULT(rc, errors, response)
 
         if jesname != "":
             url = url + f"-{jesname}"
@@ -894,58 +1628,39 @@ class JOBS(C.CLIENT):
             if jobid != "":
                 url = url + f"{jobid}"
             else:
-                JOBS.rc = 8
+                rc = 8
                 self.log.error("JOBS-004E Job Name and Job ID required.")
                 response = None
-                JOBS.errors = {
-                    "rc": JOBS.rc,
+                errors = {
+                    "rc": rc,
                     "status_code": "Job Name and Job ID required.",
                     "reason": "J01",
                 }
-                return JOBS.errors, response
+                return C.RESULT(rc, errors, response)
         else:
             if correlator != "":
                 url = url + f"{correlator}"
             else:
-                JOBS.rc = 8
+                rc = 8
                 self.log.error(
                     "JOBS-005E One of Job Name and Job ID or Correlator required."
                 )
                 response = None
-                JOBS.errors = {
-                    "rc": JOBS.rc,
+                errors = {
+                    "rc": rc,
                     "status_code": "One of Job Name and Job ID or Correlator required.",
                     "reason": "J02",
                 }
-                return JOBS.errors, response
-
-        try:
-            response = requests.put(url, headers=self.headers, data=data, verify=verify)
-        except Exception as e:
-            JOBS.rc = 16
-            JOBS.errors = {"rc": JOBS.rc, "request_error": e}
-            self.log.critical(
-                f"JOBS-001S Catched and unexpected error, can not continue {str(JOBS.errors)}"
-            )
-            sys.exit(JOBS.rc)
+                return C.RESULT(rc, errors, response)
 
-        if response.status_code != 200 or response.status_code != 202:
-            JOBS.rc = 8
-            self.log.debug(
-                f"JOBS-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"         {response.text}")
-            JOBS.errors = {
-                "rc": JOBS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request("PUT", url, expected=(200, 202), data=data, verify=verify)
+        response = result.response
 
         self.log.debug("JOBS-000D change_job_class() returned with:")
-        self.log.debug(f"            errors: {JOBS.errors}")
+        self.log.debug(f"            errors: {result.errors}")
         self.log.debug(f"          response: {response}")
 
-        return JOBS.errors, response
+        return result
 
     def cancel_job(
         self,
@@ -970,8 +1685,8 @@ class JOBS(C.CLIENT):
             dict: _Return Code and some details about the error_
             response: _Response object returned by z/OSMF._
         """
-        JOBS.rc: int = 0
-        JOBS.errors = {}
+        rc: int = 0
+        errors: dict = {}
 
         self.log.debug("JOBS-000D cancel_job() entered with:")
         self.log.debug(f"          Job Name: {jobname}")
@@ -980,9 +1695,6 @@ class JOBS(C.CLIENT):
         self.log.debug(f"        correlator: {correlator}")
         self.log.debug(f"            Verify: {verify}")
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
         url = f"{self.path_to_api}/restjobs/jobs/"
 
         data = "{ " + '"request": "cancel", '
@@ -999,58 +1711,39 @@ class JOBS(C.CLIENT):
             if jobid != "":
                 url = url + f"{jobid}"
             else:
-                JOBS.rc = 8
+                rc = 8
                 self.log.error("JOBS-004E Job Name and Job ID required.")
                 response = None
-                JOBS.errors = {
-                    "rc": JOBS.rc,
+                errors = {
+                    "rc": rc,
                     "status_code": "Job Name and Job ID required.",
                     "reason": "J01",
                 }
-                return JOBS.errors, response
+                return C.RESULT(rc, errors, response)
         else:
             if correlator != "":
                 url = url + f"{correlator}"
             else:
-                JOBS.rc = 8
+                rc = 8
                 self.log.error(
                     "JOBS-005E One of Job Name and Job ID or Correlator required."
                 )
                 response = None
-                JOBS.errors = {
-                    "rc": JOBS.rc,
+                errors = {
+                    "rc": rc,
                     "status_code": "One of Job Name and Job ID or Correlator required.",
                     "reason": "J02",
                 }
-                return JOBS.errors, response
+                return C.RESULT(rc, errors, response)
 
-        try:
-            response = requests.put(url, headers=self.headers, data=data, verify=verify)
-        except Exception as e:
-            JOBS.rc = 16
-            JOBS.errors = {"rc": JOBS.rc, "request_error": e}
-            self.log.critical(
-                f"JOBS-001S Catched and unexpected error, can not continue {str(JOBS.errors)}"
-            )
-            sys.exit(JOBS.rc)
-
-        if response.status_code != 200 or response.status_code != 202:
-            JOBS.rc = 8
-            self.log.debug(
-                f"JOBS-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"         {response.text}")
-            JOBS.errors = {
-                "rc": JOBS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request("PUT", url, expected=(200, 202), data=data, verify=verify)
+        response = result.response
 
         self.log.debug("JOBS-000D cancel_job() returned with:")
-        self.log.debug(f"            errors: {JOBS.errors}")
+        self.log.debug(f"            errors: {result.errors}")
         self.log.debug(f"          response: {response}")
 
-        return JOBS.errors, response
+        return result
 
     def cancel_and_purge_job(
         self,
@@ -1075,8 +1768,8 @@ class JOBS(C.CLIENT):
             dict: _Return Code and some details about the error_
             response: _Response object returned by z/OSMF._
         """
-        JOBS.rc: int = 0
-        JOBS.errors = {}
+        rc: int = 0
+        errors: dict = {}
 
         self.log.debug("JOBS-000D cancel_and_purge_job() entered with:")
         self.log.debug(f"          Job Name: {jobname}")
@@ -1085,15 +1778,14 @@ class JOBS(C.CLIENT):
         self.log.debug(f"        correlator: {correlator}")
         self.log.debug(f"            Verify: {verify}")
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
         url = f"{self.path_to_api}/restjobs/jobs/"
 
+        headers = dict(self.headers)
+
         if not synchronous:
-            self.headers["X-IBM-Job-Modify-Version"] = "1.0"
+            headers["X-IBM-Job-Modify-Version"] = "1.0"
         else:
-            self.headers["X-IBM-Job-Modify-Version"] = "2.0"
+            headers["X-IBM-Job-Modify-Version"] = "2.0"
 
         if jesname != "":
             url = url + f"-{jesname}"
@@ -1103,55 +1795,38 @@ class JOBS(C.CLIENT):
             if jobid != "":
                 url = url + f"{jobid}"
             else:
-                JOBS.rc = 8
+                rc = 8
                 self.log.error("JOBS-004E Job Name and Job ID required.")
                 response = None
-                JOBS.errors = {
-                    "rc": JOBS.rc,
+                errors = {
+                    "rc": rc,
                     "status_code": "Job Name and Job ID required.",
                     "reason": "J01",
                 }
-                return JOBS.errors, response
+                return C.RESULT(rc, errors, response)
         else:
             if correlator != "":
                 url = url + f"{correlator}"
             else:
-                JOBS.rc = 8
+                rc = 8
                 self.log.error(
                     "JOBS-005E One of Job Name and Job ID or Correlator required."
                 )
                 response = None
-                JOBS.errors = {
-                    "rc": JOBS.rc,
+                errors = {
+                    "rc": rc,
                     "status_code": "One of Job Name and Job ID or Correlator required.",
                     "reason": "J02",
                 }
-                return JOBS.errors, response
+                return C.RESULT(rc, errors, response)
 
-        try:
-            response = requests.delete(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            JOBS.rc = 16
-            JOBS.errors = {"rc": JOBS.rc, "request_error": e}
-            self.log.critical(
-                f"JOBS-001S Catched and unexpected error, can not continue {str(JOBS.errors)}"
-            )
-            sys.exit(JOBS.rc)
-
-        if response.status_code != 200 or response.status_code != 202:
-            JOBS.rc = 8
-            self.log.debug(
-                f"JOBS-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"         {response.text}")
-            JOBS.errors = {
-                "rc": JOBS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request(
+            "DELETE", url, expected=(200, 202), headers=headers, verify=verify
+        )
+        response = result.response
 
         self.log.debug("JOBS-000D cancel_and_purge_job() returned with:")
-        self.log.debug("            errors: {JOBS.errors}")
+        self.log.debug("            errors: {result.errors}")
         self.log.debug("          response: {response}")
 
-        return JOBS.errors, response
+        return result
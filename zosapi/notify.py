@@ -0,0 +1,228 @@
+# Local HTTPS listener for z/OSMF job notifications
+import asyncio
+import json
+import logging
+import socket
+import ssl
+import threading
+
+from aiohttp import web
+
+# Notification event sent by z/OSMF once a job has ended
+COMPLETE: str = "complete"
+
+
+class LISTENER:
+    """
+    Receives the job notifications z/OSMF sends to the X-IBM-Notification-URL
+    of a submitted job.
+
+    The listener is an aiohttp server running on its own asyncio event loop in
+    a background thread, so synchronous callers can wait for the notification
+    of a job while the listener keeps receiving the ones of other jobs. A
+    notification only wakes the waiter; callers are expected to confirm the
+    job status with z/OSMF, since anyone can send a notification.
+    """
+
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 4443,
+        certfile: str = "",
+        keyfile: str | None = None,
+        url: str = "",
+    ):
+        """
+        Args:
+            host (str).......: The address to listen on (default all addresses).
+            port (int).......: The port to listen on, 0 for any free port (default 4443).
+            certfile (str)...: PEM file holding the server certificate, and its key
+                               if keyfile is None.
+            keyfile (str)....: PEM file holding the key (default None).
+            url (str)........: The URL z/OSMF sends notifications to, "" for
+                               https://<host name>:<port> (default "").
+        """
+        log = logging.getLogger(__name__)
+        log.addHandler(logging.NullHandler())
+
+        self.host = host
+        self.port = port
+        self.certfile = certfile
+        self.keyfile = keyfile
+        self.configured_url = url
+        self.notifications: dict = {}
+        self.condition = threading.Condition()
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.runner: web.AppRunner | None = None
+        self.thread: threading.Thread | None = None
+        self.log = log
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """
+        Returns:
+            str: The URL to register as X-IBM-Notification-URL.
+        """
+        if self.configured_url != "":
+            return self.configured_url
+        return f"https://{socket.getfqdn()}:{self.port}"
+
+    def start(self) -> None:
+        """
+        Start listening, returns once the port is bound.
+
+        Raises:
+            OSError: The certificate can not be read or the port can not be bound.
+        """
+        try:
+            context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+            context.load_cert_chain(self.certfile, self.keyfile)
+            sock = socket.create_server((self.host, self.port))
+        except (OSError, ValueError) as e:
+            raise OSError(f"NOTIFY-001E Unable to listen on {self.host}:{self.port}: {e}")
+        self.port = sock.getsockname()[1]
+
+        self.loop = asyncio.new_event_loop()
+        started = threading.Event()
+        failed: list = []
+
+        async def serve() -> None:
+            app = web.Application()
+            app.router.add_route("POST", "/{tail:.*}", self.receive)
+            app.router.add_route("PUT", "/{tail:.*}", self.receive)
+            self.runner = web.AppRunner(app, access_log=None)
+            await self.runner.setup()
+            await web.SockSite(self.runner, sock, ssl_context=context).start()
+
+        def run() -> None:
+            asyncio.set_event_loop(self.loop)
+            try:
+                self.loop.run_until_complete(serve())
+            except BaseException as e:
+                failed.append(e)
+                return
+            finally:
+                started.set()
+            self.loop.run_forever()
+
+        self.thread = threading.Thread(target=run, name="zcli-notify", daemon=True)
+        self.thread.start()
+        started.wait()
+        if failed != []:
+            self.thread.join()
+            self.loop.close()
+            self.loop = None
+            self.runner = None
+            self.thread = None
+            sock.close()
+            raise OSError(f"NOTIFY-001E Unable to listen on {self.host}:{self.port}: {failed[0]}")
+        self.log.debug(f"NOTIFY-000D Listening on {self.host}:{self.port} for {self.url}")
+
+    def stop(self) -> None:
+        """
+        Stop listening and end the background thread.
+        """
+        if self.loop is None or self.thread is None:
+            return
+
+        async def cleanup() -> None:
+            if self.runner is not None:
+                await self.runner.cleanup()
+
+        asyncio.run_coroutine_threadsafe(cleanup(), self.loop).result(timeout=5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5)
+        self.loop.close()
+        self.loop = None
+        self.thread = None
+
+    async def receive(self, request: web.Request) -> web.Response:
+        """
+        Keep a notification and wake the callers waiting for its job.
+        """
+        try:
+            notification = json.loads(await request.read())
+        except ValueError:
+            self.log.warning(f"NOTIFY-002W Ignored a notification from {request.remote} that is no JSON")
+            return web.Response(status=400)
+        if not isinstance(notification, dict):
+            return web.Response(status=400)
+
+        self.log.debug(f"NOTIFY-000D Notification from {request.remote}: {notification}")
+        with self.condition:
+            for key in self.keys(notification):
+                self.notifications[key] = notification
+            self.condition.notify_all()
+        return web.Response(status=200)
+
+    def keys(self, job: dict) -> list:
+        """
+        Args:
+            job (dict): A notification or a job document.
+
+        Returns:
+            list: The keys a notification of the job is kept under.
+        """
+        keys: list = []
+        if job.get("job-correlator"):
+            keys.append(job["job-correlator"])
+        if job.get("jobname") and job.get("jobid"):
+            keys.append((job["jobname"].upper(), job["jobid"].upper()))
+        return keys
+
+    def received(self, job: dict) -> dict | None:
+        """
+        Args:
+            job (dict): The job document returned by the submit request.
+
+        Returns:
+            dict | None: The complete notification of the job, None if none has
+                         arrived yet. Call it holding condition.
+        """
+        for key in self.keys(job):
+            notification = self.notifications.get(key)
+            if notification is not None and notification.get("event", COMPLETE) == COMPLETE:
+                return notification
+        return None
+
+    def wait(self, job: dict, timeout: float | None = None) -> dict | None:
+        """
+        Wait for the complete notification of a job.
+
+        Args:
+            job (dict)........: The job document returned by the submit request.
+            timeout (float)...: Seconds to wait at most (default None, for ever).
+
+        Returns:
+            dict | None: The notification, None if none arrived in time.
+        """
+        with self.condition:
+            self.condition.wait_for(lambda: self.received(job) is not None, timeout=timeout)
+            return self.received(job)
+
+    def wait_any(self, jobs: list, timeout: float | None = None) -> list:
+        """
+        Wait for the complete notification of any of several jobs.
+
+        Args:
+            jobs (list).......: The job documents returned by the submit requests.
+            timeout (float)...: Seconds to wait at most (default None, for ever).
+
+        Returns:
+            list: The jobs whose complete notification has arrived, [] if none
+                  arrived in time.
+        """
+
+        def arrived() -> list:
+            return [job for job in jobs if self.received(job) is not None]
+
+        with self.condition:
+            self.condition.wait_for(lambda: arrived() != [], timeout=timeout)
+            return arrived()
@@ -0,0 +1,190 @@
+# Polling of z/OSMF status monitors (202 Accepted with a statusurl)
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from zosapi import client as C
+
+# Status of a status monitor while the operation has not ended
+RUNNING: str = "running"
+
+
+class POLLER:
+    """
+    Polls the status monitor of asynchronous z/OSMF operations until they end.
+
+    The first poll follows quickly and the interval then grows by factor up to
+    interval_max, so short operations return almost at once while long ones do
+    not keep z/OSMF busy. Polling ends at the deadline or when cancel is set.
+    """
+
+    def __init__(
+        self,
+        client: C.CLIENT,
+        interval: float | None = None,
+        interval_max: float | None = None,
+        deadline: float | None = None,
+        factor: float = 1.5,
+        cancel: threading.Event | None = None,
+    ):
+        """
+        Args:
+            client (CLIENT)........: The client the status requests are sent with.
+            interval (float).......: Seconds before the first poll (default poll_interval of the session).
+            interval_max (float)...: Upper limit of the interval (default poll_interval_max of the session).
+            deadline (float).......: Seconds after which polling is given up (default poll_deadline of the session).
+            factor (float).........: Growth of the interval per poll (default 1.5).
+            cancel (Event).........: Set it to stop polling (default None, a private Event).
+        """
+        log = logging.getLogger(__name__)
+        log.addHandler(logging.NullHandler())
+
+        session = client.session
+        self.client = client
+        self.interval = session.poll_interval if interval is None else interval
+        self.interval_max = session.poll_interval_max if interval_max is None else interval_max
+        self.deadline = session.poll_deadline if deadline is None else deadline
+        self.factor = factor
+        self.cancel = cancel if cancel is not None else threading.Event()
+        self.log = log
+
+    def delays(self):
+        """
+        Yields:
+            float: Seconds to wait before each poll.
+        """
+        delay = self.interval
+        while True:
+            yield delay
+            delay = min(self.interval_max, delay * self.factor)
+
+    def failed(self, reason: str, text: str, result: C.RESULT | None = None) -> C.RESULT:
+        """
+        Args:
+            reason (str)....: Reason code of the error.
+            text (str)......: Error text.
+            result (RESULT).: The last status result (default None).
+
+        Returns:
+            RESULT: rc 8 with the last status response.
+        """
+        errors = {"rc": 8, "status_code": text, "reason": reason}
+        if result is None:
+            return C.RESULT(8, errors)
+        return C.RESULT(8, errors, result.response, result.attempts, result.elapsed)
+
+    def status(self, result: C.RESULT) -> tuple[str, C.RESULT]:
+        """
+        Args:
+            result (RESULT): Result of a status request.
+
+        Returns:
+            str: The status of the operation, "" if it could not be read.
+            RESULT: result, or rc 16 if the status could not be read.
+        """
+        try:
+            return result.stream.value("status"), result
+        except Exception as e:
+            errors = {"rc": 16, "request_error": e}
+            self.log.critical(
+                f"POLL-001S Catched an unexpected exception, can not continue {str(errors)}"
+            )
+            return "", C.RESULT(16, errors, result.response, result.attempts)
+
+    def steps(self, statusurl: str):
+        """
+        The polling of wait() without the requests, so synchronous and
+        asynchronous callers poll alike. Send the RESULT of each status request
+        back, or None once cancelled.
+
+        Args:
+            statusurl (str): The statusurl of the 202 response.
+
+        Yields:
+            float: Seconds to wait before the next status request.
+
+        Returns:
+            RESULT: The last status response, see wait().
+        """
+        end = time.monotonic() + self.deadline
+        polls = 0
+        result = None
+
+        for delay in self.delays():
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                self.log.error(
+                    f"POLL-002E {statusurl} still running after {self.deadline}s and {polls} polls"
+                )
+                return self.failed("P02", f"Still running after {self.deadline} seconds", result)
+            sent = yield min(delay, remaining)
+            if sent is None:
+                self.log.warning(f"POLL-003W Polling {statusurl} cancelled after {polls} polls")
+                return self.failed("P03", "Polling cancelled", result)
+
+            result = sent
+            polls = polls + 1
+            if result.rc != 0:
+                self.log.error(
+                    f"POLL-004E An unexpected statuscode {result.errors.get('status_code')} has been received"
+                )
+                return result
+
+            status, result = self.status(result)
+            if status != RUNNING:
+                self.log.debug(f"POLL-000D {statusurl} is {status} after {polls} polls")
+                return result
+            # Read the rest of a streamed status, so its connection can be reused
+            result.stream.content()
+            self.log.debug(f"POLL-000D {statusurl} is {status}, next poll in {min(self.interval_max, delay * self.factor):.2f}s")
+
+    def wait(self, statusurl: str, verify: bool = True, stream: bool = False) -> C.RESULT:
+        """
+        Poll one status monitor until the operation is no longer running.
+        The status is read from the head of each response, so with stream=True
+        a large final result is left unread for RESULT.stream.
+
+        Args:
+            statusurl (str)..: The statusurl of the 202 response.
+            verify (bool)....: Whether or not to verify SSL certificates (default True).
+            stream (bool)....: Send the status requests with stream=True (default False).
+
+        Returns:
+            RESULT: The last status response, rc 0 once the operation has ended,
+                    rc 8 if the deadline passed or polling was cancelled.
+        """
+        steps = self.steps(statusurl)
+        try:
+            delay = next(steps)
+            while True:
+                if self.cancel.wait(delay):
+                    delay = steps.send(None)
+                else:
+                    delay = steps.send(
+                        self.client.request(
+                            "GET", statusurl, expected=(200,), verify=verify, stream=stream
+                        )
+                    )
+        except StopIteration as stop:
+            return stop.value
+
+    def wait_all(
+        self, statusurls: list, verify: bool = True, parallel: int | None = None
+    ) -> list:
+        """
+        Poll several status monitors concurrently, see wait().
+
+        Args:
+            statusurls (list)..: The statusurls of the 202 responses.
+            verify (bool)......: Whether or not to verify SSL certificates (default True).
+            parallel (int).....: Status monitors polled at the same time (default pool_maxsize of the session).
+
+        Returns:
+            list: One RESULT per statusurl, in the same order.
+        """
+        if statusurls == []:
+            return []
+        parallel = parallel or self.client.session.pool_maxsize
+        with ThreadPoolExecutor(max_workers=min(parallel, len(statusurls))) as executor:
+            return list(executor.map(lambda url: self.wait(url, verify=verify), statusurls))
@@ -0,0 +1,197 @@
+# Local snapshots of SMP/E CSI entries and missing updates
+import gzip
+import json
+import logging
+import os
+import re
+import sqlite3
+import tempfile
+import time
+
+
+class SNAPSHOT:
+    """
+    CSI entries stored in a SQLite database for local queries.
+
+    Every entry type gets its own table with the columns entryname, zonename,
+    fmid and subentries (JSON), indexed on entryname, zonename and fmid.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): The SQLite database file, created if missing.
+        """
+        log = logging.getLogger(__name__)
+        log.addHandler(logging.NullHandler())
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS snapshot "
+            "(entrytype TEXT PRIMARY KEY, host TEXT, global_csi TEXT, zones TEXT, created REAL, entries INTEGER)"
+        )
+        self.log = log
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def table(self, entrytype: str) -> str:
+        """
+        Args:
+            entrytype (str): A CSI entry type, e.g. SYSMOD.
+
+        Returns:
+            str: The name of the table of the entry type.
+        """
+        return "entry_" + re.sub(r"[^a-z0-9_]", "_", entrytype.lower())
+
+    def store(self, entrytype: str, entries, host: str, global_csi: str, zones: str) -> int:
+        """
+        Replace the entries of one entry type.
+
+        Args:
+            entrytype (str).....: The entry type queried.
+            entries (iterable)..: The CSI entries, e.g. from software.iter_entries().
+            host (str)..........: The z/OSMF host the entries were queried from.
+            global_csi (str)....: The global CSI queried.
+            zones (str).........: The zones queried.
+
+        Returns:
+            int: Number of entries stored.
+        """
+        table = self.table(entrytype)
+
+        def rows():
+            for entry in entries:
+                fmid = ""
+                for subentry in entry.get("subentries") or []:
+                    value = subentry.get("FMID")
+                    if value:
+                        fmid = value if isinstance(value, str) else value[0]
+                yield (
+                    entry["entryname"],
+                    entry["zonename"],
+                    fmid,
+                    json.dumps(entry.get("subentries") or [], separators=(",", ":")),
+                )
+
+        with self.connection:
+            self.connection.execute(f"DROP TABLE IF EXISTS {table}")
+            self.connection.execute(
+                f"CREATE TABLE {table} (entryname TEXT, zonename TEXT, fmid TEXT, subentries TEXT)"
+            )
+            count = self.connection.executemany(
+                f"INSERT INTO {table} VALUES (?, ?, ?, ?)", rows()
+            ).rowcount
+            for column in ("entryname", "zonename", "fmid"):
+                self.connection.execute(f"CREATE INDEX {table}_{column} ON {table} ({column})")
+            self.connection.execute(
+                "INSERT OR REPLACE INTO snapshot VALUES (?, ?, ?, ?, ?, ?)",
+                (entrytype.upper(), host, global_csi, zones, time.time(), count),
+            )
+
+        self.log.debug(f"SNAPSHOT-000D Stored {count} {entrytype} entries in {self.path}")
+        return count
+
+    def info(self) -> list:
+        """
+        Returns:
+            list: One dict per entry type held: entrytype, host, global_csi, zones,
+                  created and entries.
+        """
+        return [dict(row) for row in self.connection.execute("SELECT * FROM snapshot ORDER BY entrytype")]
+
+    def query(
+        self, entrytype: str, zones: str = "", name: str = "", fmid: str = ""
+    ):
+        """
+        Query the entries of one entry type.
+
+        Args:
+            entrytype (str).: The entry type, e.g. SYSMOD.
+            zones (str).....: Comma separated zone names, "" for all (default "").
+            name (str)......: Entry name, * and ? are wildcards, "" for all (default "").
+            fmid (str)......: FMID, * and ? are wildcards, "" for all (default "").
+
+        Returns:
+            iterator: The CSI entries in the form z/OSMF returns them.
+        """
+        table = self.table(entrytype)
+        if self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone() is None:
+            raise ValueError(f"SNAPSHOT-001E No {entrytype} entries in {self.path}, take a snapshot first")
+
+        conditions: list = []
+        parameters: list = []
+        zone_names = [zone.strip().upper() for zone in zones.split(",") if zone.strip() != ""]
+        if zone_names != []:
+            conditions.append(f"zonename IN ({','.join('?' * len(zone_names))})")
+            parameters.extend(zone_names)
+        for column, pattern in (("entryname", name), ("fmid", fmid)):
+            if pattern != "":
+                conditions.append(f"{column} GLOB ?")
+                parameters.append(pattern.upper())
+
+        sql = f"SELECT * FROM {table}"
+        if conditions != []:
+            sql = sql + " WHERE " + " AND ".join(conditions)
+        sql = sql + " ORDER BY zonename, entryname"
+
+        return (
+            {
+                "entryname": row["entryname"],
+                "entrytype": entrytype.upper(),
+                "zonename": row["zonename"],
+                "subentries": json.loads(row["subentries"]),
+            }
+            for row in self.connection.execute(sql, parameters)
+        )
+
+
+def save_updates(path: str, updates: list, **meta) -> None:
+    """
+    Store a missing updates result set as gzip compressed, compact JSON. The
+    file is replaced at once, so a reader never sees half a snapshot.
+
+    Args:
+        path (str)......: The snapshot file, its directory is created if missing.
+        updates (list)..: The missing updates items.
+        meta............: Anything else to keep with them, e.g. host and instance.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    content = json.dumps(
+        dict(meta, created=time.time(), updates=updates), separators=(",", ":")
+    ).encode()
+
+    fd, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(gzip.compress(content))
+        os.replace(temporary, path)
+    except OSError:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+def load_updates(path: str) -> dict | None:
+    """
+    Args:
+        path (str): The snapshot file written by save_updates().
+
+    Returns:
+        dict | None: created, updates and the meta data stored, None if there is
+                     no snapshot yet.
+    """
+    try:
+        with gzip.open(path, "rb") as f:
+            return json.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        raise ValueError(f"SNAPSHOT-002E {path} is not a missing updates snapshot: {e}")
@@ -1,9 +1,192 @@
+import codecs
+import csv
+import json
+import re
 import sys
-import time
-
-import requests
+from concurrent.futures import ThreadPoolExecutor
 
+from zosapi import cache as K
 from zosapi import client as C
+from zosapi import poll as P
+
+# SYSMODs sent in one software update search request
+SEARCH_CHUNK_SIZE: int = 500
+
+# Missing updates queries of a software instance, the name is used for the
+# URL path as well as for the list in the result
+MISSING_UPDATES: dict = {
+    "critical": "missingcriticalupdates",
+    "fixcat": "missingfixcatupdates",
+}
+
+
+def iter_entries(stream, key: str = "entries", chunk_size: int = 1024 * 1024):
+    """
+    Parse the array key of a JSON document incrementally, so large CSI query
+    results are formatted entry by entry without building the whole document.
+
+    Args:
+        stream (file)......: Binary or text file holding the JSON document.
+        key (str)..........: Name of the array to parse (default "entries").
+        chunk_size (int)...: Bytes read at a time (default 1 MB).
+
+    Yields:
+        dict: The elements of the array.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8")()
+    start = re.compile(r'"' + re.escape(key) + r'"\s*:\s*\[')
+    buffer = ""
+    eof = False
+
+    def read() -> bool:
+        chunk = stream.read(chunk_size)
+        nonlocal buffer
+        if isinstance(chunk, bytes):
+            buffer = buffer + text.decode(chunk, final=chunk == b"")
+        else:
+            buffer = buffer + chunk
+        return len(chunk) > 0
+
+    while (match := start.search(buffer)) is None:
+        if not read():
+            return
+    buffer = buffer[match.end():]
+
+    while True:
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position = position + 1
+            if position < len(buffer) and buffer[position] == "]":
+                return
+            try:
+                element, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                break
+            # A number cut at the end of the chunk may continue in the next one
+            if not eof and buffer[end:end + 1] not in (" ", "\t", "\r", "\n", ",", "]"):
+                break
+            position = end
+            yield element
+        buffer = buffer[position:]
+        if eof:
+            raise ValueError(f"SMS-008E Incomplete JSON array {key}")
+        eof = not read()
+
+
+def instances_url(client: C.CLIENT, pswi: bool = False) -> str:
+    """
+    Build the URL of SMS.list_software_instances(), shared with the
+    asynchronous client.
+
+    Returns:
+        str: The URL of the software or portable software instances.
+    """
+    if pswi:
+        return f"{client.path_to_api}/swmgmt/pswi"
+    return f"{client.path_to_api}/swmgmt/swi"
+
+
+def swi_url(
+    client: C.CLIENT, nickname: str = "", instance: str = "", uuid: str = ""
+) -> tuple[dict, str]:
+    """
+    Build the URL of a software instance.
+
+    Args:
+        client (CLIENT)...: The client the request is sent with.
+        nickname (str)....: System nick name of the software instance.
+        instance (str)....: Name of the software instance.
+        uuid (str)........: UUID of the software instance, used if given.
+
+    Returns:
+        dict: Errors, empty if the URL could be built.
+        str: The URL.
+    """
+    url = f"{client.path_to_api}/swmgmt/swi"
+
+    if uuid != "":
+        return {}, url + f"/{uuid}"
+    if nickname == "" or instance == "":
+        client.log.error(
+            "SMS-004E Nickname and Software Instance Name or UUID are required."
+        )
+        return {
+            "rc": 8,
+            "status_code": "Nickname and Software Instance Name or UUID are required.",
+            "reason": "S02",
+        }, url
+    return {}, url + f"/{nickname}/{instance}"
+
+
+def csiquery_request(
+    client: C.CLIENT,
+    global_name: str,
+    zones: str,
+    entries: str = "",
+    subentries: str = "",
+    filter: str = "",
+) -> tuple[str, str]:
+    """
+    Build the request of SMS.csiquery(), shared with the asynchronous client.
+    The body is also the cache key of the result.
+
+    Returns:
+        str: The URL.
+        str: The JSON request body.
+    """
+    url = f"{client.path_to_api}/swmgmt/csi/csiquery/{global_name}"
+    data = json.dumps(
+        {
+            "zones": zones.split(","),
+            "entries": [entries],
+            "subentries": subentries.split(","),
+            "filter": filter,
+        }
+    )
+    return url, data
+
+
+def missing_updates_requests(
+    client: C.CLIENT, instances: list, updates: tuple = ("critical",)
+) -> tuple[list, list]:
+    """
+    Build the requests of SMS.scan_missing_updates(), shared with the
+    asynchronous client.
+
+    Args:
+        client (CLIENT)...: The client the requests are sent with.
+        instances (list)..: (system nick name, software instance name) tuples.
+        updates (tuple)...: "critical" and/or "fixcat" (default ("critical",)).
+
+    Returns:
+        list: (kind, nick name, name) of each request.
+        list: (url, data) of each request, see SMS.post_and_wait_all().
+    """
+    scans = [(kind, nickname, name) for nickname, name in instances for kind in updates]
+    requests = [
+        (f"{client.path_to_api}/swmgmt/swi/{nickname}/{name}/{MISSING_UPDATES[kind]}", None)
+        for kind, nickname, name in scans
+    ]
+    return scans, requests
+
+
+def missing_updates_results(scans: list, updates: tuple, results: list) -> dict:
+    """
+    Args:
+        scans (list)......: (kind, nick name, name) of each request, see
+                            missing_updates_requests().
+        updates (tuple)...: "critical" and/or "fixcat".
+        results (list)....: The RESULT of each request.
+
+    Returns:
+        dict: One list of RESULTs per kind of updates, in the order of instances.
+    """
+    grouped: dict = {kind: [] for kind in updates}
+    for (kind, _, _), result in zip(scans, results):
+        grouped[kind].append(result)
+    return grouped
 
 
 class SMS(C.CLIENT):
@@ -16,81 +199,148 @@ class SMS(C.CLIENT):
         _type_: _description_
     """
 
-    errors: dict = {}
-    rc: int = 0
-
     def __str__(self) -> str:
         return super().__str__()
 
-    def build_table_string(self, string: str) -> str:
-        string_str: str = "["
-        for word in string.split(","):
-            string_str = string_str + f"'{word}',"
-        string_str = string_str + "],"
-        return string_str
-
-    def sysmod_report(self, response):
-        for entry in response["entries"]:
-            line: str = (
-                entry["entryname"] + "," + entry["entrytype"] + "," + entry["zonename"]
-            )
-            for subentry in entry["subentries"]:
-                for key in subentry:
-                    if key != "VER":
-                        line = line + "," + key + ","
-                        for value in subentry[key]:
-                            line = line + value + ","
-                    else:
-                        if subentry[key]:
-                            line = line + key + "," + subentry[key] + ","
+    def report_entries(self, response):
+        """
+        Args:
+            response (dict | iterable): A parsed CSI query result or its entries,
+                                        e.g. from iter_entries().
 
-            print(line)
+        Returns:
+            iterable: The CSI entries.
+        """
+        if isinstance(response, dict):
+            return response.get("entries") or []
+        return response
 
-    def csv_report(self, response):
-        for entry in response["entries"]:
-            line: str = (
-                entry["entryname"] + ";" + entry["entrytype"] + ";" + entry["zonename"]
-            )
-            for subentry in entry["subentries"]:
-                for key in subentry:
-                    if key != "VER":
-                        line = line + ";" + key + ";"
-                        for value in subentry[key]:
-                            line = line + value + ";"
-                    else:
-                        if subentry[key]:
-                            line = line + key + ";" + subentry[key] + ";"
-
-            print(line)
-
-    def friendly_report(self, response):
-        for entry in response["entries"]:
-            line: str = (
-                entry["entryname"]
-                + " "
-                + entry["entrytype"]
-                + " "
-                + entry["zonename"].ljust(8)
-            )
-            for subentry in entry["subentries"]:
-                for key in subentry:
+    def report_row(self, entry: dict) -> list:
+        """
+        Args:
+            entry (dict): A CSI entry.
+
+        Returns:
+            list: Entry name, type and zone followed by each subentry name and its
+                  values, VER only if it has a value.
+        """
+        row = [entry["entryname"], entry["entrytype"], entry["zonename"]]
+        for subentry in entry.get("subentries") or []:
+            for key, value in subentry.items():
+                if key == "VER" and not value:
+                    continue
+                row.append(key)
+                if isinstance(value, str):
+                    row.append(value)
+                else:
+                    row.extend(value)
+        return row
+
+    def sysmod_report(self, response, out=None, delimiter: str = ",") -> int:
+        """
+        Write CSI entries as delimited lines through the csv module, one entry
+        per line, as they are read.
+
+        Args:
+            response (dict | iterable): A parsed CSI query result or its entries.
+            out (file)..................: Text file to write to (default sys.stdout).
+            delimiter (str).............: Field delimiter (default ",").
+
+        Returns:
+            int: Number of entries written.
+        """
+        writer = csv.writer(out or sys.stdout, delimiter=delimiter, lineterminator="\n")
+        count = 0
+        for entry in self.report_entries(response):
+            writer.writerow(self.report_row(entry))
+            count = count + 1
+        return count
+
+    def csv_report(self, response, out=None) -> int:
+        """
+        Write CSI entries as lines delimited by ";", see sysmod_report().
+        """
+        return self.sysmod_report(response, out=out, delimiter=";")
+
+    def jsonl_report(self, response, out=None) -> int:
+        """
+        Write CSI entries as JSON Lines, one entry per line.
+
+        Args:
+            response (dict | iterable): A parsed CSI query result or its entries.
+            out (file)..................: Text file to write to (default sys.stdout).
+
+        Returns:
+            int: Number of entries written.
+        """
+        out = out or sys.stdout
+        count = 0
+        for entry in self.report_entries(response):
+            out.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            count = count + 1
+        return count
+
+    def friendly_report(self, response, out=None) -> int:
+        """
+        Write CSI entries in fixed-width columns: entry name, entry type and zone
+        name padded to 8, followed by DATASET values or KEY=value pairs.
+
+        Args:
+            response (dict | iterable): A parsed CSI query result or its entries.
+            out (file)..................: Text file to write to (default sys.stdout).
+
+        Returns:
+            int: Number of entries written.
+        """
+        out = out or sys.stdout
+        count = 0
+        for entry in self.report_entries(response):
+            fields = [
+                entry["entryname"].ljust(8),
+                entry["entrytype"].ljust(8),
+                entry["zonename"].ljust(8),
+            ]
+            for subentry in entry.get("subentries") or []:
+                for key, value in subentry.items():
+                    if not value:
+                        continue
+                    if isinstance(value, str):
+                        value = [value]
                     if key == "DATASET":
-                        line = line + " " + key.ljust(8) + " "
-                        for value in subentry[key]:
-                            line = line + value + ";"
+                        fields.append(key.ljust(8) + " " + ";".join(value))
                     else:
-                        if subentry[key]:
-                            line = line + key + "0" + subentry[key] + ";"
+                        fields.append(key + "=" + ";".join(value))
+            out.write(" ".join(fields) + "\n")
+            count = count + 1
+        return count
 
-            print(line)
+    def wait_for_status(self, response, verify: bool = True, stream: bool = False) -> C.RESULT:
+        """
+        Poll the status monitor of an asynchronous software management request.
 
-    def add_software_instance(self, filename: str = "", verify: bool = True):
-        SMS.rc: int = 0
-        SMS.errors = {}
-        st: str = "running"
+        Args:
+            response (Response): The 202 response holding the statusurl.
+            verify (bool)......: Whether or not to verify SSL certificates (default True).
+            stream (bool)......: Leave the final result unread for RESULT.stream,
+                                 see POLLER.wait() (default False).
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
+        Returns:
+            RESULT: The last status response, rc 0 once it is no longer running.
+        """
+        try:
+            statusurl: str = response.json()["statusurl"]
+        except Exception as e:
+            errors = {"rc": 16, "request_error": e}
+            self.log.critical(
+                f"SMS-001S Catched an unexpected exception, can not continue {str(errors)}"
+            )
+            return C.RESULT(16, errors, response)
+
+        return P.POLLER(self).wait(statusurl, verify=verify, stream=stream)
+
+    def add_software_instance(self, filename: str = "", verify: bool = True):
+        rc: int = 0
+        errors: dict = {}
 
         url = f"{self.path_to_api}/swmgmt/swi"
 
@@ -98,74 +348,24 @@ class SMS(C.CLIENT):
             with open(filename, "r") as add_instance:
                 data = add_instance.read()
         else:
-            SMS.rc = 16
+            rc = 16
             self.log.error("SMS-007E File name is required, can not continue")
             response = None
-            SMS.errors = {
-                "rc": SMS.rc,
+            errors = {
+                "rc": rc,
                 "status_code": "File name is required, can not continue",
                 "reason": "S07",
             }
-            return SMS.errors, response
+            return C.RESULT(rc, errors, response)
 
-        try:
-            response = requests.post(
-                url, headers=self.headers, data=data, verify=verify
-            )
-        except Exception as e:
-            SMS.rc = 16
-            SMS.errors = {"rc": SMS.rc, "request_error": e}
-            self.log.critical(
-                f"SMS-001S Catched an unexpected exception, can not continue {str(SMS.errors)}"
-            )
-            sys.exit(SMS.rc)
+        result = self.request("POST", url, expected=(202,), data=data, verify=verify)
+        response = result.response
 
-        if response.status_code != 202:
-            self.log.debug(
-                f"SMS-002E An unexpected statuscode {response.status_code} has been received"
-            )
-            self.log.debug(f"        {response.text}")
-            SMS.rc = 8
-            SMS.errors = {
-                "rc": SMS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-        else:
-            statusurl: str = response.json()["statusurl"]
-            response = requests.get(statusurl, headers=self.headers)
-            if response.status_code == 200:
-                while st == "running":
-                    try:
-                        st = response.json()["status"]
-                    except Exception as e:
-                        SMS.rc = 16
-                        SMS.errors = {"rc": SMS.rc, "request_error": e}
-                        self.log.critical(
-                            f"SMS-001S Catched an unexpected exception, can not continue {str(SMS.errors)}"
-                        )
-                        sys.exit(SMS.rc)
-
-                    if st == "running":
-                        self.log.debug(
-                            f"SMS-000D Collecting query response, please wait, status is {st}"
-                        )
-                        self.log.debug(f"        {response.text}")
-                        time.sleep(0.5)
-                        response = requests.get(statusurl, headers=self.headers)
-            else:
-                self.log.error(
-                    f"SMS-003E An unexpected statuscode {response.status_code} has been received:"
-                )
-                self.log.error(f"        {response.text}")
-                SMS.errors = {
-                    "rc": SMS.rc,
-                    "status_code": response.status_code,
-                    "reason": response.reason,
-                }
-                SMS.rc = 8
+        if result.rc == 0:
+            result = self.wait_for_status(response, verify=verify)
+            response = result.response
 
-        return SMS.errors, response
+        return result
 
     def export_software_instance(
         self,
@@ -175,12 +375,8 @@ class SMS(C.CLIENT):
         uuid: str = "",
         verify: bool = True,
     ):
-        SMS.rc: int = 0
-        SMS.errors = {}
-        st: str = "running"
-
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
+        rc: int = 0
+        errors: dict = {}
 
         url = f"{self.path_to_api}/swmgmt/swi"
 
@@ -189,14 +385,14 @@ class SMS(C.CLIENT):
         elif nick_name != "" and swi_name != "":
             url = url + f"/{nick_name}" + f"/{swi_name}"
         else:
-            SMS.rc = 16
+            rc = 16
             response = None
-            SMS.errors = {
-                "rc": {SMS.rc},
+            errors = {
+                "rc": rc,
                 "status_code": "Either uuid or nick name and instance name must be specified",
                 "reason": "S05",
             }
-            return SMS.errors, response
+            return C.RESULT(rc, errors, response)
 
         url = url + "/export"
 
@@ -204,74 +400,24 @@ class SMS(C.CLIENT):
             with open(filename, "r") as export_instance:
                 data = export_instance.read()
         else:
-            SMS.rc = 16
+            rc = 16
             self.log.error("SMS-007E File name is required, can not continue")
             response = None
-            SMS.errors = {
-                "rc": SMS.rc,
+            errors = {
+                "rc": rc,
                 "status_code": "File name is required, can not continue",
                 "reason": "S07",
             }
-            return SMS.errors, response
+            return C.RESULT(rc, errors, response)
 
-        try:
-            response = requests.post(
-                url, headers=self.headers, data=data, verify=verify
-            )
-        except Exception as e:
-            SMS.rc = 16
-            SMS.errors = {"rc": SMS.rc, "request_error": e}
-            self.log.critical(
-                f"SMS-001S Catched an unexpected exception, can not continue {str(SMS.errors)}"
-            )
-            sys.exit(SMS.rc)
+        result = self.request("POST", url, expected=(202,), data=data, verify=verify)
+        response = result.response
 
-        if response.status_code != 202:
-            self.log.debug(
-                f"SMS-002E An unexpected statuscode {response.status_code} has been received"
-            )
-            self.log.debug(f"        {response.text}")
-            SMS.rc = 8
-            SMS.errors = {
-                "rc": SMS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-        else:
-            statusurl: str = response.json()["statusurl"]
-            response = requests.get(statusurl, headers=self.headers)
-            if response.status_code == 200:
-                while st == "running":
-                    try:
-                        st = response.json()["status"]
-                    except Exception as e:
-                        SMS.rc = 16
-                        SMS.errors = {"rc": SMS.rc, "request_error": e}
-                        self.log.critical(
-                            f"SMS-001S Catched an unexpected exception, can not continue {str(SMS.errors)}"
-                        )
-                        sys.exit(SMS.rc)
-
-                    if st == "running":
-                        self.log.debug(
-                            f"SMS-000D Collecting query response, please wait, status is {st}"
-                        )
-                        self.log.debug(f"        {response.text}")
-                        time.sleep(0.5)
-                        response = requests.get(statusurl, headers=self.headers)
-            else:
-                self.log.error(
-                    f"SMS-003E An unexpected statuscode {response.status_code} has been received:"
-                )
-                self.log.error(f"        {response.text}")
-                SMS.errors = {
-                    "rc": SMS.rc,
-                    "status_code": response.status_code,
-                    "reason": response.reason,
-                }
-                SMS.rc = 8
+        if result.rc == 0:
+            result = self.wait_for_status(response, verify=verify)
+            response = result.response
 
-        return SMS.errors, response
+        return result
 
     def delete_software_instance(
         self,
@@ -280,11 +426,8 @@ class SMS(C.CLIENT):
         uuid: str = "",
         verify: bool = True,
     ):
-        SMS.rc: int = 0
-        SMS.errors = {}
-
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
+        rc: int = 0
+        errors: dict = {}
 
         url = f"{self.path_to_api}/swmgmt/swi"
 
@@ -293,74 +436,27 @@ class SMS(C.CLIENT):
         elif nick_name != "" and swi_name != "":
             url = url + f"/{nick_name}" + f"/{swi_name}"
         else:
-            SMS.rc = 16
+            rc = 16
             response = None
-            SMS.errors = {
-                "rc": {SMS.rc},
+            errors = {
+                "rc": rc,
                 "status_code": "Either uuid or nick name and instance name must be specified",
                 "reason": "S05",
             }
-            return SMS.errors, response
+            return C.RESULT(rc, errors, response)
 
-        try:
-            response = requests.delete(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            SMS.rc = 16
-            SMS.errors = {"rc": SMS.rc, "request_error": e}
-            self.log.critical(
-                f"SMS-001S Catched an unexpected exception, can not continue {str(SMS.errors)}"
-            )
-            sys.exit(SMS.rc)
+        result = self.request("DELETE", url, expected=(200,), verify=verify)
+        response = result.response
 
-        if response.status_code != 200:
-            self.log.debug(
-                f"SMS-002E An unexpected statuscode {response.status_code} has been received"
-            )
-            self.log.debug(f"        {response.text}")
-            SMS.rc = 8
-            SMS.errors = {
-                "rc": SMS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-
-        return SMS.errors, response
+        return result
 
     def list_software_instances(self, pswi: bool = False, verify: bool = True):
-        SMS.rc: int = 0
-        SMS.errors = {}
-
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
 
-        if not pswi:
-            url = f"{self.path_to_api}/swmgmt/swi"
-        else:
-            url = f"{self.path_to_api}/swmgmt/pswi"
+        url = instances_url(self, pswi)
 
-        try:
-            response = requests.get(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            SMS.rc = 16
-            SMS.errors = {"rc": SMS.rc, "request_error": e}
-            self.log.critical(
-                f"SMS-001S Catched an unexpected exception, can not continue {str(SMS.errors)}"
-            )
-            sys.exit(SMS.rc)
-
-        if response.status_code != 200:
-            self.log.debug(
-                f"SMS-002E An unexpected statuscode {response.status_code} has been received"
-            )
-            self.log.debug(f"        {response.text}")
-            SMS.rc = 8
-            SMS.errors = {
-                "rc": SMS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request("GET", url, expected=(200,), verify=verify)
 
-        return SMS.errors, response
+        return result
 
     def get_software_instance_properties(
         self,
@@ -369,11 +465,8 @@ class SMS(C.CLIENT):
         uuid: str = "",
         verify: bool = True,
     ):
-        SMS.rc: int = 0
-        SMS.errors = {}
-
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
+        rc: int = 0
+        errors: dict = {}
 
         url = f"{self.path_to_api}/swmgmt/swi"
 
@@ -382,37 +475,17 @@ class SMS(C.CLIENT):
         elif nick_name != "" and sw_name != "":
             url = url + f"/{nick_name}" + f"/{sw_name}"
         else:
-            SMS.rc = 16
-            SMS.errors = {
-                "rc": {SMS.rc},
+            rc = 16
+            errors = {
+                "rc": rc,
                 "status_code": "Either uuid or nick name and instance name must be specified",
                 "reason": "S05",
             }
-            return SMS.errors, {}
-
-        try:
-            response = requests.get(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            SMS.rc = 16
-            SMS.errors = {"rc": {SMS.rc}, "request_error": {e}}
-            self.log.critical(
-                f"SMS-001S Catched an unexpected exception, can not continue {str(SMS.errors)}"
-            )
-            sys.exit(SMS.rc)
+            return errors, {}
 
-        if response.status_code != 200:
-            self.log.debug(
-                f"SMS-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"        {response.text}")
-            SMS.rc = 8
-            SMS.errors = {
-                "rc": SMS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request("GET", url, expected=(200,), verify=verify)
 
-        return SMS.errors, response
+        return result
 
     def get_software_instance_datasets(
         self,
@@ -421,11 +494,8 @@ class SMS(C.CLIENT):
         uuid: str = "",
         verify: bool = True,
     ):
-        SMS.rc: int = 0
-        SMS.errors = {}
-
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
+        rc: int = 0
+        errors: dict = {}
 
         url = f"{self.path_to_api}/swmgmt/swi"
 
@@ -434,83 +504,41 @@ class SMS(C.CLIENT):
         elif nick_name != "" and sw_name != "":
             url = url + f"/{nick_name}" + f"/{sw_name}/datasets"
         else:
-            SMS.rc = 16
-            SMS.errors = {
-                "rc": SMS.rc,
+            rc = 16
+            errors = {
+                "rc": rc,
                 "status_code": "Either uuid or nick name and instance name must be specified",
                 "reason": "S05",
             }
-            return SMS.errors, {}
+            return errors, {}
 
-        try:
-            response = requests.get(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            SMS.rc = 16
-            SMS.errors = {"rc": SMS.rc, "request_error": e}
-            self.log.critical(
-                f"SMS-001S Catched an unexpected exception, can not continue {str(SMS.errors)}"
-            )
-            sys.exit(SMS.rc)
+        result = self.request("GET", url, expected=(200,), verify=verify)
 
-        if response.status_code != 200:
-            self.log.debug(
-                f"SMS-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"        {response.text}")
-            SMS.rc = 8
-            SMS.errors = {
-                "rc": SMS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-
-        return SMS.errors, response
+        return result
 
     def get_system_uuid(self, nickname: str = "", verify: bool = True):
-        SMS.rc: int = 0
-        SMS.errors: dict = {}
-
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
+        rc: int = 0
+        errors: dict = {}
 
         url = f"{self.path_to_api}/swmgmt/system/uuid"
 
         if nickname != "":
             url = url + f"/{nickname}"
         else:
-            SMS.rc = 8
+            rc = 8
             self.log.error("SMS-004E Nickname required.")
             response = None
-            SMS.errors = {
-                "rc": SMS.rc,
+            errors = {
+                "rc": rc,
                 "status_code": "Nickname required.",
                 "reason": "S01",
             }
-            return SMS.errors, response
-
-        try:
-            response = requests.post(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            SMS.rc = 16
-            SMS.errors = {"rc": SMS.rc, "request_error": e}
-            self.log.critical(
-                f"SMS-001S Catched an unexpected exception, can not continue {str(SMS.errors)}"
-            )
-            sys.exit(SMS.rc)
+            return C.RESULT(rc, errors, response)
 
-        if response.status_code != 200:
-            self.log.debug(
-                f"SMS-002E An unexpected statuscode {response.status_code} has been received"
-            )
-            self.log.debug(f"        {response.text}")
-            SMS.rc = 8
-            SMS.errors = {
-                "rc": SMS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request("POST", url, expected=(200,), verify=verify)
+        response = result.response
 
-        return SMS.errors, response
+        return result
 
     def missing_critical_updates(
         self,
@@ -519,91 +547,20 @@ class SMS(C.CLIENT):
         uuid: str = "",
         verify: bool = True,
     ):
-        SMS.rc: int = 0
-        SMS.errors: dict = {}
-        st: str = "running"
-
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
-        url = f"{self.path_to_api}/swmgmt/swi"
-
-        if uuid == "":
-            if nickname == "" or instance == "":
-                SMS.rc = 8
-                self.log.error(
-                    "SMS-004E Nickname and Software Instance Name or UUID are required."
-                )
-                response = None
-                SMS.errors = {
-                    "rc": SMS.rc,
-                    "status_code": "Nickname and Software Instance Name or UUID are required.",
-                    "reason": "S02",
-                }
-                return SMS.errors, response
-            else:
-                url = url + f"/{nickname}/{instance}"
-        else:
-            url = url + f"/{uuid}"
+        errors, url = swi_url(self, nickname, instance, uuid)
+        if errors:
+            return C.RESULT(errors["rc"], errors)
 
         url = url + "/missingcriticalupdates"
 
-        try:
-            response = requests.post(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            SMS.rc = 16
-            SMS.errors = {"rc": SMS.rc, "request_error": e}
-            self.log.critical(
-                f"SMS-001S Catched an unexpected exception, can not continue {str(SMS.errors)}"
-            )
-            sys.exit(SMS.rc)
+        result = self.request("POST", url, expected=(202,), verify=verify)
+        response = result.response
 
-        if response.status_code != 202:
-            self.log.debug(
-                f"SMS-002E An unexpected statuscode {response.status_code} has been received"
-            )
-            self.log.debug(f"        {response.text}")
-            SMS.rc = 8
-            SMS.errors = {
-                "rc": SMS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-        else:
-            statusurl: str = response.json()["statusurl"]
-            response = requests.get(statusurl, headers=self.headers)
-            if response.status_code == 200:
-                while st == "running":
-                    try:
-                        st = response.json()["status"]
-                    except Exception as e:
-                        SMS.rc = 16
-                        SMS.errors = {"rc": SMS.rc, "request_error": e}
-                        self.log.critical(
-                            f"SMS-001S Catched an unexpected exception, can not continue {str(SMS.errors)}"
-                        )
-                        sys.exit(SMS.rc)
-
-                    if st == "running":
-                        self.log.debug(
-                            f"SMS-000D Collecting query response, please wait, status is {st}"
-                        )
-                        self.log.debug(f"        {response.text}")
-                        time.sleep(0.5)
-                        response = requests.get(statusurl, headers=self.headers)
-            else:
-                self.log.error(
-                    f"SMS-003E An unexpected statuscode {response.status_code} has been received:"
-                )
-                self.log.error(f"        {response.text}")
-                SMS.errors = {
-                    "rc": SMS.rc,
-                    "status_code": response.status_code,
-                    "reason": response.reason,
-                }
-                SMS.rc = 8
+        if result.rc == 0:
+            result = self.wait_for_status(response, verify=verify)
+            response = result.response
 
-        return SMS.errors, response
+        return result
 
     def missing_fixcat_updates(
         self,
@@ -612,194 +569,420 @@ class SMS(C.CLIENT):
         uuid: str = "",
         verify: bool = True,
     ):
-        SMS.rc: int = 0
-        SMS.errors: dict = {}
-        st: str = "running"
+        errors, url = swi_url(self, nickname, instance, uuid)
+        if errors:
+            return C.RESULT(errors["rc"], errors)
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
+        url = url + "/missingfixcatupdates"
 
+        result = self.request("POST", url, expected=(202,), verify=verify)
+        response = result.response
+
+        if result.rc == 0:
+            result = self.wait_for_status(response, verify=verify)
+            response = result.response
+
+        return result
+
+    def post_and_wait_all(
+        self, requests: list, parallel: int | None = None, verify: bool = True
+    ) -> list:
+        """
+        Run many asynchronous software management requests at the same time.
+        Each request is started and its status monitor polled until it ends;
+        at most parallel requests run at any time, the others wait for a slot.
+
+        Args:
+            requests (list)...: (url, data) tuples, data is None for an empty body.
+            parallel (int)....: Requests running at the same time
+                                (default pool_maxsize of the session).
+            verify (bool).....: Whether or not to verify SSL certificates (default True).
+
+        Returns:
+            list: One RESULT per request, in the order of requests.
+        """
+        if requests == []:
+            return []
+        parallel = parallel or self.session.pool_maxsize
+
+        def run(request: tuple) -> C.RESULT:
+            url, data = request
+            result = self.request("POST", url, expected=(202,), data=data, verify=verify)
+            if result.rc == 0:
+                result = self.wait_for_status(result.response, verify=verify)
+            return result
+
+        with ThreadPoolExecutor(max_workers=min(parallel, len(requests))) as executor:
+            return [*executor.map(run, requests)]
+
+    def add_software_instances(
+        self, filenames: list, parallel: int | None = None, verify: bool = True
+    ) -> list:
+        """
+        Add many software instances at the same time, see post_and_wait_all().
+
+        Args:
+            filenames (list)..: The files holding the add request of each instance.
+            parallel (int)....: Instances added at the same time
+                                (default pool_maxsize of the session).
+            verify (bool).....: Whether or not to verify SSL certificates (default True).
+
+        Returns:
+            list: One RESULT per file, in the order of filenames.
+        """
         url = f"{self.path_to_api}/swmgmt/swi"
 
-        if uuid == "":
-            if nickname == "" or instance == "":
-                SMS.rc = 8
-                self.log.error(
-                    "SMS-004E Nickname and Software Instance Name or UUID are required."
-                )
-                response = None
-                SMS.errors = {
-                    "rc": SMS.rc,
-                    "status_code": "Nickname and Software Instance Name or UUID are required.",
-                    "reason": "S02",
-                }
-                return SMS.errors, response
-            else:
-                url = url + f"/{nickname}/{instance}"
-        else:
-            url = url + f"/{uuid}"
+        results: list = [None] * len(filenames)
+        requests: list = []
+        indexes: list = []
+        for index, filename in enumerate(filenames):
+            try:
+                with open(filename, "r") as add_instance:
+                    requests.append((url, add_instance.read()))
+                    indexes.append(index)
+            except OSError as e:
+                self.log.error(f"SMS-009E Unable to read {filename}: {e}")
+                errors = {"rc": 16, "status_code": f"Unable to read {filename}: {e}", "reason": "S07"}
+                results[index] = C.RESULT(16, errors)
+
+        for index, result in zip(
+            indexes, self.post_and_wait_all(requests, parallel=parallel, verify=verify)
+        ):
+            results[index] = result
+        return results
+
+    def export_software_instances(
+        self,
+        filename: str,
+        instances: list,
+        parallel: int | None = None,
+        verify: bool = True,
+    ) -> list:
+        """
+        Export many software instances at the same time, see post_and_wait_all().
 
-        url = url + "/missingfixcatupdates"
+        The export request in filename is used for every instance; {nickname}
+        and {instance} in it are replaced by the system nick name and the name
+        of each instance, so every export gets its own data sets and directory.
+
+        Args:
+            filename (str)....: The file holding the export request.
+            instances (list)..: (system nick name, software instance name) tuples.
+            parallel (int)....: Instances exported at the same time
+                                (default pool_maxsize of the session).
+            verify (bool).....: Whether or not to verify SSL certificates (default True).
 
+        Returns:
+            list: One RESULT per instance, in the order of instances.
+        """
         try:
-            response = requests.post(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            SMS.rc = 16
-            SMS.errors = {"rc": SMS.rc, "request_error": e}
-            self.log.critical(
-                f"SMS-001S Catched an unexpected exception, can not continue {str(SMS.errors)}"
+            with open(filename, "r") as export_instance:
+                data = export_instance.read()
+        except OSError as e:
+            self.log.error(f"SMS-009E Unable to read {filename}: {e}")
+            errors = {"rc": 16, "status_code": f"Unable to read {filename}: {e}", "reason": "S07"}
+            return [C.RESULT(16, errors) for _ in instances]
+
+        requests = [
+            (
+                f"{self.path_to_api}/swmgmt/swi/{nickname}/{name}/export",
+                data.replace("{nickname}", nickname).replace("{instance}", name),
             )
-            sys.exit(SMS.rc)
+            for nickname, name in instances
+        ]
+        return self.post_and_wait_all(requests, parallel=parallel, verify=verify)
 
-        if response.status_code != 202:
-            self.log.debug(
-                f"SMS-002E An unexpected statuscode {response.status_code} has been received"
-            )
-            self.log.debug(f"        {response.text}")
-            SMS.rc = 8
-            SMS.errors = {
-                "rc": SMS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-        else:
-            statusurl: str = response.json()["statusurl"]
-            response = requests.get(statusurl, headers=self.headers)
-            if response.status_code == 200:
-                while st == "running":
-                    try:
-                        st = response.json()["status"]
-                    except Exception as e:
-                        SMS.rc = 16
-                        SMS.errors = {"rc": SMS.rc, "request_error": e}
-                        self.log.critical(
-                            f"SMS-001S Catched an unexpected exception, can not continue {str(SMS.errors)}"
-                        )
-                        sys.exit(SMS.rc)
-
-                    if st == "running":
-                        self.log.debug(
-                            f"SMS-000D Collecting query response, please wait, status is {st}"
-                        )
-                        self.log.debug(f"        {response.text}")
-                        time.sleep(0.5)
-                        response = requests.get(statusurl, headers=self.headers)
-            else:
-                self.log.error(
-                    f"SMS-003E An unexpected statuscode {response.status_code} has been received:"
+    def scan_missing_updates(
+        self,
+        instances: list,
+        updates: tuple = ("critical",),
+        parallel: int | None = None,
+        verify: bool = True,
+    ) -> dict:
+        """
+        Run the missing critical and/or FIXCAT updates queries of many software
+        instances at the same time, see post_and_wait_all(). The queries of all
+        kinds share one pool, so a critical and a FIXCAT scan run side by side.
+
+        Args:
+            instances (list)..: (system nick name, software instance name) tuples.
+            updates (tuple)...: "critical" and/or "fixcat" (default ("critical",)).
+            parallel (int)....: Queries running at the same time
+                                (default pool_maxsize of the session).
+            verify (bool).....: Whether or not to verify SSL certificates (default True).
+
+        Returns:
+            dict: One list of RESULTs per kind of updates, in the order of instances.
+        """
+        scans, requests = missing_updates_requests(self, instances, updates)
+        results = self.post_and_wait_all(requests, parallel=parallel, verify=verify)
+        return missing_updates_results(scans, updates, results)
+
+    def merge_missing_updates(self, instances: list, results: list, updates: str) -> tuple:
+        """
+        Merge the results of scan_missing_updates() into one entry per HOLDDATA
+        item, listing the software instances and target zones it affects.
+
+        Args:
+            instances (list): (system nick name, software instance name) tuples.
+            results (list)..: The RESULTs of scan_missing_updates().
+            updates (str)...: "critical" or "fixcat".
+
+        Returns:
+            list: The merged items, sorted by held SYSMOD or name.
+            list: {"instance": "system/name", "errors": {...}} per failed instance.
+        """
+        key = MISSING_UPDATES[updates]
+        merged: dict = {}
+        failed: list = []
+
+        for (nickname, name), result in zip(instances, results):
+            instance = f"{nickname}/{name}"
+            if result.rc != 0:
+                failed.append({"instance": instance, "errors": {k: str(v) for k, v in result.errors.items()}})
+                continue
+            body = result.body if isinstance(result.body, dict) else {}
+            for update in body.get(key) or []:
+                item_key = (
+                    update.get("name", ""),
+                    update.get("holdclass", ""),
+                    update.get("heldsysmod", ""),
+                    update.get("fmid", ""),
                 )
-                self.log.error(f"        {response.text}")
-                SMS.errors = {
-                    "rc": SMS.rc,
-                    "status_code": response.status_code,
-                    "reason": response.reason,
-                }
-                SMS.rc = 8
+                item = merged.setdefault(
+                    item_key,
+                    {
+                        "updates": updates,
+                        "name": update.get("name", ""),
+                        "holdclass": update.get("holdclass", ""),
+                        "holdsymptom": update.get("holdsymptom", ""),
+                        "heldsysmod": update.get("heldsysmod", ""),
+                        "fmid": update.get("fmid", ""),
+                        "fmiddesc": update.get("fmiddesc", ""),
+                        "fixcats": [],
+                        "resolvers": [],
+                        "instances": [],
+                        "zones": [],
+                    },
+                )
+                for fixcat in update.get("fixcats") or []:
+                    if fixcat not in item["fixcats"]:
+                        item["fixcats"].append(fixcat)
+                for resolver in update.get("resolvers") or []:
+                    if resolver.get("name") not in item["resolvers"]:
+                        item["resolvers"].append(resolver.get("name"))
+                if instance not in item["instances"]:
+                    item["instances"].append(instance)
+                for zone in update.get("tgtzones") or []:
+                    if f"{instance}/{zone}" not in item["zones"]:
+                        item["zones"].append(f"{instance}/{zone}")
+
+        items = sorted(merged.values(), key=lambda item: (item["heldsysmod"], item["name"], item["fmid"]))
+        return items, failed
+
+    def holddata_delta(self, previous: list, current: list) -> tuple:
+        """
+        Compare two missing updates result sets. An item is identified by name,
+        hold class, held SYSMOD and FMID; a target zone it newly affects counts
+        as added, a target zone it no longer affects as resolved.
+
+        Args:
+            previous (list): The items of the earlier result set.
+            current (list).: The items of the later result set.
+
+        Returns:
+            list: The added items, tgtzones holding only the new target zones.
+            list: The resolved items, tgtzones holding only the resolved target zones.
+            int: Number of items unchanged.
+        """
 
-        return SMS.errors, response
+        def index(updates: list) -> dict:
+            items: dict = {}
+            for update in updates:
+                key = (
+                    update.get("name", ""),
+                    update.get("holdclass", ""),
+                    update.get("heldsysmod", ""),
+                    update.get("fmid", ""),
+                )
+                _, zones = items.setdefault(key, (update, set()))
+                zones.update(update.get("tgtzones") or [""])
+            return items
+
+        before = index(previous)
+        after = index(current)
+
+        def changes(one: dict, other: dict) -> list:
+            found: list = []
+            for key, (update, zones) in one.items():
+                changed = zones - other.get(key, (None, set()))[1]
+                if changed:
+                    found.append(dict(update, tgtzones=sorted(zone for zone in changed if zone != "")))
+            return found
+
+        added = changes(after, before)
+        resolved = changes(before, after)
+        unchanged = sum(1 for key, (_, zones) in after.items() if key in before and before[key][1] == zones)
+        return added, resolved, unchanged
 
     def search_software_updates(
         self,
         nickname: str = "",
         instance: str = "",
         uuid: str = "",
-        sysmods: tuple[str, ...] = [],
+        sysmods: tuple[str, ...] = (),
         verify: bool = True,
+        chunk_size: int = SEARCH_CHUNK_SIZE,
+        parallel: int | None = None,
     ):
-        SMS.rc: int = 0
-        SMS.errors: dict = {}
-        st: str = "running"
-
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
+        """
+        Search a software instance for software updates, see search_updates().
 
-        url = f"{self.path_to_api}/swmgmt/swi"
+        Args:
+            nickname (str).....: The system nick name of the software instance.
+            instance (str).....: The name of the software instance.
+            uuid (str).........: The uuid of the software instance, instead of
+                                 nickname and instance.
+            sysmods (tuple)....: The SYSMODs to search for.
+            verify (bool)......: Whether or not to verify SSL certificates (default True).
+            chunk_size (int)...: SYSMODs per request (default SEARCH_CHUNK_SIZE).
+            parallel (int).....: Requests running at the same time
+                                 (default pool_maxsize of the session).
 
+        Returns:
+            RESULT: The merged search result.
+        """
         if uuid == "":
             if nickname == "" or instance == "":
-                SMS.rc = 8
+                rc = 8
                 self.log.error(
                     "SMS-004E Nickname and Software Instance Name or UUID are required."
                 )
                 response = None
-                SMS.errors = {
-                    "rc": SMS.rc,
+                errors = {
+                    "rc": rc,
                     "status_code": "Nickname and Software Instance Name or UUID are required.",
                     "reason": "S02",
                 }
-                return SMS.errors, response
+                return C.RESULT(rc, errors, response)
             else:
-                url = url + f"/{nickname}/{instance}"
+                path = f"{nickname}/{instance}"
         else:
-            url = url + f"/{uuid}"
+            path = uuid
 
-        url = url + "/softwareupdatesearch"
+        return self.search_updates(
+            [path], sysmods, chunk_size=chunk_size, parallel=parallel, verify=verify
+        )[0]
 
-        data = '{ "updates": ['
-        for sysmod in sysmods:
-            data = data + f'"{sysmod}", '
-        data = data + "]}"
+    def search_updates(
+        self,
+        instances: list,
+        sysmods: tuple[str, ...],
+        chunk_size: int = SEARCH_CHUNK_SIZE,
+        parallel: int | None = None,
+        verify: bool = True,
+    ) -> list:
+        """
+        Search software instances for software updates. Long SYSMOD lists are
+        split into requests of chunk_size SYSMODs; the requests of all chunks and
+        instances run at the same time and the chunk results of every instance
+        are merged again.
 
-        self.log.debug(f"SMS-000D Request content is {data}")
+        Args:
+            instances (list)...: The software instances, "nickname/instance" or uuid.
+            sysmods (tuple)....: The SYSMODs to search for.
+            chunk_size (int)...: SYSMODs per request (default SEARCH_CHUNK_SIZE).
+            parallel (int).....: Requests running at the same time
+                                 (default pool_maxsize of the session).
+            verify (bool)......: Whether or not to verify SSL certificates (default True).
 
-        try:
-            response = requests.post(
-                url, headers=self.headers, data=data, verify=verify
+        Returns:
+            list: One RESULT per software instance, in the order of instances.
+        """
+        sysmods = [
+            *dict.fromkeys(
+                sysmod.strip().upper() for sysmod in sysmods if sysmod.strip() != ""
             )
-        except Exception as e:
-            SMS.rc = 16
-            SMS.errors = {"rc": SMS.rc, "request_error": e}
-            self.log.critical(
-                f"SMS-001S Catched an unexpected exception, can not continue {str(SMS.errors)}"
+        ]
+        if sysmods == []:
+            errors = {"rc": 8, "status_code": "At least one SYSMOD is required.", "reason": "S03"}
+            self.log.error("SMS-005E At least one SYSMOD is required.")
+            return [C.RESULT(8, errors) for _ in instances]
+
+        chunk_size = max(1, chunk_size)
+        chunks = [
+            sysmods[start:start + chunk_size]
+            for start in range(0, len(sysmods), chunk_size)
+        ]
+        requests = [
+            (
+                f"{self.path_to_api}/swmgmt/swi/{instance}/softwareupdatesearch",
+                json.dumps({"updates": chunk}),
             )
-            sys.exit(SMS.rc)
+            for instance in instances
+            for chunk in chunks
+        ]
+        self.log.debug(
+            f"SMS-000D Searching {len(sysmods)} SYSMODs in {len(instances)} instances with {len(requests)} requests"
+        )
 
-        if response.status_code != 202:
-            self.log.debug(
-                f"SMS-002E An unexpected statuscode {response.status_code} has been received"
+        results = self.post_and_wait_all(requests, parallel=parallel, verify=verify)
+
+        merged: list = []
+        for index in range(len(instances)):
+            parts = results[index * len(chunks):(index + 1) * len(chunks)]
+            failed = next((part for part in parts if part.rc != 0), None)
+            if failed is not None:
+                merged.append(failed)
+                continue
+            try:
+                body = self.merge_results([part.response.json() for part in parts])
+            except Exception as e:
+                errors = {"rc": 16, "request_error": e}
+                self.log.critical(
+                    f"SMS-001S Catched an unexpected exception, can not continue {str(errors)}"
+                )
+                merged.append(C.RESULT(16, errors, parts[-1].response))
+                continue
+            response = C.build_response(
+                200,
+                json.dumps(body).encode(),
+                {"Content-Type": "application/json"},
+                url=parts[-1].response.url,
+                reason="OK",
             )
-            self.log.debug(f"        {response.text}")
-            SMS.rc = 8
-            SMS.errors = {
-                "rc": SMS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-        else:
-            statusurl: str = response.json()["statusurl"]
-            response = requests.get(statusurl, headers=self.headers)
-            if response.status_code == 200:
-                while st == "running":
-                    try:
-                        st = response.json()["status"]
-                    except Exception as e:
-                        SMS.rc = 16
-                        SMS.errors = {"rc": SMS.rc, "request_error": e}
-                        self.log.critical(
-                            f"SMS-001S Catched an unexpected exception, can not continue {str(SMS.errors)}"
-                        )
-                        sys.exit(SMS.rc)
-
-                    if st == "running":
-                        self.log.debug(
-                            f"SMS-000D Collecting query response, please wait, status is {st}"
-                        )
-                        self.log.debug(f"        {response.text}")
-                        time.sleep(0.5)
-                        response = requests.get(statusurl, headers=self.headers)
-            else:
-                self.log.error(
-                    f"SMS-003E An unexpected statuscode {response.status_code} has been received:"
+            merged.append(
+                C.RESULT(
+                    0,
+                    {},
+                    response,
+                    sum(part.attempts for part in parts),
+                    max(part.elapsed for part in parts),
                 )
-                self.log.error(f"        {response.text}")
-                SMS.errors = {
-                    "rc": SMS.rc,
-                    "status_code": response.status_code,
-                    "reason": response.reason,
-                }
-                SMS.rc = 8
+            )
+        return merged
 
-        return SMS.errors, response
+    def merge_results(self, bodies: list) -> dict:
+        """
+        Merge the results of requests that each handled a part of a list: lists
+        are concatenated, every other value is taken from the first result.
+
+        Args:
+            bodies (list): The parsed results.
+
+        Returns:
+            dict: The merged result.
+        """
+        merged: dict = {}
+        for body in bodies:
+            if not isinstance(body, dict):
+                continue
+            for key, value in body.items():
+                if key not in merged:
+                    merged[key] = [*value] if isinstance(value, list) else value
+                elif isinstance(value, list) and isinstance(merged[key], list):
+                    merged[key].extend(value)
+        return merged
 
     def csiquery(
         self,
@@ -809,6 +992,8 @@ class SMS(C.CLIENT):
         subentries: str = "",
         filter: str = "",
         verify: bool = False,
+        cache: K.CACHE | None = None,
+        refresh: bool = False,
     ):
         """_Querying an SMP/E CSI data set.
         This is an asynchronous operation. Therefore, on completion of the initial POST request,
@@ -824,97 +1009,32 @@ class SMS(C.CLIENT):
             subentries (str, optional): _List of subentries_. Defaults to '*'.
             filter (str, optional): _Some filter criteria for the query_. Defaults to ''.
             verify (bool, optional): _certificate verification on/off_. Defaults to False.
+            cache (CACHE, optional): _Cache for completed query results_. Defaults to None.
+            refresh (bool, optional): _Query z/OSMF even if the result is cached_. Defaults to False.
 
         Returns:
-            dict | list: _errors and query response_
-        """
-
-        SMS.rc: int = 0
-        SMS.errors: dict = {}
-        st: str = "running"
-
-        zone_str: str = self.build_table_string(zones)
-
-        subentry_str: str = "["
-        for subentry in subentries.split(","):
-            subentry_str = subentry_str + f"'{subentry}', "
-        subentry_str = subentry_str + "],"
-
-        data = (
-            "{'zones': "
-            + zone_str
-            + f"'entries': ['{
-            entries}'],'subentries': "
-            + subentry_str
-            + "'filter': "
-            + '"'
-            + filter
-            + '"}'
-        )
+            RESULT: _errors and query response, the entries are read from RESULT.stream as they arrive_
+        """
+        url, data = csiquery_request(self, global_name, zones, entries, subentries, filter)
+        key = [self.hostname, self.port, global_name, data]
+
+        if cache is not None and not refresh:
+            content = cache.get(key)
+            if content is not None:
+                self.log.debug(f"SMS-000D CSI query result taken from cache {cache.path(key)}")
+                response = C.build_response(
+                    200, content, {"Content-Type": "application/json"}, url=url, reason="OK"
+                )
+                return C.RESULT(0, {}, response)
 
         self.log.debug(f"SMS-000D Request Bodey Data is {data}")
 
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
-        url = f"{self.path_to_api}/swmgmt/csi/csiquery/{global_name}"
+        result = self.request("POST", url, expected=(202,), data=data, verify=verify)
 
-        try:
-            response = requests.post(
-                url, headers=self.headers, data=data, verify=verify
-            )
-        except Exception as e:
-            SMS.rc = 16
-            SMS.errors = {"rc": SMS.rc, "request_error": e}
-            self.log.critical(
-                f"SMS-001S Catched an unexpected exception, can not continue {str(SMS.errors)}"
-            )
-            sys.exit(SMS.rc)
+        if result.rc == 0:
+            result = self.wait_for_status(result.response, verify=verify, stream=True)
 
-        if response.status_code == 202:
-            statusurl: str = response.json()["statusurl"]
-            response = requests.get(statusurl, headers=self.headers)
-            if response.status_code == 200:
-                while st == "running":
-                    try:
-                        st = response.json()["status"]
-                    except Exception as e:
-                        SMS.rc = 16
-                        SMS.errors = {"rc": SMS.rc, "request_error": e}
-                        self.log.critical(
-                            f"SMS-001S Catched an unexpected exception, can not continue {str(SMS.errors)}"
-                        )
-                        sys.exit(SMS.rc)
-
-                    if st == "running":
-                        self.log.debug(
-                            f"SMS-000D Collecting query response, please wait, status is {st}"
-                        )
-                        self.log.debug(f"        {response.text}")
-                        time.sleep(0.5)
-                        response = requests.get(statusurl, headers=self.headers)
-            else:
-                self.log.error(
-                    f"SMS-003E An unexpected statuscode {response.status_code} has been received:"
-                )
-                self.log.error(f"        {response.text}")
-                SMS.errors = {
-                    "rc": SMS.rc,
-                    "status_code": response.status_code,
-                    "reason": response.reason,
-                }
-                SMS.rc = 8
-
-        else:
-            self.log.debug(
-                f"SMS-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"        {response.text}")
-            SMS.errors = {
-                "rc": SMS.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
-            SMS.rc = 8
+        if cache is not None and result.rc == 0 and result.stream.value("status") == "complete":
+            cache.put(key, result.stream.content())
 
-        return SMS.errors, response
+        return result
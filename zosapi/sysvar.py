@@ -1,14 +1,7 @@
-import sys
-
-import requests
-
 from zosapi import client as C
 
 
 class SYSVAR(C.CLIENT):
-    errors: dict = {}
-    rc: int = 0
-
     def get_system_variables(
         self, sysplex_name: str, system_name: str, verify: bool = True
     ):
@@ -29,29 +22,7 @@ class SYSVAR(C.CLIENT):
         url = (
             f"{self.path_to_api}/variables/rest/{version}/systems/local?source=variable"
         )
-        if not verify:
-            requests.packages.urllib3.disable_warnings()
-
-        try:
-            response = requests.get(url, headers=self.headers, verify=verify)
-        except Exception as e:
-            SYSVAR.rc = 16
-            SYSVAR.errors = {"rc": SYSVAR.rc, "request_error": e}
-            self.log.critical(
-                f"SYSVAR-001S Catched an unexpected exception, can not continue {str(SYSVAR.errors)}"
-            )
-            sys.exit(SYSVAR.rc)
 
-        if response.status_code != 200:
-            self.log.debug(
-                f"SYSVAR-002E An unexpected statuscode {response.status_code} has been received:"
-            )
-            self.log.debug(f"           {response.text}")
-            SYSVAR.rc = 8
-            SYSVAR.errors = {
-                "rc": SYSVAR.rc,
-                "status_code": response.status_code,
-                "reason": response.reason,
-            }
+        result = self.request("GET", url, expected=(200,), verify=verify)
 
-        return SYSVAR.errors, response
+        return result